@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from uuid import UUID
 
 from app.db.session import get_db
-from app.models import Match, Tournament, User
+from app.models import JobStatus, Match, ScheduleJob, Tournament, User
 from app.api import deps
 from app.schemas.schemas import (
     Match as MatchSchema,
@@ -13,14 +14,20 @@ from app.schemas.schemas import (
     MatchUpdate,
     MessageResponse,
     ScheduleGenerateRequest,
-    ScheduleGenerateResponse
+    ScheduleJob as ScheduleJobSchema
 )
-from app.services.scheduler import generate_tournament_schedule
+from app.services.engines import resolve_engine
+from app.services.jobs import cancel_job, enqueue_schedule_job, iter_job_events, request_job_stop
+from app.services.scheduler_bracket import advance_bracket
 
 router = APIRouter()
 
 
-@router.post("/{tournament_id}/generate-schedule", response_model=ScheduleGenerateResponse)
+@router.post(
+    "/{tournament_id}/generate-schedule",
+    response_model=ScheduleJobSchema,
+    status_code=status.HTTP_202_ACCEPTED
+)
 def generate_schedule(
     tournament_id: UUID,
     request: Optional[ScheduleGenerateRequest] = None,
@@ -30,6 +37,7 @@ def generate_schedule(
     """
     Generate AI-powered schedule for the tournament.
     This is the core feature - uses constraint programming to create conflict-free schedules.
+    The solve runs on a worker: this returns the queued job at once, poll GET /jobs/{job_id} for the result.
     """
     # Check if tournament exists
     tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
@@ -38,33 +46,113 @@ def generate_schedule(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tournament not found"
         )
-    
+    # The requested engine, or the tournament's settings.engine, must exist and suit the format
     try:
-        result = generate_tournament_schedule(db, str(tournament_id), request)
-        
-        if result["success"]:
-            return ScheduleGenerateResponse(
-                success=True,
-                message=result["message"],
-                matches_scheduled=result["matches_scheduled"],
-                schedule_summary={
-                    "total_matches": result["matches_scheduled"],
-                    "status": result.get("status", "completed")
-                }
-            )
-        else:
-            return ScheduleGenerateResponse(
-                success=False,
-                message=result["message"],
-                matches_scheduled=0,
-                conflicts=result.get("conflicts", [])
-            )
+        resolve_engine(request.engine if request else None, tournament.format, tournament.settings)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
     
+    try:
+        return enqueue_schedule_job(db, tournament_id, request)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate schedule: {str(e)}"
+            detail=f"Failed to enqueue schedule generation: {str(e)}"
+        )
+
+
+@router.get("/jobs/{job_id}", response_model=ScheduleJobSchema)
+def get_schedule_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.get_current_user)
+):
+    """Get the status, progress and (once completed) result of a schedule generation job."""
+    job = db.query(ScheduleJob).filter(ScheduleJob.id == job_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Schedule job not found"
         )
+    
+    return job
+
+
+@router.get("/jobs/{job_id}/events")
+def stream_schedule_job(
+    job_id: UUID,
+    cancel_on_disconnect: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.get_current_user)
+):
+    """
+    Stream a schedule generation job as Server-Sent Events.
+    "progress" events carry each improving solution (objective, best bound, elapsed seconds);
+    a final "done" event carries the finished job.
+    With cancel_on_disconnect (admins only, like DELETE /jobs/{id}), closing the stream early cancels the job.
+    """
+    if cancel_on_disconnect:
+        deps.get_current_admin(current_user)
+    
+    job = db.query(ScheduleJob).filter(ScheduleJob.id == job_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Schedule job not found"
+        )
+    
+    return StreamingResponse(
+        iter_job_events(job_id, cancel_on_disconnect=cancel_on_disconnect),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/jobs/{job_id}/accept", response_model=ScheduleJobSchema)
+def accept_schedule_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.get_current_admin)
+):
+    """Accept the best schedule found so far: the solver stops and saves it."""
+    job = db.query(ScheduleJob).filter(ScheduleJob.id == job_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Schedule job not found"
+        )
+    if job.status not in (JobStatus.QUEUED, JobStatus.RUNNING):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Schedule job already {job.status.value}"
+        )
+    
+    return request_job_stop(db, job)
+
+
+@router.delete("/jobs/{job_id}", response_model=ScheduleJobSchema)
+def cancel_schedule_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(deps.get_current_admin)
+):
+    """Cancel a schedule generation job: the solver stops and nothing is saved."""
+    job = db.query(ScheduleJob).filter(ScheduleJob.id == job_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Schedule job not found"
+        )
+    if job.status not in (JobStatus.QUEUED, JobStatus.RUNNING):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Schedule job already {job.status.value}"
+        )
+    
+    return cancel_job(db, job)
 
 
 @router.get("/{tournament_id}/matches", response_model=List[MatchWithDetails])
@@ -136,7 +224,10 @@ def update_match(
     db: Session = Depends(get_db),
     current_user: User = Depends(deps.get_current_admin)
 ):
-    """Update a match (reschedule, update status, record results, etc.)."""
+    """
+    Update a match (reschedule, update status, record results, etc.).
+    Recording a knockout winner advances it into the next round of the bracket.
+    """
     db_match = db.query(Match).filter(Match.id == match_id).first()
     if not db_match:
         raise HTTPException(
@@ -148,6 +239,16 @@ def update_match(
     for field, value in update_data.items():
         setattr(db_match, field, value)
     
+    if update_data.get("winner_id"):
+        try:
+            advance_bracket(db, db_match)
+        except ValueError as e:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+    
     db.commit()
     db.refresh(db_match)
     return db_match
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from app.db.session import get_db
@@ -12,10 +12,22 @@ from app.schemas.schemas import (
     VenueUpdate,
     MessageResponse
 )
+from app.services.venue_availability import parse_availability_rules
 
 router = APIRouter()
 
 
+def _check_available_slots(rules: Optional[List[Dict[str, Any]]]) -> None:
+    """Reject availability rules the scheduler could not parse."""
+    try:
+        parse_availability_rules(rules)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid available_slots: {str(e)}"
+        )
+
+
 @router.post("/{tournament_id}/venues", response_model=VenueSchema, status_code=status.HTTP_201_CREATED)
 def create_venue(
     tournament_id: UUID,
@@ -24,6 +36,7 @@ def create_venue(
     current_user: User = Depends(deps.get_current_admin)
 ):
     """Create a new venue in a tournament."""
+    _check_available_slots(venue.available_slots)
     # Check if tournament exists
     tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
     if not tournament:
@@ -82,6 +95,7 @@ def update_venue(
         )
     
     update_data = venue_update.dict(exclude_unset=True)
+    _check_available_slots(update_data.get("available_slots"))
     for field, value in update_data.items():
         setattr(db_venue, field, value)
     
@@ -0,0 +1,16 @@
+from celery import Celery
+from app.core.config import settings
+
+# Start a worker with: celery -A app.core.celery_app worker --loglevel=info
+celery_app = Celery(
+    "cricket_scheduler",
+    broker=settings.CELERY_BROKER_URL or settings.REDIS_URL,
+    include=["app.services.jobs"]
+)
+
+celery_app.conf.update(
+    task_always_eager=settings.CELERY_TASK_ALWAYS_EAGER,
+    task_ignore_result=True,  # Job state lives in the schedule_jobs table
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,  # Solves are long; don't let one worker hoard queued jobs
+)
@@ -16,6 +16,14 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
     
+    # Celery (schedule generation jobs)
+    CELERY_BROKER_URL: str = ""  # Empty = use REDIS_URL
+    CELERY_TASK_ALWAYS_EAGER: bool = False  # Run jobs in-process, without a broker or worker
+    
+    # Schedule result cache (unchanged inputs skip the solve)
+    SCHEDULE_CACHE_BACKEND: str = "memory"  # "memory" (per process), "redis" (REDIS_URL) or "none"
+    SCHEDULE_CACHE_MAX_ENTRIES: int = 128
+    
     # Security
     SECRET_KEY: str = "your-secret-key-change-this-in-production-please"
     ALGORITHM: str = "HS256"
@@ -25,6 +33,14 @@ class Settings(BaseSettings):
     DEFAULT_MATCH_DURATION_HOURS: int = 4
     MIN_REST_HOURS_BETWEEN_MATCHES: int = 24
     DEFAULT_SLOTS_PER_DAY: int = 3
+    SCHEDULER_DEFAULT_ENGINE: str = "boolean"  # Engine for requests and tournaments that do not name one
+    
+    # CP-SAT Solver Profile (overridable per request)
+    SOLVER_NUM_WORKERS: int = 0  # 0 = one worker per CPU core
+    SOLVER_LINEARIZATION_LEVEL: int = 1
+    SOLVER_RANDOM_SEED: int = 0
+    SOLVER_MAX_TIME_SECONDS: float = 30.0
+    SOLVER_LNS_MIN_TEAMS: int = 20  # Leagues this big improve their first schedule with large-neighbourhood search
     
     @property
     def cors_origins(self) -> List[str]:
@@ -1,7 +1,8 @@
-from app.models.base import Base, TournamentFormat, MatchStatus, TournamentStatus
+from app.models.base import Base, TournamentFormat, MatchStatus, TournamentStatus, JobStatus
 from app.models.tournament import Tournament
 from app.models.team import Team
 from app.models.venue import Venue
 from app.models.match import Match
 from app.models.constraint import SchedulingConstraint
+from app.models.schedule_job import ScheduleJob
 from app.models.user import User, UserRole
@@ -6,6 +6,7 @@ class TournamentFormat(str, enum.Enum):
     KNOCKOUT = "knockout"
     LEAGUE = "league"
     DOUBLE_ROUND_ROBIN = "double_round_robin"
+    GROUPS = "groups"
 
 class MatchStatus(str, enum.Enum):
     SCHEDULED = "scheduled"
@@ -20,3 +21,10 @@ class TournamentStatus(str, enum.Enum):
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
     CANCELLED = "cancelled"
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
@@ -12,7 +12,9 @@ class SchedulingConstraint(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     tournament_id = Column(UUID(as_uuid=True), ForeignKey("tournaments.id", ondelete="CASCADE"), nullable=False)
     
-    constraint_type = Column(String(50), nullable=False)  # 'rest_period', 'venue_preference', 'time_slot', etc.
+    # See app.services.constraint_compiler: 'blackout_date', 'time_slot', 'team_unavailable',
+    # 'venue_preference', 'max_matches_per_day' or 'rest_period'; other types are skipped when scheduling
+    constraint_type = Column(String(50), nullable=False)
     priority = Column(Integer, default=5)  # 1 (hard constraint) to 10 (soft/optional)
     
     # Constraint parameters stored as JSON
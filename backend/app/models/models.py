@@ -13,6 +13,7 @@ class TournamentFormat(str, enum.Enum):
     KNOCKOUT = "knockout"
     LEAGUE = "league"
     DOUBLE_ROUND_ROBIN = "double_round_robin"
+    GROUPS = "groups"
 
 
 class MatchStatus(str, enum.Enum):
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Enum, JSON, Text, Boolean
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from datetime import datetime
+import uuid
+
+from app.models.base import Base, JobStatus
+
+class ScheduleJob(Base):
+    __tablename__ = "schedule_jobs"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    tournament_id = Column(UUID(as_uuid=True), ForeignKey("tournaments.id", ondelete="CASCADE"), nullable=False)
+    status = Column(Enum(JobStatus), default=JobStatus.QUEUED, nullable=False)
+    
+    # ScheduleGenerateRequest the job was enqueued with
+    request = Column(JSON, nullable=True)
+    # Written by the worker while it runs, e.g. {"phase": "solving", "solutions": 3, "objective": 14.0}
+    progress = Column(JSON, default={})
+    # Set by the client to accept the best solution so far and stop the search
+    stop_requested = Column(Boolean, default=False, nullable=False)
+    # Set by DELETE /jobs/{id}: stop the search and discard its result
+    cancel_requested = Column(Boolean, default=False, nullable=False)
+    # ScheduleGenerateResponse once the solve has finished
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    
+    # Relationships
+    tournament = relationship("Tournament", back_populates="schedule_jobs")
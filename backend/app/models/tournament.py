@@ -35,3 +35,4 @@ class Tournament(Base):
     venues = relationship("Venue", back_populates="tournament", cascade="all, delete-orphan")
     matches = relationship("Match", back_populates="tournament", cascade="all, delete-orphan")
     constraints = relationship("SchedulingConstraint", back_populates="tournament", cascade="all, delete-orphan")
+    schedule_jobs = relationship("ScheduleJob", back_populates="tournament", cascade="all, delete-orphan")
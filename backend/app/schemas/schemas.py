@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 from uuid import UUID
 from enum import Enum
@@ -11,6 +11,7 @@ class TournamentFormatEnum(str, Enum):
     KNOCKOUT = "knockout"
     LEAGUE = "league"
     DOUBLE_ROUND_ROBIN = "double_round_robin"
+    GROUPS = "groups"
 
 
 class TournamentStatusEnum(str, Enum):
@@ -29,6 +30,14 @@ class MatchStatusEnum(str, Enum):
     POSTPONED = "postponed"
 
 
+class JobStatusEnum(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
 # Base Schemas
 class TeamBase(BaseModel):
     name: str = Field(..., min_length=2, max_length=255)
@@ -63,6 +72,7 @@ class VenueBase(BaseModel):
     latitude: Optional[float] = Field(None, ge=-90, le=90)
     longitude: Optional[float] = Field(None, ge=-180, le=180)
     address: Optional[str] = None
+    # Availability rules: date(s), start_date/end_date, weekdays, start_hour/end_hour, available
     available_slots: Optional[List[Dict[str, Any]]] = []
 
 
@@ -83,6 +93,8 @@ class VenueUpdate(BaseModel):
 class Venue(VenueBase):
     id: UUID
     tournament_id: UUID
+    # Returned as stored: rows written before the rules were validated may hold other shapes
+    available_slots: Optional[Any] = []
     created_at: datetime
     
     class Config:
@@ -91,8 +103,8 @@ class Venue(VenueBase):
 
 # Match Schemas
 class MatchBase(BaseModel):
-    team1_id: UUID
-    team2_id: UUID
+    team1_id: Optional[UUID] = None  # None in a knockout bracket until the feeding match has a winner
+    team2_id: Optional[UUID] = None
     venue_id: Optional[UUID] = None
     scheduled_start: Optional[datetime] = None
     scheduled_end: Optional[datetime] = None
@@ -103,6 +115,9 @@ class MatchBase(BaseModel):
 
 
 class MatchCreate(MatchBase):
+    team1_id: UUID
+    team2_id: UUID
+    
     @validator('team2_id')
     def teams_must_be_different(cls, v, values):
         if 'team1_id' in values and v == values['team1_id']:
@@ -119,6 +134,8 @@ class MatchUpdate(BaseModel):
     match_number: Optional[int] = None
     round: Optional[str] = None
     status: Optional[MatchStatusEnum] = None
+    actual_start: Optional[datetime] = None
+    actual_end: Optional[datetime] = None  # A knockout match that ends late pushes the next round back
     team1_score: Optional[str] = None
     team2_score: Optional[str] = None
     winner_id: Optional[UUID] = None
@@ -128,6 +145,10 @@ class MatchUpdate(BaseModel):
 class Match(MatchBase):
     id: UUID
     tournament_id: UUID
+    team1_source_match_id: Optional[UUID] = None  # Knockout bracket: the match whose winner takes this side
+    team2_source_match_id: Optional[UUID] = None
+    team1_placeholder: Optional[str] = None  # e.g. "Winner of Quarter Final 1"
+    team2_placeholder: Optional[str] = None
     actual_start: Optional[datetime] = None
     actual_end: Optional[datetime] = None
     winner_id: Optional[UUID] = None
@@ -206,11 +227,36 @@ class TournamentWithDetails(Tournament):
 
 
 # Schedule Generation Request
+class SolverProfile(BaseModel):
+    """CP-SAT parameters; unset fields fall back to the SOLVER_* settings."""
+    num_workers: Optional[int] = Field(None, ge=0, le=64)  # 0 = one worker per CPU core
+    linearization_level: Optional[int] = Field(None, ge=0, le=2)
+    random_seed: Optional[int] = Field(None, ge=0)
+    max_time_in_seconds: Optional[float] = Field(None, gt=0, le=600)
+
+
 class ScheduleGenerateRequest(BaseModel):
     tournament_id: UUID
-    optimize_for: Optional[str] = "balanced"  # "balanced", "minimize_travel", "fairness"
+    optimize_for: Optional[Literal["balanced", "minimize_travel", "fairness"]] = "balanced"
     allow_back_to_back: bool = False
     preferred_start_hour: int = Field(default=10, ge=0, le=23)
+    # Scheduling engine (checked against the engine registry when the job is enqueued):
+    # "boolean" (match × slot × venue), "interval" (CP-SAT intervals), "rounds" (circle method),
+    # "heuristic" (greedy + local search), "bracket" (knockout tree), "simplified" (first feasible
+    # boolean schedule); None = the tournament's settings.engine, else SCHEDULER_DEFAULT_ENGINE
+    engine: Optional[str] = None
+    objective: Optional[Literal["last_slot", "match_days"]] = None  # None = first feasible schedule
+    mirror_scheme: Optional[Literal["mirror", "french", "english"]] = None  # Rounds engine, double round robin
+    solver_profile: Optional[SolverProfile] = None
+    warm_start: bool = True  # Hint the solver with the currently saved fixtures
+    minimize_moves: bool = False  # Penalize every saved fixture that changes slot or venue
+    incremental: bool = False  # Keep completed/in-progress matches, re-solve only scheduled/postponed ones
+    reschedule_from: Optional[datetime] = None  # Incremental mode: earliest start for re-solved matches (default now)
+    horizon_weeks: Optional[int] = Field(None, ge=1, le=26)  # Rolling horizon (boolean engine): solve this many weeks at a time, committing each window
+    lns: Optional[bool] = None  # Large-neighbourhood search after the first schedule (boolean engine, needs an objective); None = on for SOLVER_LNS_MIN_TEAMS+ teams
+    # "fast" (2 s, 5% gap), "balanced" (10 s, 1% gap) or "optimal" (120 s, proven optimum);
+    # solver_profile.max_time_in_seconds wins
+    latency_budget: Optional[Literal["fast", "balanced", "optimal"]] = None
 
 
 class ScheduleGenerateResponse(BaseModel):
@@ -220,6 +266,27 @@ class ScheduleGenerateResponse(BaseModel):
     conflicts: List[str] = []
     warnings: List[str] = []
     schedule_summary: Optional[Dict[str, Any]] = None
+    solver_stats: Optional[Dict[str, Any]] = None
+    solution_log: List[Dict[str, Any]] = []  # One entry per improving solution: objective, bound, elapsed
+    feasibility: Optional[Dict[str, Any]] = None  # Pre-solve proof: reasons, extra_days_needed, extra_venues_needed
+
+
+# Schedule Generation Jobs
+class ScheduleJob(BaseModel):
+    id: UUID
+    tournament_id: UUID
+    status: JobStatusEnum
+    progress: Dict[str, Any] = {}
+    stop_requested: bool = False
+    cancel_requested: bool = False
+    result: Optional[ScheduleGenerateResponse] = None  # Set once the job has finished
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
 
 
 # Generic Response
@@ -0,0 +1,92 @@
+"""
+KNOCKOUT BRACKET - Seeded single-elimination trees with byes.
+The field is padded to the next power of two and the top seeds take the byes,
+entering in the second round. Seeds are placed so that 1 and 2 can only meet in
+the final, 1-4 only in the semi finals, and so on. A match whose participant is
+not known yet names the match it comes from instead ("Winner of Quarter Final 1")
+until bracket advance fills in the winner.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+# tournament.settings key: team codes in seed order; teams left out follow in team order
+SEEDS_SETTING = "seeds"
+
+
+def seed_order(size: int) -> List[int]:
+    """0-based seeds in bracket line order, e.g. [0, 7, 3, 4, 1, 6, 2, 5] for 8 lines."""
+    order = [0]
+    while len(order) < size:
+        lines = 2 * len(order)
+        order = [seed for top in order for seed in (top, lines - 1 - top)]
+    return order
+
+
+def round_label(participants: int, number: int, matches_in_round: int) -> str:
+    """Name of a match in a round that starts with the given number of participants."""
+    if participants == 2:
+        return "Final"
+    name = {4: "Semi Final", 8: "Quarter Final"}.get(participants)
+    if name is None:
+        return f"Round of {participants} Match {number}"
+    return f"{name} {number}" if matches_in_round > 1 else name
+
+
+def seeded_teams(team_codes: Sequence[str], seeds: Optional[List[str]] = None) -> List[int]:
+    """Team indices in seed order: the listed codes first, then the remaining teams in team order."""
+    team_index = {code: t for t, code in enumerate(team_codes)}
+    ordered = []
+    for code in seeds or []:
+        t = team_index.get(code)
+        if t is None:
+            raise ValueError(f"Seeds list unknown team code: {code}")
+        if t in ordered:
+            raise ValueError(f"Team {code} is seeded twice")
+        ordered.append(t)
+    return ordered + [t for t in range(len(team_codes)) if t not in ordered]
+
+
+def build_bracket(seeded: List[int]) -> List[Dict]:
+    """
+    Matches of the bracket, round by round (every match after the ones feeding it):
+      label    "Quarter Final 2", "Final", ...
+      round    0-based round the match is played in
+      teams    [team index or None] * 2, None while the participant is a winner still to come
+      sources  [match index or None] * 2, the match whose winner takes that side
+    """
+    num_teams = len(seeded)
+    if num_teams < 2:
+        raise ValueError("A knockout bracket needs at least 2 teams")
+    size = 1 << (num_teams - 1).bit_length()
+    # A line holds a team or, after round one, the match it is decided in
+    lines = [("team", seeded[seed]) if seed < num_teams else None for seed in seed_order(size)]
+
+    matches: List[Dict] = []
+    round_index = 0
+    while len(lines) > 1:
+        pairs = [(lines[i], lines[i + 1]) for i in range(0, len(lines), 2)]
+        played = [pair for pair in pairs if pair[0] is not None and pair[1] is not None]
+        next_lines = []
+        number = 0
+        for first, second in pairs:
+            if first is None or second is None:
+                # Bye: the seed goes straight through
+                next_lines.append(first or second)
+                continue
+            number += 1
+            sides = (first, second)
+            matches.append({
+                "label": round_label(len(lines), number, len(played)),
+                "round": round_index,
+                "teams": [value if kind == "team" else None for kind, value in sides],
+                "sources": [value if kind == "match" else None for kind, value in sides],
+            })
+            next_lines.append(("match", len(matches) - 1))
+        lines = next_lines
+        round_index += 1
+    return matches
+
+
+def placeholder(matches: List[Dict], source: int) -> str:
+    """Participant name for the winner of matches[source]."""
+    return f"Winner of {matches[source]['label']}"
@@ -0,0 +1,106 @@
+"""
+CANCELLATION REGISTRY - Cooperative stop/cancel for running schedule solves.
+Every solve started for a job registers a CancellationToken under the job id;
+the solver registers CpSolver.StopSearch as a stop hook on it. Cancelling
+discards the result, requesting a stop keeps the best solution found so far.
+The registry is per process: workers bridge the API's requests to it through
+the schedule_jobs row (see app.services.jobs).
+"""
+
+from typing import Callable, Dict, List, Optional
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class CancellationToken:
+    """Stop signal for one running solve."""
+
+    def __init__(self, key: str, tournament_id: Optional[str] = None):
+        self.key = key
+        self.tournament_id = tournament_id
+        self.cancelled = False
+        self.stop_requested = False
+        self._hooks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def add_stop_hook(self, hook: Callable[[], None]) -> None:
+        """Call hook when the solve should stop; at once if it already should."""
+        with self._lock:
+            self._hooks.append(hook)
+            fire = self.cancelled or self.stop_requested
+        if fire:
+            hook()
+
+    def remove_stop_hook(self, hook: Callable[[], None]) -> None:
+        with self._lock:
+            if hook in self._hooks:
+                self._hooks.remove(hook)
+
+    def request_stop(self) -> None:
+        """Stop searching and keep the best solution found so far."""
+        with self._lock:
+            self.stop_requested = True
+            hooks = list(self._hooks)
+        for hook in hooks:
+            hook()
+
+    def cancel(self) -> None:
+        """Stop searching and throw the result away."""
+        with self._lock:
+            self.cancelled = True
+            hooks = list(self._hooks)
+        for hook in hooks:
+            hook()
+
+    def should_stop(self) -> bool:
+        return self.cancelled or self.stop_requested
+
+
+class CancellationRegistry:
+    """Tokens of the solves running in this process, keyed by job id."""
+
+    def __init__(self):
+        self._tokens: Dict[str, CancellationToken] = {}
+        self._lock = threading.Lock()
+
+    def register(self, key: str, tournament_id: Optional[str] = None) -> CancellationToken:
+        token = CancellationToken(key, tournament_id)
+        with self._lock:
+            self._tokens[key] = token
+        return token
+
+    def unregister(self, key: str) -> None:
+        with self._lock:
+            self._tokens.pop(key, None)
+
+    def get(self, key: str) -> Optional[CancellationToken]:
+        with self._lock:
+            return self._tokens.get(key)
+
+    def cancel(self, key: str) -> bool:
+        """Cancel the solve registered under key. Returns False if none runs here."""
+        token = self.get(key)
+        if token:
+            logger.info(f"🛑 Cancelling solve {key}")
+            token.cancel()
+        return token is not None
+
+    def request_stop(self, key: str) -> bool:
+        """Ask the solve registered under key to keep its best solution and stop."""
+        token = self.get(key)
+        if token:
+            token.request_stop()
+        return token is not None
+
+    def cancel_tournament(self, tournament_id: str) -> int:
+        """Cancel every solve running for a tournament. Returns how many were cancelled."""
+        with self._lock:
+            tokens = [token for token in self._tokens.values() if token.tournament_id == tournament_id]
+        for token in tokens:
+            token.cancel()
+        return len(tokens)
+
+
+cancellation_registry = CancellationRegistry()
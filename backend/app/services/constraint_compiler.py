@@ -0,0 +1,238 @@
+"""
+CONSTRAINT COMPILER - Turns SchedulingConstraint rows into solver masks and penalties.
+Rows are read once per scheduler and compiled with NumPy over all slots at once.
+Priority 1 is hard; priorities 2-10 are soft, penalized with PRIORITY_WEIGHTS.
+Supported constraint_type values and their parameters:
+  blackout_date         date / dates / start_date / end_date [, venue_id]
+  time_slot             start_hour / end_hour / weekdays [, team_id or venue_id]
+  team_unavailable      team_id + date / dates / start_date / end_date / weekdays / hours
+  venue_preference      venue_id or venue_ids [, team_id]
+  max_matches_per_day   limit [, team_id or venue_id]
+Date and hour fields mean what they mean in Venue.available_slots.
+Rows of other types or with malformed parameters are logged and skipped.
+Every row but max_matches_per_day marks "bad" cells as slot_bad × venue_bad for
+an optional team, so a hard row folds straight into cell_open, team_slot_open or
+team_venue_open, and a soft row into the matching penalty matrix.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+import logging
+
+import numpy as np
+
+from app.services.venue_availability import RULE_FIELDS, slot_calendar, venue_slot_mask
+
+logger = logging.getLogger(__name__)
+
+HARD_PRIORITY = 1
+# Penalty per violating match: each priority step weighs twice the next lower one
+PRIORITY_WEIGHTS = {priority: 2 ** (10 - priority) for priority in range(2, 11)}
+DATE_FIELDS = RULE_FIELDS - {"available"}
+# Types compiled elsewhere (the tournament's min_rest_hours covers rest_period)
+IGNORED_TYPES = {"rest_period"}
+
+
+class CompiledConstraints:
+    """Hard masks, soft penalty matrices and per-day limits of a tournament's constraint rows."""
+
+    def __init__(self, num_teams: int, num_slots: int, num_venues: int):
+        # Hard: False where a match may never be placed
+        self.cell_open = np.ones((num_slots, num_venues), dtype=bool)
+        self.team_slot_open = np.ones((num_teams, num_slots), dtype=bool)
+        self.team_venue_open = np.ones((num_teams, num_venues), dtype=bool)
+        # Soft: penalty of placing a match there (team matrices count once per team involved)
+        self.cell_penalty = np.zeros((num_slots, num_venues), dtype=np.int64)
+        self.team_slot_penalty = np.zeros((num_teams, num_slots), dtype=np.int64)
+        self.team_venue_penalty = np.zeros((num_teams, num_venues), dtype=np.int64)
+        # {"limit", "team", "venue", "weight" (None when hard), "description"}
+        self.day_limits: List[Dict[str, Any]] = []
+        # Compiled rows for reporting: {"description", "priority", "team", "slot_bad", "venue_bad"}
+        self.rows: List[Dict[str, Any]] = []
+        # Rows left out because their type is unknown or their parameters are malformed
+        self.skipped: List[str] = []
+
+    @property
+    def has_soft(self) -> bool:
+        return any(row["priority"] != HARD_PRIORITY for row in self.rows) or any(
+            limit["weight"] is not None for limit in self.day_limits
+        )
+
+    @property
+    def hard_day_limits(self) -> List[Dict[str, Any]]:
+        return [limit for limit in self.day_limits if limit["weight"] is None]
+
+    def match_venue_open(self, match_pairs: List[Tuple[int, int]]) -> np.ndarray:
+        """matches × venues: venues both teams of each fixture may play at."""
+        pairs = np.asarray(match_pairs, dtype=np.int64).reshape(-1, 2)
+        return self.team_venue_open[pairs[:, 0]] & self.team_venue_open[pairs[:, 1]]
+
+    def match_penalty(self, t1: int, t2: int) -> np.ndarray:
+        """slots × venues penalty of a t1 vs t2 match in each cell."""
+        return (self.cell_penalty
+                + (self.team_slot_penalty[t1] + self.team_slot_penalty[t2])[:, None]
+                + (self.team_venue_penalty[t1] + self.team_venue_penalty[t2])[None, :])
+
+    def violations(self, assignments: List[Tuple[int, int]], match_pairs: List[Tuple[int, int]],
+                   slot_day: np.ndarray, hard: bool = False) -> List[Dict[str, Any]]:
+        """
+        Rows the assignments break, with the number of matches (or days) breaking each.
+        Only hard rows if hard, otherwise only soft ones.
+        """
+        if not assignments:
+            return []
+        pairs = np.asarray(match_pairs, dtype=np.int64).reshape(-1, 2)
+        slots, venues = np.asarray(assignments, dtype=np.int64).T
+        broken = []
+
+        for row in self.rows:
+            if (row["priority"] == HARD_PRIORITY) != hard:
+                continue
+            bad = np.ones(len(slots), dtype=bool)
+            if row["slot_bad"] is not None:
+                bad &= row["slot_bad"][slots]
+            if row["venue_bad"] is not None:
+                bad &= row["venue_bad"][venues]
+            if row["team"] is not None:
+                bad &= (pairs == row["team"]).any(axis=1)
+            if bad.any():
+                broken.append({"constraint": row["description"], "priority": row["priority"],
+                               "matches": int(bad.sum())})
+
+        for limit in self.day_limits:
+            if (limit["weight"] is None) != hard:
+                continue
+            counted = np.ones(len(slots), dtype=bool)
+            if limit["team"] is not None:
+                counted &= (pairs == limit["team"]).any(axis=1)
+            if limit["venue"] is not None:
+                counted &= venues == limit["venue"]
+            per_day = np.bincount(slot_day[slots[counted]], minlength=1)
+            days_over = int((per_day > limit["limit"]).sum())
+            if days_over:
+                broken.append({"constraint": limit["description"], "priority": limit["priority"],
+                               "days": days_over})
+        return broken
+
+
+def _index_of(value: Any, ids: Dict[str, int], kind: str, constraint_type: str) -> int:
+    if str(value) not in ids:
+        raise ValueError(f"{constraint_type} constraint refers to unknown {kind} {value}")
+    return ids[str(value)]
+
+
+def _slot_selector(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: parameters[field] for field in DATE_FIELDS if parameters.get(field) is not None}
+
+
+def _compile_row(compiled: CompiledConstraints, constraint, teams: List, venues: List,
+                 team_ids: Dict[str, int], venue_ids: Dict[str, int], time_slots: List[datetime],
+                 match_duration_hours: int, calendar) -> None:
+    """Fold one constraint row into compiled. Raises ValueError on an unknown type or malformed parameters."""
+    constraint_type = constraint.constraint_type
+    parameters = constraint.parameters or {}
+    priority = constraint.priority if constraint.priority is not None else 5
+    if not HARD_PRIORITY <= priority <= 10:
+        raise ValueError(f"{constraint_type} constraint priority must be 1-10, got {priority}")
+    if constraint_type in IGNORED_TYPES:
+        return
+
+    team = (_index_of(parameters["team_id"], team_ids, "team", constraint_type)
+            if parameters.get("team_id") is not None else None)
+    venue = (_index_of(parameters["venue_id"], venue_ids, "venue", constraint_type)
+             if parameters.get("venue_id") is not None else None)
+    if team is not None and venue is not None and constraint_type != "venue_preference":
+        raise ValueError(f"{constraint_type} constraint takes team_id or venue_id, not both")
+    selector = _slot_selector(parameters)
+    slot_bad = venue_bad = None
+    scope = (f" for {teams[team].name}" if team is not None
+             else f" at {venues[venue].name}" if venue is not None else "")
+
+    if constraint_type == "max_matches_per_day":
+        limit = parameters.get("limit")
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 0:
+            raise ValueError(f"max_matches_per_day constraint needs a non-negative integer limit, got {limit!r}")
+        compiled.day_limits.append({
+            "limit": limit, "team": team, "venue": venue, "priority": priority,
+            "weight": None if priority == HARD_PRIORITY else PRIORITY_WEIGHTS[priority],
+            "description": f"At most {limit} match(es) per day{scope}",
+        })
+        return
+
+    if constraint_type == "blackout_date":
+        if not selector.keys() & {"date", "dates", "start_date", "end_date"}:
+            raise ValueError("blackout_date constraint needs date, dates or start_date/end_date")
+        slot_bad = venue_slot_mask([selector], time_slots, match_duration_hours, calendar)
+        description = f"No matches{scope} on the blacked-out dates"
+    elif constraint_type == "time_slot":
+        if not selector:
+            raise ValueError("time_slot constraint needs start_hour/end_hour or weekdays")
+        slot_bad = ~venue_slot_mask([selector], time_slots, match_duration_hours, calendar)
+        description = f"Matches{scope} only in the allowed time window"
+    elif constraint_type == "team_unavailable":
+        if team is None or not selector:
+            raise ValueError("team_unavailable constraint needs team_id and dates, weekdays or hours")
+        slot_bad = venue_slot_mask([selector], time_slots, match_duration_hours, calendar)
+        description = f"{teams[team].name} is unavailable on the given dates"
+    elif constraint_type == "venue_preference":
+        preferred = list(parameters.get("venue_ids") or []) + ([parameters["venue_id"]] if venue is not None else [])
+        if not preferred:
+            raise ValueError("venue_preference constraint needs venue_id or venue_ids")
+        venue_bad = np.ones(len(venues), dtype=bool)
+        venue_bad[[_index_of(v, venue_ids, "venue", constraint_type) for v in preferred]] = False
+        names = ", ".join(venues[v].name for v in np.flatnonzero(~venue_bad))
+        description = f"{teams[team].name if team is not None else 'Matches'} played at {names}"
+        venue = None
+    else:
+        raise ValueError(f"Unknown constraint type: {constraint_type}")
+
+    if slot_bad is not None and venue is not None:
+        venue_bad = np.arange(len(venues)) == venue
+    compiled.rows.append({"description": description, "priority": priority, "team": team,
+                          "slot_bad": slot_bad, "venue_bad": venue_bad})
+
+    slot_bad_all = slot_bad if slot_bad is not None else np.ones(len(time_slots), dtype=bool)
+    venue_bad_all = venue_bad if venue_bad is not None else np.ones(len(venues), dtype=bool)
+    if priority == HARD_PRIORITY:
+        if team is None:
+            compiled.cell_open &= ~np.outer(slot_bad_all, venue_bad_all)
+        elif venue_bad is None:
+            compiled.team_slot_open[team] &= ~slot_bad_all
+        else:
+            compiled.team_venue_open[team] &= ~venue_bad_all
+    else:
+        weight = PRIORITY_WEIGHTS[priority]
+        if team is None:
+            compiled.cell_penalty += weight * np.outer(slot_bad_all, venue_bad_all)
+        elif venue_bad is None:
+            compiled.team_slot_penalty[team] += weight * slot_bad_all
+        else:
+            compiled.team_venue_penalty[team] += weight * venue_bad_all
+
+
+def compile_constraints(constraints: List, teams: List, venues: List, time_slots: List[datetime],
+                        match_duration_hours: int) -> CompiledConstraints:
+    """
+    Compile active SchedulingConstraint rows. Rows of an unknown type or with malformed
+    parameters are logged and skipped (listed in CompiledConstraints.skipped), so one
+    bad row does not stop the whole schedule.
+    """
+    compiled = CompiledConstraints(len(teams), len(time_slots), len(venues))
+    team_ids = {str(team.id): t for t, team in enumerate(teams)}
+    venue_ids = {str(venue.id): v for v, venue in enumerate(venues)}
+    calendar = slot_calendar(time_slots, match_duration_hours)
+
+    for constraint in constraints:
+        try:
+            _compile_row(compiled, constraint, teams, venues, team_ids, venue_ids, time_slots,
+                         match_duration_hours, calendar)
+        except ValueError as e:
+            logger.warning(f"⚠️ Skipping {constraint.constraint_type} constraint: {str(e)}")
+            compiled.skipped.append(f"{constraint.constraint_type}: {str(e)}")
+
+    if constraints:
+        logger.info(
+            f"📋 Compiled {len(compiled.rows) + len(compiled.day_limits)} scheduling constraints "
+            f"({sum(1 for c in constraints if c.priority == HARD_PRIORITY)} hard)"
+        )
+    return compiled
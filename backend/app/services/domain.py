@@ -0,0 +1,243 @@
+"""
+DOMAIN - Solver-independent problem and solution data.
+load_problem reads a tournament once and copies it into slotted records, so the
+engines never hold a Session or ORM rows: a ProblemSpec pickles cheaply into a
+worker process. Teams and venues are addressed by index; slot starts, home
+venues and the chosen (slot, venue) of every fixture are NumPy arrays. The
+record fields carry the ORM attribute names, so helpers written against the
+models (availability, constraints, travel, cache keys) accept either.
+save_solution writes a Solution back as Match rows.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+import logging
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.models import Tournament, TournamentFormat, Team, Venue, Match, MatchStatus, SchedulingConstraint
+from app.services.group_stage import DEFAULT_GROUPS, GROUPS_SETTING, group_round_robin, team_groups
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class TournamentSpec:
+    id: UUID
+    format: TournamentFormat
+    start_date: datetime
+    end_date: datetime
+    slots_per_day: int
+    match_duration_hours: int
+    min_rest_hours: int
+    settings: Dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class TeamSpec:
+    id: UUID
+    code: str
+    name: str
+    home_venue_id: Optional[UUID]
+
+
+@dataclass(frozen=True, slots=True)
+class VenueSpec:
+    id: UUID
+    name: str
+    latitude: Optional[float]
+    longitude: Optional[float]
+    available_slots: Optional[List[Dict[str, Any]]]
+
+
+@dataclass(frozen=True, slots=True)
+class ConstraintSpec:
+    constraint_type: str
+    priority: Optional[int]
+    parameters: Dict[str, Any]
+
+
+@dataclass(eq=False, slots=True)
+class ProblemSpec:
+    """Everything an engine needs to build and check a schedule."""
+    tournament: TournamentSpec
+    teams: Tuple[TeamSpec, ...]
+    venues: Tuple[VenueSpec, ...]
+    # Active scheduling constraints
+    constraints: Tuple[ConstraintSpec, ...]
+    # datetime64[s] start of every slot, in time order
+    time_slots: np.ndarray
+    # Venue index of each team's home ground, -1 when it has none
+    home_venue: np.ndarray
+
+
+@dataclass(eq=False, slots=True)
+class Solution:
+    """A fixture list and where each fixture is played, by index into the problem."""
+    # matches × 2: team indices, home side first
+    pairs: np.ndarray
+    # matches × 2: (slot, venue) of each fixture
+    assignments: np.ndarray
+    # Round name stored with each fixture, None when the engine has no rounds
+    rounds: Tuple[Optional[str], ...]
+
+    @classmethod
+    def from_lists(cls, match_pairs: Sequence[Tuple[int, int]], assignments: Sequence[Tuple[int, int]],
+                   rounds: Optional[Sequence[Optional[str]]] = None) -> "Solution":
+        return cls(
+            pairs=np.array(match_pairs, dtype=np.int32).reshape(-1, 2),
+            assignments=np.array(assignments, dtype=np.int32).reshape(-1, 2),
+            rounds=tuple(rounds) if rounds is not None else (None,) * len(match_pairs),
+        )
+
+    def play_order(self) -> np.ndarray:
+        """Fixture indices by kick-off; fixtures in the same slot keep their order."""
+        return np.argsort(self.assignments[:, 0], kind="stable")
+
+
+def calculate_time_slots(tournament) -> np.ndarray:
+    """Slot starts from the tournament dates and slots_per_day."""
+    slots_per_day = tournament.slots_per_day
+    if slots_per_day == 1:
+        slot_hours = [14]  # 2 PM
+    elif slots_per_day == 2:
+        slot_hours = [10, 18]  # 10 AM, 6 PM
+    elif slots_per_day == 3:
+        slot_hours = [10, 14, 18]  # 10 AM, 2 PM, 6 PM
+    else:
+        # Distribute evenly from 9 AM to 9 PM
+        slot_hours = [9 + i * (12 // slots_per_day) for i in range(slots_per_day)]
+
+    slots = []
+    current_date = tournament.start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    end_date = tournament.end_date
+    while current_date <= end_date:
+        for hour in slot_hours:
+            slot_time = current_date.replace(hour=hour)
+            if slot_time <= end_date:
+                slots.append(slot_time)
+        current_date += timedelta(days=1)
+    return np.array(slots, dtype="datetime64[s]")
+
+
+def min_rest_slots(tournament) -> int:
+    """Slots a team sits out after a match: the rest period in match lengths, at least one."""
+    return max(1, tournament.min_rest_hours // tournament.match_duration_hours)
+
+
+def generate_match_pairs(spec: ProblemSpec) -> Tuple[List[Tuple[int, int]], Optional[np.ndarray]]:
+    """
+    Fixtures of the tournament format as (home, away) team indices, and the group index
+    of every team for the groups format (None otherwise).
+    """
+    num_teams = len(spec.teams)
+    tournament_format = spec.tournament.format.value
+
+    if tournament_format in ["round_robin", "league"]:
+        # Each team plays each other team once
+        return [(i, j) for i in range(num_teams) for j in range(i + 1, num_teams)], None
+
+    if tournament_format == "double_round_robin":
+        # Each team plays each other team twice (home and away)
+        return [(i, j) for i in range(num_teams) for j in range(num_teams) if i != j], None
+
+    if tournament_format == "groups":
+        # Teams are drawn into groups and play each other team in their group once
+        draw = spec.tournament.settings.get(GROUPS_SETTING, DEFAULT_GROUPS)
+        team_group = team_groups([team.code for team in spec.teams], draw)
+        return group_round_robin(team_group), team_group
+
+    if tournament_format == "knockout":
+        # Later rounds depend on results, so fixtures are not team pairs known up front
+        raise ValueError("Knockout tournaments are scheduled as a bracket: use the 'bracket' engine")
+
+    return [], None
+
+
+def load_problem(db: Session, tournament_id) -> ProblemSpec:
+    """Read a tournament, its teams, venues and active constraints into a ProblemSpec."""
+    tournament_id = UUID(tournament_id) if isinstance(tournament_id, str) else tournament_id
+    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+    if not tournament:
+        raise ValueError(f"Tournament {tournament_id} not found")
+
+    teams = db.query(Team).filter(Team.tournament_id == tournament_id).all()
+    venues = db.query(Venue).filter(Venue.tournament_id == tournament_id).all()
+    if len(teams) < 2:
+        raise ValueError("At least 2 teams required for scheduling")
+    if len(venues) < 1:
+        raise ValueError("At least 1 venue required for scheduling")
+    constraints = db.query(SchedulingConstraint).filter(
+        SchedulingConstraint.tournament_id == tournament_id,
+        SchedulingConstraint.is_active.is_(True)
+    ).all()
+
+    venue_index = {venue.id: v for v, venue in enumerate(venues)}
+    return ProblemSpec(
+        tournament=TournamentSpec(
+            id=tournament.id,
+            format=tournament.format,
+            start_date=tournament.start_date,
+            end_date=tournament.end_date,
+            slots_per_day=tournament.slots_per_day,
+            match_duration_hours=tournament.match_duration_hours,
+            min_rest_hours=tournament.min_rest_hours,
+            settings=dict(tournament.settings or {}),
+        ),
+        teams=tuple(TeamSpec(id=team.id, code=team.code, name=team.name, home_venue_id=team.home_venue_id)
+                    for team in teams),
+        venues=tuple(VenueSpec(id=venue.id, name=venue.name, latitude=venue.latitude, longitude=venue.longitude,
+                               available_slots=venue.available_slots) for venue in venues),
+        constraints=tuple(ConstraintSpec(constraint_type=row.constraint_type, priority=row.priority,
+                                         parameters=row.parameters or {}) for row in constraints),
+        time_slots=calculate_time_slots(tournament),
+        home_venue=np.array([venue_index.get(team.home_venue_id, -1) for team in teams], dtype=np.int64),
+    )
+
+
+def solution_records(spec: ProblemSpec, solution: Solution) -> List[Dict]:
+    """Scheduled match records in kick-off order, numbered from 1, with team and venue names filled in."""
+    duration = timedelta(hours=spec.tournament.match_duration_hours)
+    records = []
+    for number, m in enumerate(solution.play_order(), start=1):
+        (t1, t2), (s, v) = solution.pairs[m].tolist(), solution.assignments[m].tolist()
+        start = spec.time_slots[s].item()
+        records.append({
+            "match_number": number,
+            "team1_id": spec.teams[t1].id,
+            "team2_id": spec.teams[t2].id,
+            "team1_name": spec.teams[t1].name,
+            "team2_name": spec.teams[t2].name,
+            "venue_id": spec.venues[v].id,
+            "venue_name": spec.venues[v].name,
+            "scheduled_start": start,
+            "scheduled_end": start + duration,
+            "slot_index": s,
+            "venue_index": v,
+            "round": solution.rounds[m]
+        })
+    return records
+
+
+def save_solution(db: Session, spec: ProblemSpec, solution: Solution) -> int:
+    """Replace the tournament's matches with the solution. Returns the number of rows written."""
+    records = solution_records(spec, solution)
+    db.query(Match).filter(Match.tournament_id == spec.tournament.id).delete()
+    for record in records:
+        db.add(Match(
+            tournament_id=spec.tournament.id,
+            team1_id=record["team1_id"],
+            team2_id=record["team2_id"],
+            venue_id=record["venue_id"],
+            scheduled_start=record["scheduled_start"],
+            scheduled_end=record["scheduled_end"],
+            match_number=record["match_number"],
+            round=record["round"],
+            status=MatchStatus.SCHEDULED
+        ))
+    db.commit()
+    logger.info(f"Saved {len(records)} matches to database")
+    return len(records)
@@ -0,0 +1,70 @@
+"""
+ENGINE REGISTRY - Scheduling engines by name.
+An engine is a class constructed as Engine(db, tournament_id) whose
+generate_schedule(request) returns the result dict; the built-in ones subclass
+CricketScheduler and share its slot calendar, pair generator, model builder,
+extractor and persister (app.services.domain). The engine is chosen per request
+(request.engine), else per tournament (settings.engine), else SCHEDULER_DEFAULT_ENGINE,
+so a new engine can be registered and compared against the others on the same
+tournaments without touching the callers. Knockouts always use the bracket engine.
+"""
+
+from importlib import import_module
+from typing import Dict, List, Optional, Union
+
+from app.core.config import settings
+from app.models import TournamentFormat
+
+# tournament.settings key: engine name used when the request does not name one
+ENGINE_SETTING = "engine"
+# The only engine that schedules knockout tournaments
+KNOCKOUT_ENGINE = "bracket"
+
+# name -> class or "module:Class"; the built-in engines import app.services.scheduler,
+# so they are only imported when first used
+_ENGINES: Dict[str, Union[type, str]] = {
+    "boolean": "app.services.scheduler:CricketScheduler",
+    "interval": "app.services.scheduler_interval:IntervalCricketScheduler",
+    "rounds": "app.services.scheduler_rounds:RoundRobinCricketScheduler",
+    "heuristic": "app.services.scheduler_heuristic:HeuristicCricketScheduler",
+    "bracket": "app.services.scheduler_bracket:BracketCricketScheduler",
+    "simplified": "app.services.scheduler_simplified:SimplifiedCricketScheduler",
+}
+
+
+def register_engine(name: str, engine: Union[type, str]) -> None:
+    """Add or replace an engine: a class, or its "module:Class" path."""
+    _ENGINES[name] = engine
+
+
+def engine_names() -> List[str]:
+    return sorted(_ENGINES)
+
+
+def engine_class(name: str) -> type:
+    """The class registered under name. Raises ValueError for unknown engines."""
+    engine = _ENGINES.get(name)
+    if engine is None:
+        raise ValueError(f"Unknown scheduling engine: {name} (available: {', '.join(engine_names())})")
+    if isinstance(engine, str):
+        module_name, class_name = engine.split(":")
+        engine = getattr(import_module(module_name), class_name)
+        _ENGINES[name] = engine
+    return engine
+
+
+def resolve_engine(requested: Optional[str], tournament_format: Optional[TournamentFormat],
+                   tournament_settings: Optional[Dict] = None) -> str:
+    """
+    Engine name for a solve: the request's, then the tournament's setting, then the default.
+    Knockout tournaments always go to the bracket engine; requesting another one for them
+    raises ValueError.
+    """
+    if tournament_format == TournamentFormat.KNOCKOUT:
+        if requested and requested != KNOCKOUT_ENGINE:
+            raise ValueError(f"Knockout tournaments are scheduled by the '{KNOCKOUT_ENGINE}' engine, not '{requested}'")
+        name = KNOCKOUT_ENGINE
+    else:
+        name = requested or (tournament_settings or {}).get(ENGINE_SETTING) or settings.SCHEDULER_DEFAULT_ENGINE
+    engine_class(name)
+    return name
@@ -0,0 +1,48 @@
+"""
+FAIRNESS METRICS - Home/away breaks and rest per team, for the fairness objective.
+A team plays at home when a match is at its home_venue_id and away otherwise;
+a break is two consecutive matches both at home or both away. Teams without a
+home venue have no home/away pattern and so no breaks. Rest is the hours
+between the end of one match and the start of the team's next one.
+"""
+
+from datetime import datetime
+from typing import List, Tuple
+
+import numpy as np
+
+# One break weighs as much as a day of spread in per-team minimum rest
+BREAK_WEIGHT_HOURS = 24
+
+
+def slot_start_hours(time_slots: List[datetime]) -> np.ndarray:
+    """Whole hours from the first slot to each slot's start."""
+    starts = np.array(time_slots, dtype="datetime64[m]")
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64)
+    return ((starts - starts[0]).astype(np.int64) // 60).astype(np.int64)
+
+
+def team_fairness(assignments: List[Tuple[int, int]], match_pairs: List[Tuple[int, int]], home: np.ndarray,
+                  start_hours: np.ndarray, match_duration_hours: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per team: number of home/away breaks, and minimum rest in hours between
+    consecutive matches (-1 for teams with fewer than two matches).
+    """
+    num_teams = len(home)
+    breaks = np.zeros(num_teams, dtype=np.int64)
+    min_rest = np.full(num_teams, -1, dtype=np.int64)
+    if not assignments:
+        return breaks, min_rest
+    pairs = np.asarray(match_pairs, dtype=np.int64).reshape(-1, 2)
+    slots, venues = np.asarray(assignments, dtype=np.int64).T
+    for t in range(num_teams):
+        played = np.flatnonzero((pairs == t).any(axis=1))
+        if len(played) < 2:
+            continue
+        played = played[np.argsort(slots[played], kind="stable")]
+        min_rest[t] = int(np.diff(start_hours[slots[played]]).min()) - match_duration_hours
+        if home[t] >= 0:
+            at_home = venues[played] == home[t]
+            breaks[t] = int((at_home[1:] == at_home[:-1]).sum())
+    return breaks, min_rest
@@ -0,0 +1,273 @@
+"""
+FEASIBILITY PROVER - Counting and flow bounds checked before any model is built.
+Every bound here is a necessary condition for a conflict-free schedule, so a
+violated one proves infeasibility without CP-SAT:
+  1. each fixture needs a slot where both teams and some venue are free
+  2. per-team window packing: a team's matches must fit into its free slots
+     at least a rest window apart
+  3. window capacity: in any rest window (or any day, when a day is shorter)
+     a team plays at most once and each venue hosts at most one match per slot
+  4. max-flow from fixtures to slots, each slot taking at most
+     min(free venues, free teams // 2) matches
+When a bound fails, the same checks are re-run on a tournament extended by
+extra days or venues to report the smallest extension that passes them.
+"""
+
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAX_EXTRA_DAYS = 365
+# Reasons listed per fixture or per team before the rest are summarized
+MAX_LISTED_REASONS = 5
+
+
+def _slot_capacity(cell_open: np.ndarray, usable: np.ndarray) -> np.ndarray:
+    """Most matches each slot can hold: one per free venue, two free teams per match."""
+    return np.minimum(cell_open.sum(axis=1), usable.sum(axis=0) // 2)
+
+
+def _packed_matches(usable_slots: np.ndarray, rest_window: int) -> int:
+    """Most matches a team can play in these slots, consecutive ones rest_window apart (greedy is optimal)."""
+    count, next_free = 0, -1
+    for s in np.flatnonzero(usable_slots):
+        if s >= next_free:
+            count += 1
+            next_free = s + rest_window
+    return count
+
+
+def _block_bound(block_starts: np.ndarray, slot_capacity: np.ndarray, usable: np.ndarray) -> int:
+    """
+    Matches that fit when no team plays twice inside a block: per block, the lesser
+    of its slot capacity and half the teams free at some point in it.
+    """
+    if not len(block_starts):
+        return 0
+    capacity = np.add.reduceat(slot_capacity, block_starts)
+    teams_free = np.logical_or.reduceat(usable, block_starts, axis=1).sum(axis=0)
+    return int(np.minimum(capacity, teams_free // 2).sum())
+
+
+def _window_bound(slot_capacity: np.ndarray, usable: np.ndarray, rest_window: int,
+                  slot_day: np.ndarray) -> Tuple[int, str]:
+    """
+    Tightest block partition bound. Any run of at most rest_window consecutive slots
+    works as a block: the rest windows at every offset, and whole days when they fit.
+    Returns (bound, what the binding blocks are).
+    """
+    num_slots = len(slot_capacity)
+    best = (int(slot_capacity.sum()), "slot")
+    if rest_window > 1:
+        for offset in range(min(rest_window, num_slots)):
+            starts = np.unique(np.concatenate(([0], np.arange(offset, num_slots, rest_window))))
+            bound = _block_bound(starts, slot_capacity, usable)
+            if bound < best[0]:
+                best = (bound, f"{rest_window}-slot rest window")
+
+    day_starts = np.flatnonzero(np.diff(slot_day, prepend=-1))
+    day_lengths = np.diff(np.append(day_starts, num_slots))
+    if len(day_starts) and day_lengths.max() <= rest_window:
+        bound = _block_bound(day_starts, slot_capacity, usable)
+        if bound < best[0]:
+            best = (bound, "day")
+    return best
+
+
+def _max_flow(capacity: np.ndarray) -> int:
+    """Dinic's max-flow on a small dense capacity matrix; node 0 is the source, the last the sink."""
+    num_nodes = len(capacity)
+    residual = capacity.astype(np.int64)
+    sink = num_nodes - 1
+    flow = 0
+
+    while True:
+        level = np.full(num_nodes, -1)
+        level[0] = 0
+        queue = deque([0])
+        while queue:
+            u = queue.popleft()
+            for v in np.flatnonzero((residual[u] > 0) & (level < 0)):
+                level[v] = level[u] + 1
+                queue.append(v)
+        if level[sink] < 0:
+            return flow
+
+        next_edge = [0] * num_nodes
+        neighbours = [np.flatnonzero(residual[u] > 0) for u in range(num_nodes)]
+
+        def push(u: int, limit: int) -> int:
+            if u == sink:
+                return limit
+            while next_edge[u] < len(neighbours[u]):
+                v = neighbours[u][next_edge[u]]
+                if level[v] == level[u] + 1 and residual[u, v] > 0:
+                    pushed = push(v, min(limit, int(residual[u, v])))
+                    if pushed:
+                        residual[u, v] -= pushed
+                        residual[v, u] += pushed
+                        return pushed
+                next_edge[u] += 1
+            return 0
+
+        while True:
+            pushed = push(0, 1 << 60)
+            if not pushed:
+                break
+            flow += pushed
+
+
+def _assignable_matches(pairs: np.ndarray, usable: np.ndarray, slot_capacity: np.ndarray) -> int:
+    """
+    Max-flow from fixtures to slots. Fixtures whose teams share availability patterns and
+    slots with the same fixture groups are merged first, which keeps the graph tiny.
+    """
+    team_pattern = np.unique(usable, axis=0, return_inverse=True)[1].ravel()
+    pattern_pairs = np.sort(team_pattern[pairs], axis=1)
+    _, first_match, group_sizes = np.unique(pattern_pairs, axis=0, return_index=True, return_counts=True)
+    groups = usable[pairs[first_match, 0]] & usable[pairs[first_match, 1]]
+
+    used = slot_capacity > 0
+    columns, column_index = np.unique(groups[:, used], axis=1, return_inverse=True)
+    column_capacity = np.bincount(column_index.ravel(), weights=slot_capacity[used],
+                                  minlength=columns.shape[1]).astype(np.int64)
+
+    num_groups, num_columns = columns.shape
+    source, sink = 0, num_groups + num_columns + 1
+    capacity = np.zeros((sink + 1, sink + 1), dtype=np.int64)
+    capacity[source, 1:num_groups + 1] = group_sizes
+    capacity[1:num_groups + 1, num_groups + 1:sink] = np.where(columns, int(group_sizes.sum()), 0)
+    capacity[num_groups + 1:sink, sink] = column_capacity
+    return _max_flow(capacity)
+
+
+def infeasibility_reasons(match_pairs: List[Tuple[int, int]], cell_open: np.ndarray,
+                          team_slot_open: np.ndarray, rest_window: int, slot_day: np.ndarray,
+                          team_names: Optional[List[str]] = None) -> List[str]:
+    """
+    Check every bound. Returns one reason per violated bound (empty if none is violated).
+    cell_open is slots × venues, team_slot_open teams × slots.
+    """
+    num_teams = team_slot_open.shape[0]
+    names = team_names or [f"Team {t + 1}" for t in range(num_teams)]
+    num_matches = len(match_pairs)
+    if not num_matches:
+        return []
+
+    usable = team_slot_open & cell_open.any(axis=1)[None, :]
+    pairs = np.asarray(match_pairs)
+    reasons = []
+
+    # BOUND 1: Every fixture needs one slot where both teams and a venue are free
+    allowed = usable[pairs[:, 0]] & usable[pairs[:, 1]]
+    stranded = np.flatnonzero(~allowed.any(axis=1))
+    for m in stranded[:MAX_LISTED_REASONS]:
+        t1, t2 = pairs[m]
+        reasons.append(f"{names[t1]} vs {names[t2]}: no time slot where both teams and a venue are free")
+    if len(stranded) > MAX_LISTED_REASONS:
+        reasons.append(f"...and {len(stranded) - MAX_LISTED_REASONS} more fixtures without a free slot")
+
+    # BOUND 2: Per-team window packing
+    matches_per_team = np.bincount(pairs.ravel(), minlength=num_teams)
+    short_teams = []
+    for t in np.flatnonzero(matches_per_team):
+        packed = _packed_matches(usable[t], rest_window)
+        if packed < matches_per_team[t]:
+            short_teams.append((t, packed))
+    for t, packed in short_teams[:MAX_LISTED_REASONS]:
+        reasons.append(
+            f"{names[t]} has {matches_per_team[t]} matches but only {packed} fit into its free slots "
+            f"with {rest_window - 1} rest slots between matches"
+        )
+    if len(short_teams) > MAX_LISTED_REASONS:
+        reasons.append(f"...and {len(short_teams) - MAX_LISTED_REASONS} more teams without room for their matches")
+
+    # BOUND 3: Window / per-day venue capacity
+    slot_capacity = _slot_capacity(cell_open, usable)
+    open_cells = int(cell_open.sum())
+    if num_matches > open_cells:
+        reasons.append(
+            f"Not enough time slots: {num_matches} matches need {num_matches} slots, "
+            f"but only {open_cells} venue slots are free"
+        )
+    elif not len(stranded):
+        # Stranded fixtures already explain any shortfall here
+        bound, block = _window_bound(slot_capacity, usable, rest_window, slot_day)
+        if num_matches > bound:
+            reasons.append(
+                f"At most {bound} of {num_matches} matches fit: a team plays at most once per {block} "
+                f"and each venue hosts one match per slot"
+            )
+
+    # BOUND 4: Fixture → slot max-flow
+    if not reasons:
+        assignable = _assignable_matches(pairs, usable, slot_capacity)
+        if assignable < num_matches:
+            reasons.append(
+                f"Only {assignable} of {num_matches} matches can get a slot: too few slots are free "
+                f"for both teams of the remaining fixtures"
+            )
+
+    return reasons
+
+
+def _extended(cell_open: np.ndarray, team_slot_open: np.ndarray, slot_day: np.ndarray,
+              extra_days: int = 0, extra_venues: int = 0,
+              slots_per_day: int = 1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The availability masks of a tournament with extra fully open days and venues."""
+    extra_slots = extra_days * slots_per_day
+    if extra_slots:
+        cell_open = np.vstack([cell_open, np.ones((extra_slots, cell_open.shape[1]), dtype=bool)])
+        team_slot_open = np.hstack([team_slot_open, np.ones((team_slot_open.shape[0], extra_slots), dtype=bool)])
+        last_day = slot_day[-1] if len(slot_day) else -1
+        slot_day = np.concatenate([slot_day, last_day + 1 + np.arange(extra_slots) // slots_per_day])
+    if extra_venues:
+        cell_open = np.hstack([cell_open, np.ones((cell_open.shape[0], extra_venues), dtype=bool)])
+    return cell_open, team_slot_open, slot_day
+
+
+def _smallest_passing(passes, limit: int) -> Optional[int]:
+    """Smallest n in 1..limit with passes(n), assuming passes is monotone. None if there is none."""
+    failed, high = 0, 1
+    while high < limit and not passes(high):
+        failed, high = high, high * 2
+    high = min(high, limit)
+    if not passes(high):
+        return None
+    low = failed + 1
+    while low < high:
+        middle = (low + high) // 2
+        if passes(middle):
+            high = middle
+        else:
+            low = middle + 1
+    return high
+
+
+def analyze_feasibility(match_pairs: List[Tuple[int, int]], cell_open: np.ndarray,
+                        team_slot_open: np.ndarray, rest_window: int, slot_day: np.ndarray,
+                        slots_per_day: int, team_names: Optional[List[str]] = None) -> Dict:
+    """
+    Prove the schedule infeasible or let it through to the solver.
+    Returns {"feasible", "reasons", "extra_days_needed", "extra_venues_needed"}; the
+    extensions are the fewest added days or venues that pass every bound, None if
+    that kind of extension cannot help (or nothing is wrong).
+    """
+    reasons = infeasibility_reasons(match_pairs, cell_open, team_slot_open, rest_window, slot_day, team_names)
+    report = {"feasible": not reasons, "reasons": reasons, "extra_days_needed": None, "extra_venues_needed": None}
+    if not reasons:
+        return report
+
+    def passes_with(extra_days: int = 0, extra_venues: int = 0) -> bool:
+        masks = _extended(cell_open, team_slot_open, slot_day, extra_days, extra_venues, slots_per_day)
+        return not infeasibility_reasons(match_pairs, *masks[:2], rest_window, masks[2])
+
+    report["extra_days_needed"] = _smallest_passing(lambda d: passes_with(extra_days=d), MAX_EXTRA_DAYS)
+    # Beyond one venue per pair of teams, extra venues cannot add capacity
+    max_venues = max(1, team_slot_open.shape[0] // 2)
+    report["extra_venues_needed"] = _smallest_passing(lambda v: passes_with(extra_venues=v), max_venues)
+    return report
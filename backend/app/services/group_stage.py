@@ -0,0 +1,77 @@
+"""
+GROUP STAGE - Splits a grouped tournament into independent per-group solves.
+Teams are drawn into groups and play a round robin within their group, so no
+fixture links two groups. Each group gets its own slice of the open venue/slot
+cells, is solved as a separate model (in its own process when several workers
+are allowed) and the slices merge into one schedule without venue or team clashes.
+"""
+
+from typing import List, Sequence, Tuple, Union
+import numpy as np
+
+# tournament.settings key: a number of groups, or one list of team codes per group
+GROUPS_SETTING = "groups"
+DEFAULT_GROUPS = 2
+
+
+def team_groups(team_codes: Sequence[str], groups: Union[int, List[List[str]]]) -> np.ndarray:
+    """
+    Group index of every team. A number of groups deals the teams out in snake order
+    (A, B, ..., B, A, A, B, ...), so seeds listed first spread across the groups;
+    lists of team codes draw the groups explicitly and must name every team once.
+    """
+    num_teams = len(team_codes)
+    if isinstance(groups, int):
+        if not 1 <= groups <= num_teams // 2:
+            raise ValueError(f"{num_teams} teams cannot be split into {groups} groups of at least 2 teams")
+        positions = np.arange(num_teams)
+        column = positions % groups
+        return np.where((positions // groups) % 2 == 0, column, groups - 1 - column)
+
+    team_index = {code: t for t, code in enumerate(team_codes)}
+    group_of = np.full(num_teams, -1, dtype=np.int64)
+    for g, codes in enumerate(groups):
+        if len(codes) < 2:
+            raise ValueError(f"Group {g + 1} needs at least 2 teams")
+        for code in codes:
+            t = team_index.get(code)
+            if t is None:
+                raise ValueError(f"Group {g + 1} lists unknown team code: {code}")
+            if group_of[t] >= 0:
+                raise ValueError(f"Team {code} is drawn into more than one group")
+            group_of[t] = g
+    missing = [team_codes[t] for t in np.flatnonzero(group_of < 0)]
+    if missing:
+        raise ValueError(f"Teams not drawn into any group: {', '.join(missing)}")
+    return group_of
+
+
+def group_round_robin(group_of: np.ndarray) -> List[Tuple[int, int]]:
+    """Every pair of teams in the same group, group by group."""
+    pairs = []
+    for g in range(int(group_of.max()) + 1):
+        members = np.flatnonzero(group_of == g).tolist()
+        pairs.extend((i, j) for k, i in enumerate(members) for j in members[k + 1:])
+    return pairs
+
+
+def partition_cells(cell_open: np.ndarray, demand: np.ndarray) -> np.ndarray:
+    """
+    slots × venues: the group each open cell is reserved for, -1 for closed cells.
+    Open cells are dealt out slot by slot in proportion to each group's number of
+    fixtures, so every group gets cells all through the season and at every venue.
+    """
+    cell_group = np.full(cell_open.shape, -1, dtype=np.int64)
+    share = demand / max(1, demand.sum())
+    dealt = np.zeros(len(demand))
+    open_cells = np.argwhere(cell_open)
+    # Venues take turns at the head of each slot, so equal groups do not keep the same venue
+    rotated = (open_cells[:, 1] - open_cells[:, 0]) % max(1, cell_open.shape[1])
+    open_cells = open_cells[np.lexsort((rotated, open_cells[:, 0]))]
+    for k, (s, v) in enumerate(open_cells):
+        # Largest shortfall against the proportional share so far; ties go to the lowest group
+        g = int(np.argmax(share * (k + 1) - dealt))
+        cell_group[s, v] = g
+        dealt[g] += 1
+    return cell_group
+
@@ -0,0 +1,312 @@
+"""
+SCHEDULE JOBS - Schedule generation outside the API request workers.
+The API records a ScheduleJob row and enqueues its id on Celery; a worker runs
+the solve and writes status, progress and the result back to the row, which
+GET /jobs/{id} reads and GET /jobs/{id}/events streams as Server-Sent Events.
+DELETE /jobs/{id} cancels a job: the running solve is stopped through its
+cancellation token, directly when it runs in this process and through the
+row's cancel_requested flag when it runs on a worker.
+With CELERY_TASK_ALWAYS_EAGER the task runs in-process.
+"""
+
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, Optional, Tuple
+from uuid import UUID
+from anyio import CancelScope
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+import asyncio
+import json
+import logging
+import threading
+import time
+
+from app.core.celery_app import celery_app
+from app.db.session import SessionLocal
+from app.models import ScheduleJob, JobStatus
+from app.schemas.schemas import ScheduleGenerateRequest, ScheduleGenerateResponse, ScheduleJob as ScheduleJobSchema
+from app.services.cancellation import CancellationToken, cancellation_registry
+from app.services.scheduler import generate_tournament_schedule
+
+logger = logging.getLogger(__name__)
+
+# Solutions can arrive many times a second; write progress and check for a stop at most this often
+PROGRESS_WRITE_INTERVAL_SECONDS = 0.5
+# How often the event stream re-reads the job row
+EVENT_POLL_INTERVAL_SECONDS = 0.5
+# Comment line sent on a quiet event stream so proxies keep the connection open
+EVENT_HEARTBEAT_SECONDS = 15.0
+# How often a worker checks the row for a cancel or stop the API recorded
+FLAG_POLL_INTERVAL_SECONDS = 0.5
+FINISHED_JOB_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+def schedule_response(result: Dict) -> ScheduleGenerateResponse:
+    """Turn a generate_tournament_schedule result into the API response."""
+    if result["success"]:
+        schedule_summary = {
+            "total_matches": result["matches_scheduled"],
+            "status": result.get("status", "completed"),
+            "cache_hit": result.get("cache_hit", False),
+            "soft_constraint_violations": result.get("soft_constraint_violations", [])
+        }
+        if "engine" in result:
+            schedule_summary["engine"] = result["engine"]
+        if "travel_km" in result:
+            schedule_summary["travel_km"] = result["travel_km"]
+            schedule_summary["team_travel_km"] = result["team_travel_km"]
+        if "fairness" in result:
+            schedule_summary["fairness"] = result["fairness"]
+        if "rows_changed" in result:
+            schedule_summary["matches_frozen"] = result["matches_frozen"]
+            schedule_summary["rows_changed"] = result["rows_changed"]
+
+        return ScheduleGenerateResponse(
+            success=True,
+            message=result["message"],
+            matches_scheduled=result["matches_scheduled"],
+            schedule_summary=schedule_summary,
+            solver_stats=result.get("solver_stats"),
+            solution_log=result.get("solution_log", [])
+        )
+
+    return ScheduleGenerateResponse(
+        success=False,
+        message=result["message"],
+        matches_scheduled=0,
+        conflicts=result.get("conflicts", []),
+        solver_stats=result.get("solver_stats"),
+        feasibility=result.get("feasibility")
+    )
+
+
+def enqueue_schedule_job(db: Session, tournament_id: UUID,
+                         request: Optional[ScheduleGenerateRequest] = None) -> ScheduleJob:
+    """Record a queued job and hand it to the worker pool. Returns at once."""
+    job = ScheduleJob(
+        tournament_id=tournament_id,
+        status=JobStatus.QUEUED,
+        request=request.model_dump(mode="json") if request else None,
+        progress={"phase": "queued"}
+    )
+    db.add(job)
+    db.commit()
+
+    run_schedule_job_task.delay(str(job.id))
+
+    # In eager mode the task has already run on another session
+    db.refresh(job)
+    logger.info(f"📥 Schedule job {job.id} enqueued for tournament {tournament_id}")
+    return job
+
+
+def _job_progress_listener(db: Session, job: ScheduleJob, token: CancellationToken) -> Callable[[Dict], bool]:
+    """
+    Solver progress listener for a job: records the latest solution on the row and
+    returns True once the client has asked to stop, at most every PROGRESS_WRITE_INTERVAL_SECONDS.
+    A cancel recorded on the row cancels the token.
+    """
+    job_id = job.id
+    last_write = None
+
+    def listener(event: Dict) -> bool:
+        nonlocal last_write
+        now = time.monotonic()
+        if last_write is not None and now - last_write < PROGRESS_WRITE_INTERVAL_SECONDS:
+            return False
+        last_write = now
+
+        db.query(ScheduleJob).filter(ScheduleJob.id == job_id).update(
+            {ScheduleJob.progress: {"phase": "solving", **event}}, synchronize_session=False
+        )
+        db.commit()
+        stop_requested, cancel_requested = db.query(
+            ScheduleJob.stop_requested, ScheduleJob.cancel_requested
+        ).filter(ScheduleJob.id == job_id).one()
+        if cancel_requested:
+            token.cancel()
+        return bool(stop_requested)
+
+    return listener
+
+
+class _JobFlagMonitor(threading.Thread):
+    """
+    Worker-side watcher that polls the job row for a cancel or stop recorded by the API
+    process and forwards it to the solve's token, so it also lands while no solution arrives.
+    """
+
+    def __init__(self, job_id: UUID, token: CancellationToken):
+        super().__init__(name=f"schedule-job-{job_id}-flags", daemon=True)
+        self.job_id = job_id
+        self.token = token
+        self._finished = threading.Event()
+
+    def run(self) -> None:
+        while not self._finished.wait(FLAG_POLL_INTERVAL_SECONDS):
+            self.check()
+
+    def check(self) -> None:
+        db = SessionLocal()
+        try:
+            flags = db.query(ScheduleJob.stop_requested, ScheduleJob.cancel_requested).filter(
+                ScheduleJob.id == self.job_id
+            ).first()
+        finally:
+            db.close()
+        if flags and flags.cancel_requested:
+            self.token.cancel()
+        elif flags and flags.stop_requested:
+            self.token.request_stop()
+
+    def finish(self) -> None:
+        self._finished.set()
+
+
+def run_schedule_job(db: Session, job_id: UUID) -> Optional[ScheduleJob]:
+    """Run a queued job to completion, recording its progress and result on the row."""
+    job = db.query(ScheduleJob).filter(ScheduleJob.id == job_id).first()
+    if not job:
+        logger.warning(f"Schedule job {job_id} not found")
+        return None
+    if job.status == JobStatus.CANCELLED:
+        logger.info(f"Schedule job {job_id} was cancelled before it started")
+        return job
+
+    job.status = JobStatus.RUNNING
+    job.started_at = datetime.utcnow()
+    job.progress = {"phase": "solving"}
+    db.commit()
+
+    token = cancellation_registry.register(str(job.id), tournament_id=str(job.tournament_id))
+    # In eager mode the API cancels through the registry itself; a worker process needs the row
+    monitor = None if celery_app.conf.task_always_eager else _JobFlagMonitor(job.id, token)
+    if monitor:
+        monitor.start()
+
+    try:
+        request = ScheduleGenerateRequest(**job.request) if job.request else None
+        result = generate_tournament_schedule(
+            db, str(job.tournament_id), request,
+            progress_listener=_job_progress_listener(db, job, token), cancel_token=token
+        )
+        job.result = schedule_response(result).model_dump(mode="json")
+        job.status = JobStatus.CANCELLED if result.get("cancelled") else JobStatus.COMPLETED
+    except Exception as e:
+        logger.error(f"Schedule job {job_id} failed: {str(e)}", exc_info=True)
+        db.rollback()
+        job.status = JobStatus.FAILED
+        job.error = str(e)
+    finally:
+        if monitor:
+            monitor.finish()
+        cancellation_registry.unregister(str(job.id))
+
+    # Keep the last solution the listener recorded
+    job.progress = {**(job.progress or {}), "phase": "finished"}
+    job.finished_at = datetime.utcnow()
+    db.commit()
+
+    logger.info(f"Schedule job {job_id} {job.status.value}")
+    return job
+
+
+def request_job_stop(db: Session, job: ScheduleJob) -> ScheduleJob:
+    """Ask a running job to keep its best solution so far and stop searching."""
+    job.stop_requested = True
+    db.commit()
+    cancellation_registry.request_stop(str(job.id))
+    db.refresh(job)
+    logger.info(f"Schedule job {job.id}: stop requested, keeping the current best solution")
+    return job
+
+
+def cancel_job(db: Session, job: ScheduleJob) -> ScheduleJob:
+    """
+    Cancel a queued or running job. A queued job is finished at once; a running
+    solve stops at its next check and its result is discarded.
+    """
+    job.cancel_requested = True
+    if job.status == JobStatus.QUEUED:
+        job.status = JobStatus.CANCELLED
+        job.progress = {**(job.progress or {}), "phase": "finished"}
+        job.finished_at = datetime.utcnow()
+    db.commit()
+    cancellation_registry.cancel(str(job.id))
+    db.refresh(job)
+    logger.info(f"🛑 Schedule job {job.id}: cancellation requested")
+    return job
+
+
+def _cancel_abandoned_job(job_id: UUID) -> None:
+    """Cancel a job whose event stream lost its client, unless it has already finished."""
+    db = SessionLocal()
+    try:
+        job = db.query(ScheduleJob).filter(ScheduleJob.id == job_id).first()
+        if job and job.status not in FINISHED_JOB_STATUSES:
+            logger.info(f"Schedule job {job_id}: event stream client disconnected")
+            cancel_job(db, job)
+    finally:
+        db.close()
+
+
+def _read_job_events_state(job_id: UUID) -> Optional[Tuple[Dict, bool, Optional[Dict]]]:
+    """A job's progress, whether it has finished and, once it has, the whole job. None if it is gone."""
+    db = SessionLocal()
+    try:
+        job = db.query(ScheduleJob).filter(ScheduleJob.id == job_id).first()
+        if not job:
+            return None
+        finished = job.status in FINISHED_JOB_STATUSES
+        payload = ScheduleJobSchema.model_validate(job).model_dump(mode="json") if finished else None
+        return job.progress or {}, finished, payload
+    finally:
+        db.close()
+
+
+async def iter_job_events(job_id: UUID, cancel_on_disconnect: bool = False) -> AsyncIterator[str]:
+    """
+    Server-Sent Events for a job: a "progress" event whenever its progress changes and
+    a final "done" event carrying the whole job once it has finished.
+    With cancel_on_disconnect, a client that goes away before then cancels the job.
+    Database reads run in the threadpool so polling never blocks the event loop.
+    """
+    last_progress = None
+    last_sent = time.monotonic()
+    finished = False
+    try:
+        while True:
+            state = await run_in_threadpool(_read_job_events_state, job_id)
+            if state is None:
+                finished = True
+                return
+            progress, finished, payload = state
+
+            if progress != last_progress:
+                last_progress = progress
+                last_sent = time.monotonic()
+                yield f"event: progress\ndata: {json.dumps(progress)}\n\n"
+            if finished:
+                yield f"event: done\ndata: {json.dumps(payload)}\n\n"
+                return
+            if time.monotonic() - last_sent >= EVENT_HEARTBEAT_SECONDS:
+                last_sent = time.monotonic()
+                yield ": keep-alive\n\n"
+
+            await asyncio.sleep(EVENT_POLL_INTERVAL_SECONDS)
+    finally:
+        # Starlette closes the generator when the client disconnects mid-stream; shield the
+        # cancellation from the disconnect, which would otherwise interrupt the await
+        if cancel_on_disconnect and not finished:
+            with CancelScope(shield=True):
+                await run_in_threadpool(_cancel_abandoned_job, job_id)
+
+
+@celery_app.task(name="schedule.generate")
+def run_schedule_job_task(job_id: str) -> None:
+    """Celery entry point: run the job on a fresh database session."""
+    db = SessionLocal()
+    try:
+        run_schedule_job(db, UUID(job_id))
+    finally:
+        db.close()
@@ -0,0 +1,222 @@
+"""
+LARGE NEIGHBOURHOOD SEARCH - Improves a CP-SAT incumbent under a wall-clock budget.
+Each iteration fixes every match outside a neighbourhood to its incumbent cell
+and re-solves the model with a short time limit, hinted with the incumbent:
+  days    a random window of consecutive days
+  teams   a random subset of teams (every match either of them plays)
+  venue   one random venue
+The neighbourhood grows when it was searched exhaustively without improving and
+shrinks when its solve timed out, so the loop keeps finding moves instead of
+stalling. With several workers, each round solves one neighbourhood per worker
+process and keeps the best improvement.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+import multiprocessing
+import time
+
+import numpy as np
+from ortools.sat.python import cp_model
+from ortools.sat import cp_model_pb2
+
+logger = logging.getLogger(__name__)
+
+NEIGHBOURHOODS = ("days", "teams", "venue")
+NEIGHBOURHOOD_MAX_TIME_SECONDS = 2.0
+# Share of the matches freed by the first neighbourhoods, and the bounds of its adaptation
+INITIAL_FRACTION = 0.2
+MIN_FRACTION, MAX_FRACTION = 0.05, 0.8
+GROW, SHRINK = 1.25, 0.8
+
+_worker_model: Optional[cp_model_pb2.CpModelProto] = None
+
+
+def choose_neighbourhood(kind: str, rng: np.random.Generator, assignments: np.ndarray,
+                         match_pairs: np.ndarray, slot_day: np.ndarray, num_teams: int,
+                         num_venues: int, fraction: float) -> np.ndarray:
+    """Bool mask of the matches a neighbourhood frees, sized to about fraction of all matches."""
+    slots, venues = assignments[:, 0], assignments[:, 1]
+    if kind == "days":
+        days = slot_day[slots]
+        first_day, last_day = int(days.min()), int(days.max())
+        width = max(1, int(round((last_day - first_day + 1) * fraction)))
+        start = int(rng.integers(first_day, max(first_day, last_day - width + 1) + 1))
+        return (days >= start) & (days < start + width)
+    if kind == "teams":
+        # k of n teams free 1 - (1 - k/n)^2 of the matches
+        k = min(num_teams, max(2, int(round(num_teams * (1 - np.sqrt(1 - fraction))))))
+        chosen = rng.choice(num_teams, size=k, replace=False)
+        return np.isin(match_pairs, chosen).any(axis=1)
+    if kind == "venue":
+        return venues == int(rng.integers(num_venues))
+    raise ValueError(f"Unknown neighbourhood: {kind}")
+
+
+def solve_neighbourhood(model: cp_model_pb2.CpModelProto, task: Dict) -> Dict:
+    """
+    Solve model with the task["ones"] variables fixed to 1, task["zeros"] to 0 and the hint
+    task["hint"] ({index: value}). Returns the status, objective and solution vector (None without one).
+    """
+    neighbourhood = cp_model.CpModel()
+    proto = neighbourhood.Proto()
+    proto.CopyFrom(model)
+    for value, indices in ((1, task["ones"]), (0, task["zeros"])):
+        for index in indices:
+            del proto.variables[index].domain[:]
+            proto.variables[index].domain.extend([value, value])
+    proto.ClearField("solution_hint")
+    proto.solution_hint.vars.extend(task["hint"].keys())
+    proto.solution_hint.values.extend(task["hint"].values())
+
+    solver = cp_model.CpSolver()
+    solver.parameters.num_workers = 1
+    solver.parameters.max_time_in_seconds = task["max_time_in_seconds"]
+    solver.parameters.random_seed = task["random_seed"]
+    solver.parameters.linearization_level = task["linearization_level"]
+    status = solver.Solve(neighbourhood)
+    found = status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+    return {
+        "kind": task.get("kind"),
+        "status": status,
+        "objective": solver.ObjectiveValue() if found else None,
+        "solution": list(solver.ResponseProto().solution) if found else None,
+    }
+
+
+def _init_worker(model_bytes: bytes) -> None:
+    global _worker_model
+    _worker_model = cp_model_pb2.CpModelProto.FromString(model_bytes)
+
+
+def _solve_in_worker(task: Dict) -> Dict:
+    return solve_neighbourhood(_worker_model, task)
+
+
+class LargeNeighbourhoodSearch:
+    """
+    LNS over a built model whose cell literals are given as (match, slot, venue, variable index).
+    The incumbent is a full solution vector, so every neighbourhood is hinted with a complete
+    feasible assignment. Every literal of a fixed match is fixed, not just its chosen cell,
+    which leaves presolve far less to deduce on big models.
+    """
+
+    def __init__(self, model: cp_model_pb2.CpModelProto, cell_literals: List[Tuple[int, int, int, int]],
+                 match_pairs: List[Tuple[int, int]], slot_day: np.ndarray, num_teams: int, num_venues: int,
+                 num_workers: int = 1, random_seed: int = 0, linearization_level: int = 1):
+        self.model = model
+        cells = np.asarray(cell_literals, dtype=np.int64).reshape(-1, 4)
+        self.cell_match, self.cell_slot, self.cell_venue, self.cell_index = cells.T
+        self.index_of = {(int(m), int(s), int(v)): int(i) for m, s, v, i in cells}
+        self.match_pairs = np.asarray(match_pairs, dtype=np.int64).reshape(-1, 2)
+        self.slot_day = slot_day
+        self.num_teams = num_teams
+        self.num_venues = num_venues
+        self.num_workers = max(1, num_workers)
+        self.random_seed = random_seed
+        self.linearization_level = linearization_level
+        self.kinds = [kind for kind in NEIGHBOURHOODS if kind != "venue" or num_venues > 1]
+
+    def assignments_of(self, solution: List[int]) -> List[Tuple[int, int]]:
+        """The (slot, venue) of every match in a solution vector."""
+        chosen = np.asarray(solution, dtype=np.int64)[self.cell_index] == 1
+        assignments = [None] * len(self.match_pairs)
+        for m, s, v in zip(self.cell_match[chosen], self.cell_slot[chosen], self.cell_venue[chosen]):
+            assignments[int(m)] = (int(s), int(v))
+        return assignments
+
+    def _task(self, kind: Optional[str], free: np.ndarray, assignments: List[Tuple[int, int]],
+              hint: Dict[int, int], max_time: float, seed: int) -> Dict:
+        positions = np.asarray(assignments, dtype=np.int64).reshape(-1, 2)
+        chosen = ((positions[self.cell_match, 0] == self.cell_slot)
+                  & (positions[self.cell_match, 1] == self.cell_venue))
+        fixed = ~free[self.cell_match]
+        # Fixed matches keep their cell; free ones cannot take a cell a fixed match holds
+        held = np.zeros((int(self.cell_slot.max()) + 1, self.num_venues), dtype=bool)
+        held[positions[~free, 0], positions[~free, 1]] = True
+        zeros = (fixed & ~chosen) | (~fixed & held[self.cell_slot, self.cell_venue])
+        return {"kind": kind, "ones": self.cell_index[fixed & chosen].tolist(),
+                "zeros": self.cell_index[zeros].tolist(), "hint": hint, "max_time_in_seconds": max_time,
+                "random_seed": seed, "linearization_level": self.linearization_level}
+
+    def evaluate(self, assignments: List[Tuple[int, int]], max_time: float) -> Optional[Dict]:
+        """
+        Complete a schedule found outside CP-SAT (e.g. by local search) into a solution vector
+        with all matches fixed. Returns None if the model rejects it.
+        """
+        if any((m, s, v) not in self.index_of for m, (s, v) in enumerate(assignments)):
+            return None
+        hint = {int(i): int(assignments[m] == (s, v))
+                for m, s, v, i in zip(self.cell_match, self.cell_slot, self.cell_venue, self.cell_index)}
+        free = np.zeros(len(assignments), dtype=bool)
+        result = solve_neighbourhood(self.model, self._task(None, free, assignments, hint, max_time, self.random_seed))
+        return result if result["solution"] is not None else None
+
+    def run(self, solution: List[int], objective: float, time_budget: float, best_bound: Optional[float] = None,
+            should_stop: Optional[Callable[[], bool]] = None,
+            on_improvement: Optional[Callable[[Dict], bool]] = None) -> Dict:
+        """
+        Improve the incumbent until the budget runs out, should_stop() turns true, the objective
+        reaches best_bound or on_improvement returns True.
+        Returns the best solution vector, its objective and assignments, and iteration counts.
+        """
+        started = time.perf_counter()
+        rng = np.random.default_rng(self.random_seed)
+        assignments = self.assignments_of(solution)
+        fraction = INITIAL_FRACTION
+        stats = {"iterations": 0, "improvements": 0, "workers": self.num_workers,
+                 "improvements_by_neighbourhood": {kind: 0 for kind in self.kinds}}
+        proven = best_bound is not None and objective <= best_bound
+        pool = None
+        if self.num_workers > 1:
+            # spawn: the API serves jobs from threads, which fork would copy mid-flight
+            pool = ProcessPoolExecutor(max_workers=self.num_workers, mp_context=multiprocessing.get_context("spawn"),
+                                       initializer=_init_worker, initargs=(self.model.SerializeToString(),))
+        logger.info(f"🔁 LNS: improving objective {objective:g} for {time_budget:.1f}s with {self.num_workers} worker(s)")
+        try:
+            while not proven:
+                remaining = time_budget - (time.perf_counter() - started)
+                if remaining < 0.05 or (should_stop and should_stop()):
+                    break
+                max_time = min(NEIGHBOURHOOD_MAX_TIME_SECONDS, remaining)
+                hint = dict(enumerate(solution))
+                positions = np.asarray(assignments, dtype=np.int64)
+                tasks = []
+                for worker in range(self.num_workers):
+                    kind = self.kinds[(stats["iterations"] + worker) % len(self.kinds)]
+                    free = choose_neighbourhood(kind, rng, positions, self.match_pairs, self.slot_day,
+                                                self.num_teams, self.num_venues, fraction)
+                    seed = self.random_seed + stats["iterations"] + worker
+                    tasks.append(self._task(kind, free, assignments, hint, max_time, seed))
+                if pool is not None:
+                    results = list(pool.map(_solve_in_worker, tasks))
+                else:
+                    results = [solve_neighbourhood(self.model, task) for task in tasks]
+                stats["iterations"] += len(tasks)
+
+                improved = [r for r in results if r["solution"] is not None and r["objective"] < objective]
+                if improved:
+                    best = min(improved, key=lambda r: r["objective"])
+                    solution, objective = best["solution"], best["objective"]
+                    assignments = self.assignments_of(solution)
+                    stats["improvements"] += 1
+                    stats["improvements_by_neighbourhood"][best["kind"]] += 1
+                    proven = best_bound is not None and objective <= best_bound
+                    event = {"objective": objective, "best_bound": best_bound, "neighbourhood": best["kind"],
+                             "elapsed": round(time.perf_counter() - started, 3)}
+                    if on_improvement and on_improvement(event):
+                        break
+                elif all(r["status"] in (cp_model.OPTIMAL, cp_model.INFEASIBLE) for r in results):
+                    # Searched to the end without a better schedule: look further afield
+                    fraction = min(MAX_FRACTION, fraction * GROW)
+                else:
+                    fraction = max(MIN_FRACTION, fraction * SHRINK)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        stats["proven_optimal"] = proven
+        logger.info(f"🔁 LNS: {stats['improvements']} improvement(s) in {stats['iterations']} neighbourhoods, "
+                    f"objective {objective:g}")
+        return {"solution": solution, "objective": objective, "assignments": assignments, "stats": stats}
@@ -0,0 +1,193 @@
+"""
+GREEDY + TABU LOCAL SEARCH - Pure-Python scheduling without CP-SAT.
+Works on integer team/slot/venue indices with NumPy occupancy arrays and
+enforces the same rules as CricketScheduler._validate_solution: no team
+clash, no venue double-booking and min_rest_slots between a team's matches.
+"""
+
+from typing import Callable, List, Tuple, Optional
+import logging
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIME_LIMIT_SECONDS = 5.0
+TABU_TENURE = 10
+
+
+class _Schedule:
+    """Mutable partial schedule with incremental occupancy counts."""
+
+    def __init__(self, match_pairs: List[Tuple[int, int]], num_teams: int, num_slots: int,
+                 num_venues: int, min_rest_slots: int, cell_open: Optional[np.ndarray] = None,
+                 team_slot_open: Optional[np.ndarray] = None, match_venue_open: Optional[np.ndarray] = None):
+        self.pairs = np.array(match_pairs, dtype=np.int64).reshape(-1, 2)
+        self.num_slots = num_slots
+        self.num_venues = num_venues
+        self.rest = min_rest_slots
+        self.cell_open = np.ones((num_slots, num_venues), dtype=bool) if cell_open is None else cell_open
+        # closed[t, s] = team t may never play in slot s (e.g. resting around a frozen match)
+        self.closed = np.zeros((num_teams, num_slots), dtype=bool) if team_slot_open is None else ~team_slot_open
+        # match_venue_open[m, v] = match m may be played at venue v; matches share a few distinct masks
+        self.match_venue_open = match_venue_open
+        if match_venue_open is not None:
+            self.venue_masks, self.venue_mask_of = np.unique(match_venue_open, axis=0, return_inverse=True)
+            self.venue_mask_of = self.venue_mask_of.ravel()
+
+        # blocked[t, s] = number of team t's matches within min_rest_slots of slot s
+        self.blocked = np.zeros((num_teams, num_slots), dtype=np.int32)
+        # venue_match[s, v] = match played at (s, v), or -1
+        self.venue_match = np.full((num_slots, num_venues), -1, dtype=np.int64)
+        # Closed cells count as permanently used
+        self.fixed_load = (~self.cell_open).sum(axis=1).astype(np.int32)
+        self.venue_load = self.fixed_load.copy()
+        self.slot = np.full(len(match_pairs), -1, dtype=np.int64)
+        self.venue = np.full(len(match_pairs), -1, dtype=np.int64)
+
+    def _window(self, s: int) -> slice:
+        return slice(max(0, s - self.rest), min(self.num_slots, s + self.rest + 1))
+
+    def free_venues(self, matches) -> np.ndarray:
+        """For each of the given matches, the slots with a free venue it may use (matches × slots)."""
+        if self.match_venue_open is None:
+            return np.broadcast_to(self.venue_load < self.num_venues, (len(matches), self.num_slots))
+        free = (self.venue_match == -1) & self.cell_open
+        free_by_mask = (free[None, :, :] & self.venue_masks[:, None, :]).any(axis=2)
+        return free_by_mask[self.venue_mask_of[matches]]
+
+    def feasible_slots(self, m: int) -> np.ndarray:
+        t1, t2 = self.pairs[m]
+        return ((self.blocked[t1] == 0) & (self.blocked[t2] == 0) & ~self.closed[t1] & ~self.closed[t2]
+                & self.free_venues([m])[0])
+
+    def place(self, m: int, s: int) -> None:
+        usable = (self.venue_match[s] == -1) & self.cell_open[s]
+        if self.match_venue_open is not None:
+            usable &= self.match_venue_open[m]
+        v = int(np.flatnonzero(usable)[0])
+        self.slot[m], self.venue[m] = s, v
+        self.venue_match[s, v] = m
+        self.venue_load[s] += 1
+        for t in self.pairs[m]:
+            self.blocked[t, self._window(s)] += 1
+
+    def remove(self, m: int) -> None:
+        s, v = int(self.slot[m]), int(self.venue[m])
+        self.venue_match[s, v] = -1
+        self.venue_load[s] -= 1
+        for t in self.pairs[m]:
+            self.blocked[t, self._window(s)] -= 1
+        self.slot[m] = self.venue[m] = -1
+
+    def conflicts_at(self, m: int, s: int) -> List[int]:
+        """Placed matches that must be ejected to place match m at slot s."""
+        t1, t2 = self.pairs[m]
+        window = self._window(s)
+        placed = np.flatnonzero(self.slot >= 0)
+        in_window = placed[(self.slot[placed] >= window.start) & (self.slot[placed] < window.stop)]
+        involved = in_window[np.isin(self.pairs[in_window], (t1, t2)).any(axis=1)]
+        ejected = set(int(x) for x in involved)
+
+        # If no usable venue is left after removing team conflicts, free one venue too
+        allowed = self.cell_open[s] if self.match_venue_open is None else self.cell_open[s] & self.match_venue_open[m]
+        occupants = self.venue_match[s][allowed]
+        if all(x >= 0 and x not in ejected for x in occupants):
+            ejected.add(int(occupants[0]))
+        return sorted(ejected)
+
+
+def greedy_local_search(match_pairs: List[Tuple[int, int]], num_teams: int, num_slots: int,
+                        num_venues: int, min_rest_slots: int,
+                        time_limit: float = DEFAULT_TIME_LIMIT_SECONDS,
+                        seed: int = 0, cell_open: Optional[np.ndarray] = None,
+                        team_slot_open: Optional[np.ndarray] = None,
+                        should_stop: Optional[Callable[[], bool]] = None,
+                        match_venue_open: Optional[np.ndarray] = None) -> Optional[List[Tuple[int, int]]]:
+    """
+    Assign a (slot, venue) to every match without a constraint solver.
+
+    Phase 1 is a greedy construction: the unplaced match with the fewest feasible
+    slots goes first (ties broken by the busier teams) and takes its earliest slot.
+    Phase 2 is a tabu ejection search for whatever is left: a match is forced into
+    the slot with the fewest conflicts, the conflicting matches go back to the
+    queue, and they may not return to the slot they lost for TABU_TENURE moves.
+
+    cell_open (slots × venues) and team_slot_open (teams × slots) close cells that
+    are taken by matches outside the search, as in incremental rescheduling.
+    match_venue_open (matches × venues) limits the venues each match may use.
+    should_stop is polled between repair moves; once it returns True the search gives up.
+
+    Returns one (slot, venue) per match, or None if time runs out or the search is stopped.
+    """
+    started = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    schedule = _Schedule(match_pairs, num_teams, num_slots, num_venues, min_rest_slots,
+                         cell_open, team_slot_open, match_venue_open)
+    num_matches = len(match_pairs)
+    if num_matches == 0:
+        return []
+
+    team_load = np.bincount(schedule.pairs.ravel(), minlength=num_teams)
+    match_load = team_load[schedule.pairs].sum(axis=1)
+
+    # PHASE 1: Most-constrained-first greedy construction
+    unplaced = list(range(num_matches))
+    stuck = []
+    while unplaced:
+        t1s, t2s = schedule.pairs[unplaced, 0], schedule.pairs[unplaced, 1]
+        feasible = ((schedule.blocked[t1s] == 0) & (schedule.blocked[t2s] == 0)
+                    & ~schedule.closed[t1s] & ~schedule.closed[t2s]
+                    & schedule.free_venues(unplaced))
+        options = feasible.sum(axis=1)
+        pick = int(np.lexsort((-match_load[unplaced], options))[0])
+        m = unplaced.pop(pick)
+        if options[pick] == 0:
+            stuck.append(m)
+            continue
+        schedule.place(m, int(np.flatnonzero(feasible[pick])[0]))
+
+    logger.info(f"Greedy construction placed {num_matches - len(stuck)}/{num_matches} matches")
+
+    # PHASE 2: Tabu ejection search for the matches greedy could not place
+    tabu = np.zeros((num_matches, num_slots), dtype=np.int64)
+    iteration = 0
+    while stuck:
+        if time.perf_counter() - started > time_limit:
+            logger.warning(f"Local search stopped after {iteration} moves with {len(stuck)} matches unplaced")
+            return None
+        if should_stop and should_stop():
+            logger.info(f"Local search cancelled after {iteration} moves")
+            return None
+        iteration += 1
+        m = stuck.pop(0)
+
+        feasible = schedule.feasible_slots(m)
+        if feasible.any():
+            schedule.place(m, int(np.flatnonzero(feasible)[0]))
+            continue
+
+        t1, t2 = schedule.pairs[m]
+        cost = (schedule.blocked[t1] + schedule.blocked[t2]
+                + ~schedule.free_venues([m])[0]).astype(np.float64)
+        cost[tabu[m] > iteration] = np.inf
+        never_open = (schedule.fixed_load >= num_venues if schedule.match_venue_open is None
+                      else ~(schedule.cell_open & schedule.match_venue_open[m]).any(axis=1))
+        cost[schedule.closed[t1] | schedule.closed[t2] | never_open] = np.inf
+        cost += rng.random(num_slots) * 0.5
+        s = int(np.argmin(cost))
+        if not np.isfinite(cost[s]):
+            stuck.append(m)
+            continue
+
+        for ejected in schedule.conflicts_at(m, s):
+            tabu[ejected, schedule.slot[ejected]] = iteration + TABU_TENURE
+            schedule.remove(ejected)
+            stuck.append(ejected)
+        schedule.place(m, s)
+
+    logger.info(
+        f"Local search finished in {time.perf_counter() - started:.3f}s after {iteration} repair moves"
+    )
+    return [(int(schedule.slot[m]), int(schedule.venue[m])) for m in range(num_matches)]
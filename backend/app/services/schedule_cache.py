@@ -0,0 +1,179 @@
+"""
+SCHEDULE CACHE - Content-addressed cache of solved schedules.
+The key is a SHA-256 of everything that drives the scheduler: team and venue
+ids (in the order the solver indexes them), tournament dates and slot settings,
+format, active scheduling constraints and the request options. Unchanged
+inputs therefore return the previous solution without another solve.
+Backends: in-process LRU, or Redis at REDIS_URL (shared by API and workers).
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+import copy
+import hashlib
+import json
+import logging
+import threading
+
+import redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached value layout or the solver's slot indexing changes
+CACHE_FORMAT_VERSION = 1
+
+
+def schedule_cache_key(tournament, teams: List, venues: List, constraints: List, options: Dict[str, Any]) -> str:
+    """Canonical hash of a scheduling problem."""
+    problem = {
+        "version": CACHE_FORMAT_VERSION,
+        "tournament": {
+            "start_date": tournament.start_date,
+            "end_date": tournament.end_date,
+            "format": tournament.format,
+            "slots_per_day": tournament.slots_per_day,
+            "match_duration_hours": tournament.match_duration_hours,
+            "min_rest_hours": tournament.min_rest_hours,
+        },
+        "teams": [{"id": team.id, "home_venue_id": team.home_venue_id} for team in teams],
+        "venues": [
+            {
+                "id": venue.id,
+                "latitude": venue.latitude,
+                "longitude": venue.longitude,
+                "available_slots": venue.available_slots or [],
+            }
+            for venue in venues
+        ],
+        "constraints": sorted(
+            (
+                {"type": c.constraint_type, "priority": c.priority, "parameters": c.parameters or {}}
+                for c in constraints
+            ),
+            key=lambda c: json.dumps(c, sort_keys=True, default=str)
+        ),
+        "options": options,
+    }
+    canonical = json.dumps(problem, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ScheduleCache:
+    """Cache interface: solved schedules by problem hash, least recently used evicted first."""
+
+    def get(self, key: str) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Dict) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class InMemoryScheduleCache(ScheduleCache):
+    """Per-process LRU cache."""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                return None
+            self._entries.move_to_end(key)
+            return copy.deepcopy(value)
+
+    def set(self, key: str, value: Dict) -> None:
+        with self._lock:
+            self._entries[key] = copy.deepcopy(value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisScheduleCache(ScheduleCache):
+    """
+    LRU cache in Redis, shared by every API process and worker.
+    Values are JSON strings; a sorted set scored by a use counter orders them for eviction.
+    Redis errors are logged and treated as misses, so an unreachable Redis never fails a solve.
+    """
+
+    def __init__(self, client, max_entries: int = 128, prefix: str = "schedule-cache"):
+        self.client = client
+        self.max_entries = max_entries
+        self.prefix = prefix
+        self._lru_key = f"{prefix}:lru"
+        self._clock_key = f"{prefix}:clock"
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self.prefix}:entry:{key}"
+
+    def _touch(self, key: str) -> None:
+        self.client.zadd(self._lru_key, {key: self.client.incr(self._clock_key)})
+
+    def get(self, key: str) -> Optional[Dict]:
+        try:
+            raw = self.client.get(self._entry_key(key))
+            if raw is None:
+                return None
+            self._touch(key)
+        except redis.RedisError as e:
+            logger.warning(f"Schedule cache read failed: {str(e)}")
+            return None
+        return json.loads(raw)
+
+    def set(self, key: str, value: Dict) -> None:
+        try:
+            self.client.set(self._entry_key(key), json.dumps(value, default=str))
+            self._touch(key)
+            overflow = self.client.zcard(self._lru_key) - self.max_entries
+            if overflow > 0:
+                evicted = [member for member, _ in self.client.zpopmin(self._lru_key, overflow)]
+                self.client.delete(*[self._entry_key(
+                    member.decode() if isinstance(member, bytes) else member
+                ) for member in evicted])
+        except redis.RedisError as e:
+            logger.warning(f"Schedule cache write failed: {str(e)}")
+
+    def clear(self) -> None:
+        members = self.client.zrange(self._lru_key, 0, -1)
+        keys = [self._entry_key(m.decode() if isinstance(m, bytes) else m) for m in members]
+        self.client.delete(self._lru_key, self._clock_key, *keys)
+
+
+_schedule_cache: Optional[ScheduleCache] = None
+_schedule_cache_lock = threading.Lock()
+
+
+def get_schedule_cache() -> Optional[ScheduleCache]:
+    """The process-wide cache chosen by SCHEDULE_CACHE_BACKEND, or None when caching is off."""
+    global _schedule_cache
+    backend = settings.SCHEDULE_CACHE_BACKEND
+    if backend == "none":
+        return None
+
+    with _schedule_cache_lock:
+        if _schedule_cache is None:
+            if backend == "memory":
+                _schedule_cache = InMemoryScheduleCache(settings.SCHEDULE_CACHE_MAX_ENTRIES)
+            elif backend == "redis":
+                _schedule_cache = RedisScheduleCache(
+                    redis.Redis.from_url(settings.REDIS_URL), settings.SCHEDULE_CACHE_MAX_ENTRIES
+                )
+            else:
+                raise ValueError(f"Unknown schedule cache backend: {backend}")
+            logger.info(f"Schedule cache: {backend} backend, {settings.SCHEDULE_CACHE_MAX_ENTRIES} entries")
+    return _schedule_cache
@@ -1,15 +1,136 @@
 from ortools.sat.python import cp_model
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Callable
 from sqlalchemy.orm import Session
 from uuid import UUID
+import bisect
 import logging
+import multiprocessing
+import os
+import time
 
-from app.models import Tournament, Team, Venue, Match, MatchStatus
-from app.schemas.schemas import ScheduleGenerateRequest
+import numpy as np
+
+from app.core.config import settings
+from app.models import Tournament, Match, MatchStatus
+from app.schemas.schemas import ScheduleGenerateRequest, SolverProfile
+from app.services.cancellation import CancellationToken
+from app.services.constraint_compiler import HARD_PRIORITY, compile_constraints
+from app.services.domain import (
+    Solution, generate_match_pairs, load_problem, min_rest_slots, save_solution, solution_records
+)
+from app.services.engines import engine_class, resolve_engine
+from app.services.fairness import BREAK_WEIGHT_HOURS, slot_start_hours, team_fairness
+from app.services.feasibility import analyze_feasibility
+from app.services.group_stage import partition_cells
+from app.services.lns import LargeNeighbourhoodSearch, solve_neighbourhood
+from app.services.local_search import greedy_local_search
+from app.services.schedule_cache import ScheduleCache, get_schedule_cache, schedule_cache_key
+from app.services.travel import travel_tables
+from app.services.venue_availability import venue_availability_matrix
 
 logger = logging.getLogger(__name__)
 
+# Incremental rescheduling: frozen matches keep their slot, open ones are re-solved
+FROZEN_MATCH_STATUSES = (MatchStatus.COMPLETED, MatchStatus.IN_PROGRESS)
+OPEN_MATCH_STATUSES = (MatchStatus.SCHEDULED, MatchStatus.POSTPONED)
+
+# Time limit of the single diagnostic solve run on INFEASIBLE
+DIAGNOSTIC_MAX_TIME_SECONDS = 10.0
+
+# Latency budgets: time limit and the relative optimality gap at which the solver may stop early
+LATENCY_BUDGETS = {
+    "fast": {"max_time_in_seconds": 2.0, "relative_gap_limit": 0.05},
+    "balanced": {"max_time_in_seconds": 10.0, "relative_gap_limit": 0.01},
+    "optimal": {"max_time_in_seconds": 120.0, "relative_gap_limit": 0.0},
+}
+
+# Share of the time limit the monolithic solve gets before large-neighbourhood search takes over
+LNS_INITIAL_SHARE = 0.3
+
+# Rolling horizon: each window may place this much more than an even share of the fixtures left,
+# and every fixture it places is worth this much per fixture its teams still have to play
+ROLLING_PACE_MARGIN = 1.5
+ROLLING_PLACEMENT_WEIGHT = 10_000
+# A window's model holds this many times its target in candidate fixtures, and per team this many
+# times the matches the team can fit into the window
+ROLLING_CANDIDATE_FACTOR = 2
+
+
+def configure_solver(solver: cp_model.CpSolver, profile: Optional[SolverProfile] = None,
+                     default_max_time: Optional[float] = None, latency_budget: Optional[str] = None) -> Dict:
+    """
+    Apply a solver profile: request values first, then the latency budget, then the SOLVER_* settings.
+    Returns the effective parameters.
+    """
+    profile = profile or SolverProfile()
+    if latency_budget and latency_budget not in LATENCY_BUDGETS:
+        raise ValueError(f"Unknown latency budget: {latency_budget}")
+    budget = LATENCY_BUDGETS.get(latency_budget, {})
+    params = {
+        "num_workers": profile.num_workers if profile.num_workers is not None else settings.SOLVER_NUM_WORKERS,
+        "linearization_level": (profile.linearization_level if profile.linearization_level is not None
+                                else settings.SOLVER_LINEARIZATION_LEVEL),
+        "random_seed": profile.random_seed if profile.random_seed is not None else settings.SOLVER_RANDOM_SEED,
+        "max_time_in_seconds": (profile.max_time_in_seconds or budget.get("max_time_in_seconds")
+                                or default_max_time or settings.SOLVER_MAX_TIME_SECONDS),
+        "relative_gap_limit": budget.get("relative_gap_limit", 0.0),
+    }
+    
+    solver.parameters.num_workers = params["num_workers"]
+    solver.parameters.linearization_level = params["linearization_level"]
+    solver.parameters.random_seed = params["random_seed"]
+    solver.parameters.max_time_in_seconds = params["max_time_in_seconds"]
+    solver.parameters.relative_gap_limit = params["relative_gap_limit"]
+    return params
+
+
+def collect_solver_stats(solver: cp_model.CpSolver, status: int, params: Dict) -> Dict:
+    """Summarize a finished CP-SAT solve for the API response."""
+    return {
+        "status": solver.StatusName(status),
+        # 0 lets CP-SAT run one worker per core
+        "num_workers": params["num_workers"] or os.cpu_count(),
+        "linearization_level": params["linearization_level"],
+        "random_seed": params["random_seed"],
+        "max_time_in_seconds": params["max_time_in_seconds"],
+        "relative_gap_limit": params["relative_gap_limit"],
+        "wall_time": round(solver.WallTime(), 3),
+        "user_time": round(solver.UserTime(), 3),
+        "num_branches": solver.NumBranches(),
+        "num_conflicts": solver.NumConflicts(),
+    }
+
+
+class SolutionProgressCallback(cp_model.CpSolverSolutionCallback):
+    """
+    Records every improving solution CP-SAT reports: objective, best bound and elapsed time.
+    Each event also goes to the listener; if it returns True the search stops and the
+    current best solution is kept.
+    """
+    
+    def __init__(self, listener: Optional[Callable[[Dict], bool]] = None, has_objective: bool = True):
+        super().__init__()
+        self.listener = listener
+        self.has_objective = has_objective
+        self.solutions = []
+        self.stopped_early = False
+    
+    def on_solution_callback(self):
+        event = {
+            "solutions": len(self.solutions) + 1,
+            "objective": self.ObjectiveValue() if self.has_objective else None,
+            "best_bound": self.BestObjectiveBound() if self.has_objective else None,
+            "elapsed": round(self.WallTime(), 3),
+        }
+        self.solutions.append(event)
+        
+        if self.listener and self.listener(event):
+            logger.info(f"⏹️  Search stopped early after {event['solutions']} solutions")
+            self.stopped_early = True
+            self.StopSearch()
+
 
 class CricketScheduler:
     """
@@ -17,130 +138,117 @@ class CricketScheduler:
     Uses Google OR-Tools CP-SAT solver to find optimal conflict-free schedules.
     """
     
+    # Registry name (app.services.engines) and the solved_by reported for its schedules
+    engine_name = "boolean"
+    solver_name = "cp-sat"
+    # Whether _solve can hand its incumbent to LargeNeighbourhoodSearch (needs one literal per cell)
+    supports_lns = True
+    # Whether _build_model can leave fixtures unplaced for a rolling-horizon window
+    supports_rolling_horizon = True
+    # Whether group-stage tournaments can be solved one group model at a time (needs one literal per cell)
+    supports_group_stage = True
+    
     def __init__(self, db: Session, tournament_id: str):
         self.db = db
         self.model = cp_model.CpModel()
         self.solver = cp_model.CpSolver()
         
-        # Load tournament data
-        # Ensure tournament_id is UUID for SQLAlchemy
-        self.tournament_id = UUID(tournament_id) if isinstance(tournament_id, str) else tournament_id
-        
-        self.tournament = db.query(Tournament).filter(Tournament.id == self.tournament_id).first()
-        if not self.tournament:
-            raise ValueError(f"Tournament {tournament_id} not found")
-        
-        self.teams = db.query(Team).filter(Team.tournament_id == self.tournament_id).all()
-        self.venues = db.query(Venue).filter(Venue.tournament_id == self.tournament_id).all()
-        
-        if len(self.teams) < 2:
-            raise ValueError("At least 2 teams required for scheduling")
-        if len(self.venues) < 1:
-            raise ValueError("At least 1 venue required for scheduling")
-        
+        # Tournament data, copied out of the session once: engines only read the spec
+        self.spec = load_problem(db, tournament_id)
+        self.tournament_id = self.spec.tournament.id
+        self.tournament = self.spec.tournament
+        self.teams = self.spec.teams
+        self.venues = self.spec.venues
         self.num_teams = len(self.teams)
         self.num_venues = len(self.venues)
         
-        # Calculate time slots
-        self.time_slots = self._calculate_time_slots()
+        # Per-solve options, set by generate_schedule before the model is built
+        self.request = None
+        self.objective_terms = []
+        self.solver_stats = None
+        self.solution_log = []
+        self.objective_value = None
+        # Boolean model: each match's (slot, variable) pairs, from the last _build_model
+        self.match_cells: Dict[int, List[Tuple[int, cp_model.IntVar]]] = {}
+        # (assignments,) once greedy + local search has run for this solve, shared by LNS and the fallback
+        self.local_search_result = None
+        # Rolling horizon: {"weights": per-fixture placement weight, "target": most fixtures to place}
+        self.horizon_window = None
+        # Group index per team for the groups format, None otherwise
+        self.team_group: Optional[np.ndarray] = None
+        self.current_assignments = {}
+        # Called with each improving solution; returning True accepts it and stops the search
+        self.progress_listener: Optional[Callable[[Dict], bool]] = None
+        # Cancelling it stops the running search and discards the result
+        self.cancel_token: Optional[CancellationToken] = None
+        self.existing_matches = []
+        self.saved_matches = {}
+        self.frozen_matches = []
+        self.feasibility_report = None
+        # Set while explaining infeasibility: cause -> assumption literal guarding its constraints
+        self.assumption_literals: Optional[Dict[str, cp_model.IntVar]] = None
+        
+        # Slot start times as datetimes, the form bisect and the records use
+        self.time_slots = self.spec.time_slots.tolist()
         self.num_slots = len(self.time_slots)
+        # slots × venues bitmap parsed from each venue's available_slots
+        self.venue_open = venue_availability_matrix(self.venues, self.time_slots,
+                                                    self.tournament.match_duration_hours)
+        self.slot_day = np.array([self._slot_day(s) for s in range(self.num_slots)], dtype=np.int64)
+        
+        # Active scheduling constraints, compiled into masks and penalties
+        self.compiled_constraints = compile_constraints(
+            self.spec.constraints, self.teams, self.venues, self.time_slots, self.tournament.match_duration_hours
+        )
+        self._reset_availability()
         
         logger.info(f"Initialized scheduler: {self.num_teams} teams, {self.num_venues} venues, {self.num_slots} slots")
     
-    def _calculate_time_slots(self) -> List[datetime]:
-        """Calculate all available time slots based on tournament dates and settings."""
-        slots = []
-        current_date = self.tournament.start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_date = self.tournament.end_date
-        
-        slots_per_day = self.tournament.slots_per_day
-        match_duration = self.tournament.match_duration_hours
-        
-        # Default slot start times (can be customized)
-        slot_hours = []
-        if slots_per_day == 1:
-            slot_hours = [14]  # 2 PM
-        elif slots_per_day == 2:
-            slot_hours = [10, 18]  # 10 AM, 6 PM
-        elif slots_per_day == 3:
-            slot_hours = [10, 14, 18]  # 10 AM, 2 PM, 6 PM
-        else:
-            # Distribute evenly from 9 AM to 9 PM
-            slot_hours = [9 + i * (12 // slots_per_day) for i in range(slots_per_day)]
-        
-        while current_date <= end_date:
-            for hour in slot_hours:
-                slot_time = current_date.replace(hour=hour)
-                if slot_time <= end_date:
-                    slots.append(slot_time)
-            current_date += timedelta(days=1)
-        
-        return slots
+    def _reset_availability(self):
+        """
+        Open every (slot, venue) cell and team slot that venue availability and the hard
+        scheduling constraints allow. cell_open[s, v] and team_slot_open[t, s] are the masks
+        all engines build their variables from; incremental mode closes the cells taken by
+        frozen matches. base_cell_open and base_team_slot_open leave the hard scheduling
+        constraints out, for the infeasibility diagnosis.
+        """
+        self.base_cell_open = self.venue_open.copy()
+        self.base_team_slot_open = np.ones_like(self.compiled_constraints.team_slot_open)
+        self.cell_open = self.venue_open & self.compiled_constraints.cell_open
+        self.team_slot_open = self.compiled_constraints.team_slot_open.copy()
+        self.frozen_matches = []
     
     def _generate_match_pairs(self) -> List[Tuple[int, int]]:
         """Generate all match pairs based on tournament format."""
-        pairs = []
-        
-        if self.tournament.format.value in ["round_robin", "league"]:
-            # Each team plays each other team once
-            for i in range(self.num_teams):
-                for j in range(i + 1, self.num_teams):
-                    pairs.append((i, j))
-        
-        elif self.tournament.format.value == "double_round_robin":
-            # Each team plays each other team twice (home and away)
-            for i in range(self.num_teams):
-                for j in range(self.num_teams):
-                    if i != j:
-                        pairs.append((i, j))
-        
-        elif self.tournament.format.value == "knockout":
-            # Simple knockout (single elimination)
-            # For hackathon, we'll do a simple bracket
-            num_matches = self.num_teams - 1
-            for i in range(num_matches):
-                # This is simplified; real knockout needs proper bracket logic
-                team1_idx = i % self.num_teams
-                team2_idx = (i + 1) % self.num_teams
-                if team1_idx != team2_idx:
-                    pairs.append((team1_idx, team2_idx))
-        
+        pairs, self.team_group = generate_match_pairs(self.spec)
         return pairs
     
-    def _validate_feasibility(self, num_matches: int) -> Tuple[bool, List[str]]:
+    def _validate_feasibility(self, match_pairs: List[Tuple[int, int]]) -> Tuple[bool, List[str]]:
         """
         Pre-validate if scheduling is feasible before running the solver.
         Returns (is_feasible, list_of_issues)
         """
         issues = []
+        num_matches = len(match_pairs)
+        open_cells = max(1, int(self.cell_open.sum()))
         
-        # Check 1: Enough time slots for all matches
-        if num_matches > self.num_slots * self.num_venues:
+        # Checks 1 + 2: Counting and flow bounds that prove infeasibility without a solve
+        self.feasibility_report = analyze_feasibility(
+            match_pairs, self.cell_open, self.team_slot_open, self._min_rest_slots() + 1,
+            self.slot_day, self.tournament.slots_per_day, team_names=[team.name for team in self.teams]
+        )
+        issues.extend(self.feasibility_report["reasons"])
+        extra_days = self.feasibility_report["extra_days_needed"]
+        extra_venues = self.feasibility_report["extra_venues_needed"]
+        if extra_days:
             issues.append(
-                f"Not enough time slots: {num_matches} matches need {num_matches} slots, "
-                f"but only {self.num_slots * self.num_venues} available "
-                f"({self.num_slots} slots × {self.num_venues} venues)"
+                f"💡 Solution: Extend the tournament by at least {extra_days} day(s), "
+                f"to {(self.tournament.end_date + timedelta(days=extra_days)).date()}"
             )
-            issues.append(f"💡 Solution: Extend tournament to {self.tournament.end_date + timedelta(days=2)} or add more venues")
-        
-        # Check 2: Minimum slots needed considering rest periods
-        min_rest_slots = max(1, self.tournament.min_rest_hours // self.tournament.match_duration_hours)
-        matches_per_team = {}
-        match_pairs = self._generate_match_pairs()
-        
-        for t1, t2 in match_pairs:
-            matches_per_team[t1] = matches_per_team.get(t1, 0) + 1
-            matches_per_team[t2] = matches_per_team.get(t2, 0) + 1
-        
-        max_team_matches = max(matches_per_team.values()) if matches_per_team else 0
-        min_slots_needed = max_team_matches * (1 + min_rest_slots)
-        
-        if min_slots_needed > self.num_slots:
-            issues.append(
-                f"Rest period too strict: Teams need {min_slots_needed} slots with {self.tournament.min_rest_hours}h rest, "
-                f"but only {self.num_slots} available"
-            )
-            issues.append(f"💡 Solution: Reduce rest period to {self.tournament.match_duration_hours * 2}h or extend tournament")
+        if extra_venues:
+            issues.append(f"💡 Solution: Add at least {extra_venues} more venue(s)")
+        if self.feasibility_report["reasons"] and not (extra_days or extra_venues):
+            issues.append(f"💡 Solution: Reduce the {self.tournament.min_rest_hours}h rest period or free up team availability")
         
         # Check 3: At least 2 teams and 1 venue (already checked in __init__, but double-check)
         if self.num_teams < 2:
@@ -150,7 +258,7 @@ class CricketScheduler:
             issues.append("Need at least 1 venue for matches")
         
         # Check 4: Warn if very tight constraints
-        utilization = (num_matches / (self.num_slots * self.num_venues)) * 100
+        utilization = (num_matches / open_cells) * 100
         if utilization > 80:
             issues.append(
                 f"⚠️  Warning: High utilization ({utilization:.1f}%) - schedule may be very tight"
@@ -159,141 +267,607 @@ class CricketScheduler:
         return (len(issues) == 0 or all('Warning' in issue or '💡' in issue for issue in issues), issues)
 
     
+    def _slot_day(self, slot_index: int) -> int:
+        """Day offset of a time slot from the first day of the tournament."""
+        return (self.time_slots[slot_index].date() - self.time_slots[0].date()).days
+    
+    def _objective_lower_bounds(self, match_pairs: List[Tuple[int, int]]) -> Tuple[int, int]:
+        """
+        Provable lower bounds for the compactness objectives.
+        Returns (min_last_slot, min_match_days) so CP-SAT can prove OPTIMAL early.
+        """
+        num_matches = len(match_pairs)
+        rest_window = self._min_rest_slots() + 1
+        slots_per_day = self.tournament.slots_per_day
+        
+        matches_per_team = [0] * self.num_teams
+        for t1, t2 in match_pairs:
+            matches_per_team[t1] += 1
+            matches_per_team[t2] += 1
+        max_team_matches = max(matches_per_team)
+        
+        # A slot holds at most one match per venue and every match uses two teams
+        matches_per_slot = max(1, min(self.num_venues, self.num_teams // 2))
+        slots_needed = -(-num_matches // matches_per_slot)
+        
+        # The busiest teams need a full rest window between consecutive matches, and
+        # only 2 * matches_per_slot of them can play their first match in any one slot
+        busiest_teams = matches_per_team.count(max_team_matches)
+        latest_first_slot = (busiest_teams - 1) // (2 * matches_per_slot)
+        min_last_slot = max(slots_needed - 1, latest_first_slot + (max_team_matches - 1) * rest_window)
+        
+        team_matches_per_day = -(-slots_per_day // rest_window)
+        min_match_days = max(
+            -(-num_matches // (matches_per_slot * slots_per_day)),
+            -(-max_team_matches // team_matches_per_day)
+        )
+        
+        return min(min_last_slot, self.num_slots - 1), min_match_days
+    
+    def _assumption(self, cause: str):
+        """
+        While explaining infeasibility, the assumption literal guarding every constraint
+        behind cause (created on first use). None during a normal solve.
+        """
+        if self.assumption_literals is None:
+            return None
+        if cause not in self.assumption_literals:
+            self.assumption_literals[cause] = self.model.NewBoolVar(f'assume_{len(self.assumption_literals)}')
+        return self.assumption_literals[cause]
+    
+    def _guard(self, constraint, cause: str) -> None:
+        """Make constraint conditional on cause's assumption literal while explaining infeasibility."""
+        literal = self._assumption(cause)
+        if literal is not None:
+            constraint.OnlyEnforceIf(literal)
+    
+    def _explain_infeasibility(self, match_pairs: List[Tuple[int, int]]) -> Optional[List[str]]:
+        """
+        Diagnostic run of the boolean model with every constraint family, and every hard
+        scheduling constraint row, behind an assumption literal. CP-SAT's SufficientAssumptionsForInfeasibility gives a
+        conflicting set, which is then shrunk by dropping one cause at a time while
+        the rest stay infeasible, within DIAGNOSTIC_MAX_TIME_SECONDS.
+        Returns the causes, [] if the boolean model is feasible (the engine's own
+        structure is at fault), or None if the diagnosis ran out of time.
+        """
+        started = time.perf_counter()
+        self.model = cp_model.CpModel()
+        self.solver = cp_model.CpSolver()
+        self.objective_terms = []
+        self.assumption_literals = {}
+        try:
+            CricketScheduler._build_model(self, match_pairs)
+        except ValueError as e:
+            return [str(e)]
+        
+        profile = self.request.solver_profile if self.request else None
+        params = configure_solver(self.solver, profile, default_max_time=DIAGNOSTIC_MAX_TIME_SECONDS)
+        # Cores are only reported by a single search worker
+        self.solver.parameters.num_workers = 1
+        time_budget = min(params["max_time_in_seconds"], DIAGNOSTIC_MAX_TIME_SECONDS)
+        causes_by_index = {literal.Index(): cause for cause, literal in self.assumption_literals.items()}
+        
+        def conflicting_set(causes: List[str]) -> Optional[List[str]]:
+            """Solve with only these causes enforced. Returns a sufficient subset if infeasible."""
+            self.model.ClearAssumptions()
+            self.model.AddAssumptions([self.assumption_literals[cause] for cause in causes])
+            self.solver.parameters.max_time_in_seconds = max(0.01, time_budget - (time.perf_counter() - started))
+            status = self.solver.Solve(self.model)
+            if status != cp_model.INFEASIBLE:
+                return [] if status in (cp_model.OPTIMAL, cp_model.FEASIBLE) else None
+            return [causes_by_index[index] for index in self.solver.SufficientAssumptionsForInfeasibility()
+                    if index in causes_by_index] or causes
+        
+        logger.info(f"🔍 Explaining infeasibility with {len(self.assumption_literals)} assumption literals")
+        core = conflicting_set(list(self.assumption_literals))
+        if not core:
+            return core
+        
+        for cause in list(core):
+            if time.perf_counter() - started >= time_budget:
+                break
+            if cause not in core:
+                continue
+            smaller = conflicting_set([c for c in core if c != cause])
+            if smaller:
+                core = [c for c in core if c in smaller]
+        
+        logger.info(f"Infeasibility explained by {len(core)} of {len(causes_by_index)} assumptions")
+        return core
+    
+    def _min_rest_slots(self) -> int:
+        """Minimum number of slots a team must sit out between two matches."""
+        return min_rest_slots(self.tournament)
+    
+    def _build_model(self, match_pairs: List[Tuple[int, int]]) -> Dict:
+        """
+        Build the dense match × slot × venue boolean model.
+        Returns the decision variables consumed by _extract_assignments.
+        """
+        num_matches = len(match_pairs)
+        cell_open, team_slot_open = self.cell_open, self.team_slot_open
+        match_venue_open = self.compiled_constraints.match_venue_open(match_pairs)
+        if self.assumption_literals is not None:
+            # Diagnosis: the cells hard scheduling constraints close get variables too,
+            # kept empty behind each constraint's own literal (_guard_hard_constraints)
+            cell_open, team_slot_open = self.base_cell_open, self.base_team_slot_open
+            match_venue_open = np.ones_like(match_venue_open)
+        open_cells = [(int(s), int(v)) for s, v in np.argwhere(cell_open)]
+        
+        # Create decision variables, only for open cells both teams can play in
+        # match_vars[m, s, v] = 1 if match m is scheduled at slot s in venue v
+        match_vars = {}
+        match_cells = self.match_cells = {m: [] for m in range(num_matches)}
+        venue_cells = {}
+        team_cells = {}
+        for m, (t1, t2) in enumerate(match_pairs):
+            teams_open = team_slot_open[t1] & team_slot_open[t2]
+            for s, v in open_cells:
+                if not teams_open[s] or not match_venue_open[m, v]:
+                    continue
+                var = self.model.NewBoolVar(f'match_{m}_slot_{s}_venue_{v}')
+                match_vars[(m, s, v)] = var
+                match_cells[m].append((s, var))
+                venue_cells.setdefault((s, v), []).append(var)
+                team_cells.setdefault((t1, s), []).append(var)
+                team_cells.setdefault((t2, s), []).append(var)
+        
+        # CONSTRAINT 1: Each match is scheduled exactly once (at most once in a rolling-horizon window)
+        placed = {}
+        if self.horizon_window is not None:
+            logger.info("Adding constraint: Each match scheduled at most once in this window")
+            for m in range(num_matches):
+                if match_cells[m]:
+                    placed[m] = self.model.NewBoolVar(f'match_{m}_placed')
+                    self.model.Add(sum(var for _, var in match_cells[m]) == placed[m])
+        else:
+            logger.info("Adding constraint: Each match scheduled exactly once")
+            for m, (t1, t2) in enumerate(match_pairs):
+                if not match_cells[m]:
+                    raise ValueError(f"No open time slot left for {self.teams[t1].name} vs {self.teams[t2].name}")
+                self._guard(self.model.Add(sum(var for _, var in match_cells[m]) == 1),
+                            "Every fixture has to be played exactly once")
+        
+        # CONSTRAINT 2: At most one match per venue per time slot
+        logger.info("Adding constraint: No venue double-booking")
+        for (s, v), cell_vars in venue_cells.items():
+            if len(cell_vars) > 1:
+                self._guard(
+                    self.model.Add(sum(cell_vars) <= 1),
+                    f"{self.venues[v].name} hosts at most one match per slot"
+                )
+        
+        # CONSTRAINT 3: No team plays multiple matches at the same time
+        # team_busy[t, s] = 1 if team t plays in slot s; being boolean, it caps the sum at one
+        logger.info("Adding constraint: No team plays simultaneously")
+        team_busy = {}
+        clash_literal = self._assumption("A team cannot play two matches in the same slot")
+        for (team_idx, s), slot_vars in team_cells.items():
+            team_busy[(team_idx, s)] = self.model.NewBoolVar(f'team_{team_idx}_slot_{s}_busy')
+            busy_sum = self.model.Add(team_busy[(team_idx, s)] == sum(slot_vars))
+            if clash_literal is not None:
+                # Relaxed, team_busy still marks every slot the team plays in for the rest windows
+                busy_sum.OnlyEnforceIf(clash_literal)
+                for var in slot_vars:
+                    self.model.AddImplication(var, team_busy[(team_idx, s)])
+        
+        # CONSTRAINT 4: Minimum rest period between matches for each team
+        # A team plays at most once in any window of min_rest_slots + 1 consecutive slots,
+        # which is exactly "no two matches within min_rest_slots of each other"
+        min_rest_slots = self._min_rest_slots()
+        window = min_rest_slots + 1
+        
+        logger.info(f"Applying rest period constraint: {self.tournament.min_rest_hours}h ({min_rest_slots} slots)")
+        
+        for team_idx in range(self.num_teams):
+            for first_slot in range(max(1, self.num_slots - min_rest_slots)):
+                window_busy = [team_busy[(team_idx, s)]
+                               for s in range(first_slot, min(self.num_slots, first_slot + window))
+                               if (team_idx, s) in team_busy]
+                if len(window_busy) > 1:
+                    self._guard(
+                        self.model.Add(sum(window_busy) <= 1),
+                        f"{self.teams[team_idx].name} sits out {min_rest_slots} slot(s) "
+                        f"({self.tournament.min_rest_hours}h rest) between matches"
+                    )
+        
+        # CONSTRAINT 5: Per-day limits and soft penalties from the scheduling constraint rows
+        self._add_scheduling_constraints(match_vars, match_pairs)
+        if self.assumption_literals is not None:
+            self._guard_hard_constraints(match_vars, match_pairs)
+        
+        # OBJECTIVE: A rolling-horizon window places its share of the fixtures, longest backlogs first
+        if self.horizon_window is not None:
+            self.model.Add(sum(placed.values()) <= self.horizon_window["target"])
+            self.objective_terms.append(-ROLLING_PLACEMENT_WEIGHT * sum(
+                self.horizon_window["weights"][m] * placed_m for m, placed_m in placed.items()
+            ))
+            return match_vars
+        
+        # OBJECTIVE: Team travel between consecutive venues (not while diagnosing infeasibility)
+        if self._optimize_for() == "minimize_travel" and self.assumption_literals is None:
+            self._add_travel_objective(match_vars, match_pairs)
+        
+        # OBJECTIVE: Home/away breaks and rest spread (not while diagnosing infeasibility)
+        if self._optimize_for() == "fairness" and self.assumption_literals is None:
+            self._add_fairness_objective(match_vars, match_pairs)
+        
+        # OBJECTIVE: Compact scheduling, only built when an objective mode is requested
+        objective = self.request.objective if self.request else None
+        if objective:
+            min_last_slot, min_match_days = self._objective_lower_bounds(match_pairs)
+            
+            if objective == "last_slot":
+                # max_slot_used is pushed above every match's slot and minimized
+                max_slot_used = self.model.NewIntVar(min_last_slot, self.num_slots - 1, 'max_slot')
+                for m in range(num_matches):
+                    self.model.Add(max_slot_used >= sum(s * var for s, var in match_cells[m]))
+                self.objective_terms.append(max_slot_used)
+            
+            elif objective == "match_days":
+                # A slot can only host matches if its day is marked as a match day
+                slot_cells = {}
+                for (s, _), cell_vars in venue_cells.items():
+                    slot_cells.setdefault(s, []).extend(cell_vars)
+                day_used = {}
+                for s in range(self.num_slots):
+                    day = self._slot_day(s)
+                    if day not in day_used:
+                        day_used[day] = self.model.NewBoolVar(f'day_{day}_used')
+                    if s in slot_cells:
+                        self.model.Add(sum(slot_cells[s]) <= self.num_venues * day_used[day])
+                self.model.Add(sum(day_used.values()) >= min_match_days)
+                self.objective_terms.append(sum(day_used.values()))
+            
+            else:
+                raise ValueError(f"Unknown objective: {objective}")
+            
+            logger.info(f"Objective '{objective}': lower bounds last slot >= {min_last_slot}, match days >= {min_match_days}")
+        
+        return match_vars
+    
+    def _optimize_for(self) -> Optional[str]:
+        return self.request.optimize_for if self.request else None
+    
+    def _fixture_terms(self, match_vars: Dict, slot_values: Optional[np.ndarray] = None) -> Tuple[Dict, Dict]:
+        """
+        Per fixture: an integer variable for when it is played (slot_values[s] of its slot,
+        the slot index by default), and its venue one-hot as linear expressions of the
+        match variables (at_venue[m, v] is 1 when m is played at v).
+        Values must increase with the slot, so they order each team's fixtures.
+        """
+        slot_values = np.arange(self.num_slots) if slot_values is None else slot_values
+        slot_terms, venue_vars = {}, {}
+        for (m, s, v), var in match_vars.items():
+            slot_terms.setdefault(m, []).append((s, var))
+            venue_vars.setdefault((m, v), []).append(var)
+        when = {}
+        for m, terms in slot_terms.items():
+            values = [int(slot_values[s]) for s, _ in terms]
+            when[m] = self.model.NewIntVar(min(values), max(values), f'match_{m}_when')
+            self.model.Add(when[m] == sum(value * var for value, (_, var) in zip(values, terms)))
+        at_venue = {key: sum(vars_at_venue) for key, vars_at_venue in venue_vars.items()}
+        return when, at_venue
+    
+    def _team_routes(self, match_pairs: List[Tuple[int, int]], when: Dict) -> Dict[int, List[Tuple]]:
+        """
+        Order each team's fixtures with a circuit through a base node.
+        Returns {team: [(m, n, arc), ...]}: arc is true when the team plays n right after m,
+        with m = None for its first fixture and n = None for its last.
+        """
+        routes = {}
+        for t in range(self.num_teams):
+            fixtures = [m for m, pair in enumerate(match_pairs) if t in pair]
+            if not fixtures:
+                continue
+            # Node 0 is the base, node i + 1 the team's i-th fixture
+            circuit, route = [], []
+            for i, m in enumerate(fixtures):
+                for j, n in [(None, None)] + list(enumerate(fixtures)):
+                    if i == j:
+                        continue
+                    if j is None:
+                        first = self.model.NewBoolVar(f'team_{t}_route_first_{m}')
+                        last = self.model.NewBoolVar(f'team_{t}_route_last_{m}')
+                        circuit += [(0, i + 1, first), (i + 1, 0, last)]
+                        route += [(None, m, first), (m, None, last)]
+                        continue
+                    arc = self.model.NewBoolVar(f'team_{t}_route_{m}_{n}')
+                    self.model.Add(when[m] < when[n]).OnlyEnforceIf(arc)
+                    circuit.append((i + 1, j + 1, arc))
+                    route.append((m, n, arc))
+            self.model.AddCircuit(circuit)
+            routes[t] = route
+        return routes
+    
+    def _add_travel_objective(self, match_vars: Dict, match_pairs: List[Tuple[int, int]]) -> None:
+        """
+        Minimize the km each team travels: base -> venues in slot order -> base.
+        Each leg of a team's route costs the distance between the venues it joins.
+        Teams without a home venue travel to their first match and back for free.
+        """
+        tables = travel_tables(self.venues, self.teams)
+        distances, home = tables.distances, tables.home
+        if not distances.any():
+            logger.info("All venues are at the same place, nothing to minimize for travel")
+            return
+        
+        logger.info("Adding objective: team travel between consecutive venues")
+        when, at_venue = self._fixture_terms(match_vars)
+        max_distance = int(distances.max())
+        
+        def km_from(m: int, v: int):
+            """Km from fixture m's venue to venue v, as a linear expression."""
+            return sum(int(distances[u, v]) * at_venue[(m, u)] for u in range(self.num_venues) if (m, u) in at_venue)
+        
+        travel_terms = []
+        for t, route in self._team_routes(match_pairs, when).items():
+            base = int(home[t])
+            for m, n, arc in route:
+                if m is None or n is None:
+                    if base < 0:
+                        continue
+                    # Distances are symmetric, so both legs cost base <-> fixture venue
+                    trip = self.model.NewIntVar(0, max_distance, f'team_{t}_trip_{m}_{n}')
+                    self.model.Add(trip >= km_from(n if m is None else m, base)).OnlyEnforceIf(arc)
+                else:
+                    trip = self.model.NewIntVar(0, max_distance, f'team_{t}_trip_{m}_{n}')
+                    for v in range(self.num_venues):
+                        if (n, v) in at_venue:
+                            # Relaxed away unless n is played at v
+                            self.model.Add(
+                                trip >= km_from(m, v) - max_distance * (1 - at_venue[(n, v)])
+                            ).OnlyEnforceIf(arc)
+                travel_terms.append(trip)
+        
+        if travel_terms:
+            self.objective_terms.append(sum(travel_terms))
+    
+    def _add_fairness_objective(self, match_vars: Dict, match_pairs: List[Tuple[int, int]]) -> None:
+        """
+        Minimize home/away breaks (the worst team's count and the total) and the spread
+        between the largest and smallest per-team minimum rest, in hours.
+        """
+        logger.info("Adding objective: home/away breaks and rest spread")
+        home = self.spec.home_venue
+        start_hours = slot_start_hours(self.time_slots)
+        start_of, at_venue = self._fixture_terms(match_vars, start_hours)
+        duration = self.tournament.match_duration_hours
+        horizon = int(start_hours[-1]) if len(start_hours) else 0
+        
+        team_breaks, team_min_rest = [], []
+        for t, route in self._team_routes(match_pairs, start_of).items():
+            at_home = {m: at_venue.get((m, int(home[t])), 0) for m in start_of} if home[t] >= 0 else None
+            breaks, gaps = [], []
+            for m, n, arc in route:
+                if m is None or n is None:
+                    continue
+                if at_home is not None:
+                    # Two home or two away matches in a row
+                    broken = self.model.NewBoolVar(f'team_{t}_break_{m}_{n}')
+                    self.model.Add(broken >= at_home[m] + at_home[n] - 1).OnlyEnforceIf(arc)
+                    self.model.Add(broken >= 1 - at_home[m] - at_home[n]).OnlyEnforceIf(arc)
+                    breaks.append(broken)
+                # Rest after m when n comes next, the horizon otherwise so it never sets the minimum
+                gap = self.model.NewIntVar(0, horizon, f'team_{t}_rest_{m}_{n}')
+                self.model.Add(gap == start_of[n] - start_of[m] - duration).OnlyEnforceIf(arc)
+                self.model.Add(gap == horizon).OnlyEnforceIf(arc.Not())
+                gaps.append(gap)
+            if breaks:
+                team_breaks.append(sum(breaks))
+            if gaps:
+                min_rest = self.model.NewIntVar(0, horizon, f'team_{t}_min_rest')
+                self.model.AddMinEquality(min_rest, gaps)
+                team_min_rest.append(min_rest)
+        
+        if team_breaks:
+            max_breaks = self.model.NewIntVar(0, len(match_pairs), 'max_team_breaks')
+            for breaks in team_breaks:
+                self.model.Add(max_breaks >= breaks)
+            self.objective_terms.append(BREAK_WEIGHT_HOURS * (max_breaks + sum(team_breaks)))
+        if len(team_min_rest) > 1:
+            rest_floor = self.model.NewIntVar(0, horizon, 'min_team_rest_floor')
+            rest_top = self.model.NewIntVar(0, horizon, 'min_team_rest_top')
+            for min_rest in team_min_rest:
+                self.model.Add(rest_floor <= min_rest)
+                self.model.Add(rest_top >= min_rest)
+            self.objective_terms.append(rest_top - rest_floor)
+    
+    def _fairness_report(self, assignments: List[Tuple[int, int]], match_pairs: List[Tuple[int, int]]) -> Dict:
+        """Per-team breaks and minimum rest hours, with the worst break count and the rest spread."""
+        breaks, min_rest = team_fairness(
+            assignments, match_pairs, self.spec.home_venue,
+            slot_start_hours(self.time_slots), self.tournament.match_duration_hours
+        )
+        rested = min_rest[min_rest >= 0]
+        return {
+            "max_breaks": int(breaks.max()) if len(breaks) else 0,
+            "total_breaks": int(breaks.sum()),
+            "rest_spread_hours": int(rested.max() - rested.min()) if len(rested) else 0,
+            "teams": {
+                team.name: {"breaks": int(b), "min_rest_hours": int(r) if r >= 0 else None}
+                for team, b, r in zip(self.teams, breaks, min_rest)
+            }
+        }
+    
+    def _match_venue_open(self, match_pairs: List[Tuple[int, int]]) -> Optional[np.ndarray]:
+        """matches × venues mask of hard venue constraints for the local search, None if there are none."""
+        match_venue_open = self.compiled_constraints.match_venue_open(match_pairs)
+        return None if match_venue_open.all() else match_venue_open
+    
+    def _guard_hard_constraints(self, match_vars: Dict, match_pairs: List[Tuple[int, int]]) -> None:
+        """
+        Diagnosis only: keep the cells each hard scheduling constraint row closes empty,
+        guarded by that row's assumption literal, so a blackout or an unavailable team
+        can be named as a cause.
+        """
+        hard_rows = [row for row in self.compiled_constraints.rows if row["priority"] == HARD_PRIORITY]
+        if not hard_rows or not match_vars:
+            return
+        cells = np.array(list(match_vars), dtype=np.int64)
+        variables = list(match_vars.values())
+        slots, venues = cells[:, 1], cells[:, 2]
+        teams = np.asarray(match_pairs, dtype=np.int64).reshape(-1, 2)[cells[:, 0]]
+        
+        for row in hard_rows:
+            bad = np.ones(len(cells), dtype=bool)
+            if row["slot_bad"] is not None:
+                bad &= row["slot_bad"][slots]
+            if row["venue_bad"] is not None:
+                bad &= row["venue_bad"][venues]
+            if row["team"] is not None:
+                bad &= (teams == row["team"]).any(axis=1)
+            if bad.any():
+                self._guard(self.model.Add(sum(variables[i] for i in np.flatnonzero(bad)) == 0), row["description"])
+    
+    def _add_scheduling_constraints(self, match_vars: Dict, match_pairs: List[Tuple[int, int]]) -> None:
+        """
+        Hard per-day limits become constraints (guarded for infeasibility diagnosis); soft
+        rows add their weighted penalty for every match variable in a disliked cell and
+        for every match over a soft per-day limit.
+        """
+        compiled = self.compiled_constraints
+        if not compiled.rows and not compiled.day_limits or not match_vars:
+            return
+        
+        # One row per variable: (match, slot, venue) and the fixture's teams
+        cells = np.array(list(match_vars), dtype=np.int64)
+        variables = list(match_vars.values())
+        slots, venues = cells[:, 1], cells[:, 2]
+        teams = np.asarray(match_pairs, dtype=np.int64).reshape(-1, 2)[cells[:, 0]]
+        
+        penalty_vars, penalty_weights = [], []
+        if compiled.has_soft:
+            penalty = (compiled.cell_penalty[slots, venues]
+                       + compiled.team_slot_penalty[teams[:, 0], slots] + compiled.team_slot_penalty[teams[:, 1], slots]
+                       + compiled.team_venue_penalty[teams[:, 0], venues] + compiled.team_venue_penalty[teams[:, 1], venues])
+            for i in np.flatnonzero(penalty):
+                penalty_vars.append(variables[i])
+                penalty_weights.append(int(penalty[i]))
+        
+        for i, limit in enumerate(compiled.day_limits):
+            counted = np.ones(len(cells), dtype=bool)
+            if limit["team"] is not None:
+                counted &= (teams == limit["team"]).any(axis=1)
+            if limit["venue"] is not None:
+                counted &= venues == limit["venue"]
+            selected = np.flatnonzero(counted)
+            days = self.slot_day[slots[selected]]
+            order = np.argsort(days, kind="stable")
+            day_values, day_starts = np.unique(days[order], return_index=True)
+            for day, group in zip(day_values, np.split(selected[order], day_starts[1:])):
+                if len(group) <= limit["limit"]:
+                    continue
+                vars_on_day = [variables[j] for j in group]
+                if limit["weight"] is None:
+                    self._guard(self.model.Add(sum(vars_on_day) <= limit["limit"]), limit["description"])
+                else:
+                    excess = self.model.NewIntVar(0, len(group) - limit["limit"], f'limit_{i}_day_{day}_excess')
+                    self.model.Add(sum(vars_on_day) - limit["limit"] <= excess)
+                    penalty_vars.append(excess)
+                    penalty_weights.append(limit["weight"])
+        
+        if penalty_vars:
+            logger.info(f"Adding soft constraint penalties on {len(penalty_vars)} variables")
+            self.objective_terms.append(cp_model.LinearExpr.WeightedSum(penalty_vars, penalty_weights))
+    
     def generate_schedule(self, request: Optional[ScheduleGenerateRequest] = None) -> Dict:
         """
         Generate optimal schedule using constraint programming.
         Returns dict with success status and scheduled matches.
         """
         try:
+            self.request = request
+            self._reset_availability()
             match_pairs = self._generate_match_pairs()
+            self.saved_matches = self._load_saved_matches(match_pairs)
+            
+            # INCREMENTAL: Completed and in-progress matches stay put, only open fixtures are re-solved
+            incremental = request.incremental if request else False
+            if incremental:
+                match_pairs = self._freeze_played_matches(match_pairs)
+                if not match_pairs:
+                    return {
+                        "success": True,
+                        "message": "No open fixtures left to reschedule",
+                        "matches_scheduled": 0,
+                        "schedule": [],
+                        "matches_frozen": len(self.frozen_matches),
+                        "rows_changed": {"updated": 0, "inserted": 0, "deleted": 0}
+                    }
             num_matches = len(match_pairs)
             
             logger.info(f"Generating schedule for {num_matches} matches")
             
             # PRE-VALIDATION: Check if schedule is feasible
-            is_feasible, issues = self._validate_feasibility(num_matches)
+            is_feasible, issues = self._validate_feasibility(match_pairs)
             if not is_feasible:
                 logger.warning(f"Feasibility check failed: {issues}")
                 return {
                     "success": False,
                     "message": "Schedule not feasible with current constraints",
                     "matches_scheduled": 0,
-                    "conflicts": issues
+                    "conflicts": issues,
+                    "feasibility": self.feasibility_report
                 }
             
             # Log warnings but continue
             for issue in issues:
                 if '⚠️' in issue or '💡' in issue:
                     logger.info(issue)
-
             
-            # Create decision variables
-            # match_vars[m, s, v] = 1 if match m is scheduled at slot s in venue v
-            match_vars = {}
-            for m in range(num_matches):
-                for s in range(self.num_slots):
-                    for v in range(self.num_venues):
-                        match_vars[(m, s, v)] = self.model.NewBoolVar(f'match_{m}_slot_{s}_venue_{v}')
+            self.current_assignments = self._load_current_assignments()
             
-            # CONSTRAINT 1: Each match is scheduled exactly once
-            logger.info("Adding constraint: Each match scheduled exactly once")
-            for m in range(num_matches):
-                self.model.Add(
-                    sum(match_vars[(m, s, v)] 
-                        for s in range(self.num_slots) 
-                        for v in range(self.num_venues)) == 1
-                )
-            
-            # CONSTRAINT 2: At most one match per venue per time slot
-            logger.info("Adding constraint: No venue double-booking")
-            for s in range(self.num_slots):
-                for v in range(self.num_venues):
-                    self.model.Add(
-                        sum(match_vars[(m, s, v)] for m in range(num_matches)) <= 1
-                    )
-            
-            # CONSTRAINT 3: No team plays multiple matches at the same time
-            logger.info("Adding constraint: No team plays simultaneously")
-            for s in range(self.num_slots):
-                for team_idx in range(self.num_teams):
-                    # Find all matches involving this team
-                    team_matches = []
-                    for m, (t1, t2) in enumerate(match_pairs):
-                        if t1 == team_idx or t2 == team_idx:
-                            for v in range(self.num_venues):
-                                team_matches.append(match_vars[(m, s, v)])
-                    
-                    if team_matches:
-                        self.model.Add(sum(team_matches) <= 1)
-            
-            # CONSTRAINT 4: Minimum rest period between matches for each team
-            # Improved logic: Only prevent scheduling within rest window
-            min_rest_slots = max(1, self.tournament.min_rest_hours // self.tournament.match_duration_hours)
-            
-            logger.info(f"Applying rest period constraint: {self.tournament.min_rest_hours}h ({min_rest_slots} slots)")
-            
-            for team_idx in range(self.num_teams):
-                # Get all matches for this team
-                team_match_indices = []
-                for m, (t1, t2) in enumerate(match_pairs):
-                    if t1 == team_idx or t2 == team_idx:
-                        team_match_indices.append(m)
-                
-                # For each pair of matches involving this team
-                for i, m1 in enumerate(team_match_indices):
-                    for m2 in team_match_indices[i+1:]:
-                        # Ensure matches are separated by at least min_rest_slots
-                        for s1 in range(self.num_slots):
-                            for v1 in range(self.num_venues):
-                                # If m1 is scheduled at slot s1
-                                # Then m2 cannot be scheduled in slots [s1 - min_rest_slots, s1 + min_rest_slots]
-                                forbidden_slots = range(
-                                    max(0, s1 - min_rest_slots),
-                                    min(self.num_slots, s1 + min_rest_slots + 1)
-                                )
-                                
-                                for s2 in forbidden_slots:
-                                    if s1 == s2:
-                                        continue  # Same slot already prevented by constraint 3
-                                    
-                                    for v2 in range(self.num_venues):
-                                        # If m1 at (s1, v1), then NOT m2 at (s2, v2)
-                                        self.model.AddBoolOr([
-                                            match_vars[(m1, s1, v1)].Not(),
-                                            match_vars[(m2, s2, v2)].Not()
-                                        ])
-
+            # CACHE: Unchanged inputs reuse the schedule solved for them before.
+            # Incremental and minimize-moves solves depend on the saved fixtures, so they always solve.
+            minimize_moves = request.minimize_moves if request else False
+            cache = None if incremental or minimize_moves else get_schedule_cache()
+            cache_key = self._cache_key() if cache is not None else None
+            cached = self._cached_solution(cache, cache_key, num_matches)
+            if cached:
+                status, assignments, solved_by = cached["status"], cached["assignments"], cached["solved_by"]
+            else:
+                status, assignments = self._solve(match_pairs)
+                solved_by = self.solver_name
             
-            # OBJECTIVE: Minimize total span of tournament (optional optimization)
-            # This encourages compact scheduling
-            max_slot_used = self.model.NewIntVar(0, self.num_slots - 1, 'max_slot')
-            for s in range(self.num_slots):
-                is_slot_used = self.model.NewBoolVar(f'slot_{s}_used')
-                self.model.Add(
-                    sum(match_vars[(m, s, v)] 
-                        for m in range(num_matches) 
-                        for v in range(self.num_venues)) >= 1
-                ).OnlyEnforceIf(is_slot_used)
-                self.model.Add(
-                    sum(match_vars[(m, s, v)] 
-                        for m in range(num_matches) 
-                        for v in range(self.num_venues)) == 0
-                ).OnlyEnforceIf(is_slot_used.Not())
+            if self._cancelled():
+                logger.info("🛑 Schedule generation cancelled, nothing saved")
+                return {
+                    "success": False,
+                    "message": "Schedule generation cancelled",
+                    "matches_scheduled": 0,
+                    "cancelled": True,
+                    "solver_stats": self.solver_stats
+                }
             
-            # Solve the model
-            logger.info("🚀 Starting CP-SAT solver (max 30 seconds)...")
-            self.solver.parameters.max_time_in_seconds = 30.0  # 30 second timeout
-            status = self.solver.Solve(self.model)
+            # FALLBACK: CP-SAT ran out of time without a schedule, try the local search engine
+            if status == cp_model.UNKNOWN and solved_by == "cp-sat":
+                logger.warning("⚠️  CP-SAT returned UNKNOWN, falling back to greedy + local search")
+                assignments = self._local_search_fallback(match_pairs)
+                if assignments is not None:
+                    status, solved_by = cp_model.FEASIBLE, "local-search"
             
-            solve_time = self.solver.WallTime()
-            logger.info(f"⏱️  Solver completed in {solve_time:.2f}s, Status: {self.solver.StatusName(status)}")
+            if cached:
+                objective_value = cached["objective_value"]
+            else:
+                objective_value = self.objective_value if solved_by == "cp-sat" else None
             
             if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
                 # Extract solution
-                scheduled_matches = self._extract_solution(match_vars, match_pairs)
+                solution = self._solution(assignments, match_pairs)
+                scheduled_matches = solution_records(self.spec, solution)
                 
-                # POST-VALIDATION: Verify zero conflicts
-                is_valid, validation_conflicts = self._validate_solution(scheduled_matches)
+                # POST-VALIDATION: Verify zero conflicts, frozen matches included
+                is_valid, validation_conflicts = self._validate_solution(scheduled_matches + self.frozen_matches)
+                if not is_valid and self.frozen_matches:
+                    # Clashes among the frozen matches themselves are history, not solver errors
+                    _, frozen_conflicts = self._validate_solution(self.frozen_matches)
+                    validation_conflicts = [c for c in validation_conflicts if c not in frozen_conflicts]
+                    is_valid = not validation_conflicts
+                # Hard scheduling constraints, which engines that cannot model them leave to this check
+                for broken in self.compiled_constraints.violations(assignments, match_pairs, self.slot_day, hard=True):
+                    validation_conflicts.append(f"❌ Hard constraint broken: {broken['constraint']}")
+                    is_valid = False
                 if not is_valid:
                     logger.error(f"Solution validation failed: {validation_conflicts}")
                     return {
@@ -303,32 +877,79 @@ class CricketScheduler:
                         "conflicts": validation_conflicts
                     }
                 
+                matches_moved = sum(
+                    1 for m, position in self.current_assignments.items() if assignments[m] != position
+                )
+                
+                # An accepted-early schedule is not what a full solve would return, so it is not cached
+                if cache is not None and not cached and not (self.solver_stats or {}).get("stopped_early"):
+                    cache.set(cache_key, {
+                        "status": "optimal" if status == cp_model.OPTIMAL else "feasible",
+                        "assignments": [list(position) for position in assignments],
+                        "objective_value": objective_value,
+                        "solved_by": solved_by,
+                        "solver_stats": self.solver_stats,
+                        "solution_log": self.solution_log
+                    })
+                
                 # Save to database
-                self._save_schedule_to_db(scheduled_matches)
+                if incremental:
+                    rows_changed = self._save_incremental_schedule(scheduled_matches, assignments, match_pairs)
+                else:
+                    self._save_schedule_to_db(solution)
                 
                 logger.info(f"✅ Schedule validated: {len(scheduled_matches)} matches, zero conflicts")
                 
-                return {
+                result = {
                     "success": True,
                     "message": "Schedule generated successfully with zero conflicts",
                     "matches_scheduled": len(scheduled_matches),
                     "status": "optimal" if status == cp_model.OPTIMAL else "feasible",
                     "schedule": scheduled_matches,
-                    "validation": "✅ Zero conflicts verified"
+                    "validation": "✅ Zero conflicts verified",
+                    "objective_value": objective_value,
+                    "solved_by": solved_by,
+                    "cache_hit": bool(cached),
+                    "solver_stats": self.solver_stats,
+                    "solution_log": self.solution_log,
+                    "matches_moved": matches_moved,
+                    "soft_constraint_violations": self.compiled_constraints.violations(
+                        assignments, match_pairs, self.slot_day
+                    )
                 }
+                if self._optimize_for() == "minimize_travel":
+                    team_travel = travel_tables(self.venues, self.teams).team_travel(assignments, match_pairs)
+                    result["travel_km"] = int(team_travel.sum())
+                    result["team_travel_km"] = {
+                        team.name: int(km) for team, km in zip(self.teams, team_travel)
+                    }
+                if self._optimize_for() == "fairness":
+                    result["fairness"] = self._fairness_report(assignments, match_pairs)
+                if incremental:
+                    result["matches_frozen"] = len(self.frozen_matches)
+                    result["rows_changed"] = rows_changed
+                return result
             else:
                 # Solver failed - provide detailed error
                 error_msg = "Could not find valid schedule"
                 suggestions = []
+                causes = None
                 
                 if status == cp_model.INFEASIBLE:
                     error_msg = "Schedule is mathematically impossible with current constraints"
-                    suggestions = [
-                        "💡 Try extending the tournament by 1-2 days",
-                        "💡 Add more venues to allow parallel matches",
-                        f"💡 Reduce rest period from {self.tournament.min_rest_hours}h to {self.tournament.match_duration_hours * 2}h",
-                        "💡 Reduce number of matches (change tournament format)"
-                    ]
+                    causes = self._explain_infeasibility(match_pairs)
+                    if causes:
+                        suggestions = [f"❌ {cause}" for cause in causes]
+                        suggestions.append("💡 Relax or remove one of the constraints above")
+                    else:
+                        if causes == []:
+                            suggestions.append(f"❌ The '{self.engine_name}' engine's own structure (e.g. fixed rounds) cannot fit the slots")
+                        suggestions += [
+                            "💡 Try extending the tournament by 1-2 days",
+                            "💡 Add more venues to allow parallel matches",
+                            f"💡 Reduce rest period from {self.tournament.min_rest_hours}h to {self.tournament.match_duration_hours * 2}h",
+                            "💡 Reduce number of matches (change tournament format)"
+                        ]
                 elif status == cp_model.MODEL_INVALID:
                     error_msg = "Scheduling model has errors"
                     suggestions = ["⚠️ Please contact support - this is a system error"]
@@ -339,7 +960,9 @@ class CricketScheduler:
                     "success": False,
                     "message": error_msg,
                     "matches_scheduled": 0,
-                    "conflicts": suggestions if suggestions else ["No feasible schedule found"]
+                    "conflicts": suggestions if suggestions else ["No feasible schedule found"],
+                    "infeasibility_causes": causes,
+                    "solver_stats": self.solver_stats
                 }
         
         except Exception as e:
@@ -350,37 +973,698 @@ class CricketScheduler:
                 "matches_scheduled": 0
             }
     
-    def _extract_solution(self, match_vars: Dict, match_pairs: List[Tuple[int, int]]) -> List[Dict]:
-        """Extract the scheduled matches from the solution."""
-        scheduled = []
-        
-        for m, (team1_idx, team2_idx) in enumerate(match_pairs):
-            for s in range(self.num_slots):
-                for v in range(self.num_venues):
-                    if self.solver.Value(match_vars[(m, s, v)]) == 1:
-                        scheduled.append({
-                            "match_number": m + 1,
-                            "team1_id": self.teams[team1_idx].id,
-                            "team2_id": self.teams[team2_idx].id,
-                            "team1_name": self.teams[team1_idx].name,
-                            "team2_name": self.teams[team2_idx].name,
-                            "venue_id": self.venues[v].id,
-                            "venue_name": self.venues[v].name,
-                            "scheduled_start": self.time_slots[s],
-                            "scheduled_end": self.time_slots[s] + timedelta(hours=self.tournament.match_duration_hours),
-                            "slot_index": s,
-                            "venue_index": v
-                        })
-                        break
-        
-        # Sort by scheduled time
-        scheduled.sort(key=lambda x: x["scheduled_start"])
-        
-        # Update match numbers sequentially
-        for idx, match in enumerate(scheduled):
-            match["match_number"] = idx + 1
-        
-        return scheduled
+    def _solve(self, match_pairs: List[Tuple[int, int]]) -> Tuple[int, Optional[List[Tuple[int, int]]]]:
+        """
+        Build and solve the CP-SAT model.
+        Returns (solver status, one (slot, venue) per match or None if no solution).
+        """
+        self.local_search_result = None
+        if self._horizon_weeks():
+            return self._solve_rolling(match_pairs)
+        if self._group_stage():
+            status, assignments = self._solve_groups(match_pairs)
+            if status != cp_model.INFEASIBLE:
+                return status, assignments
+            logger.warning("⚠️  A group does not fit into its share of the cells, solving all groups together")
+            self.model = cp_model.CpModel()
+        self.objective_terms = []
+        match_vars = self._build_model(match_pairs)
+        
+        # WARM START: Hint the currently saved fixtures so small edits re-solve quickly
+        warm_start = self.request.warm_start if self.request else True
+        if warm_start and self.current_assignments:
+            self._add_warm_start(match_vars, self.current_assignments)
+        
+        if self.objective_terms:
+            self.model.Minimize(sum(self.objective_terms))
+        model_proto = self.model.Proto()
+        logger.info(f"📐 Model built: {len(model_proto.variables)} variables, {len(model_proto.constraints)} constraints")
+        
+        # Solve the model
+        params = configure_solver(
+            self.solver,
+            self.request.solver_profile if self.request else None,
+            latency_budget=self.request.latency_budget if self.request else None
+        )
+        if self._cancelled():
+            return cp_model.UNKNOWN, None
+        use_lns = self._use_lns()
+        if use_lns:
+            self.solver.parameters.max_time_in_seconds = params["max_time_in_seconds"] * LNS_INITIAL_SHARE
+        started = time.perf_counter()
+        logger.info(
+            f"🚀 Starting CP-SAT solver (max {self.solver.parameters.max_time_in_seconds:g} seconds, "
+            f"{params['num_workers'] or 'all'} workers)..."
+        )
+        callback = SolutionProgressCallback(self.progress_listener, has_objective=bool(self.objective_terms))
+        if self.cancel_token:
+            self.cancel_token.add_stop_hook(self.solver.StopSearch)
+        try:
+            status = self.solver.Solve(self.model, callback)
+        finally:
+            if self.cancel_token:
+                self.cancel_token.remove_stop_hook(self.solver.StopSearch)
+        self.solver_stats = collect_solver_stats(self.solver, status, params)
+        self.solver_stats["solutions_found"] = len(callback.solutions)
+        self.solver_stats["stopped_early"] = callback.stopped_early or (
+            self.cancel_token is not None and self.cancel_token.should_stop()
+        )
+        self.solution_log = callback.solutions
+        
+        solve_time = self.solver.WallTime()
+        logger.info(f"⏱️  Solver completed in {solve_time:.2f}s, Status: {self.solver.StatusName(status)}")
+        found = status == cp_model.OPTIMAL or status == cp_model.FEASIBLE
+        self.objective_value = self.solver.ObjectiveValue() if found and self.objective_terms else None
+        
+        # LNS: Improve the first schedule (or the local search's, if CP-SAT found none) for the rest of the budget
+        if use_lns and status in (cp_model.FEASIBLE, cp_model.UNKNOWN) and not self.solver_stats["stopped_early"]:
+            remaining = params["max_time_in_seconds"] - (time.perf_counter() - started)
+            return self._improve_with_lns(match_vars, match_pairs, status, params, remaining)
+        
+        if found:
+            return status, self._extract_assignments(match_vars, match_pairs)
+        return status, None
+    
+    def _use_lns(self) -> bool:
+        """Large-neighbourhood search on request, or by default for leagues of SOLVER_LNS_MIN_TEAMS+ teams."""
+        lns = self.request.lns if self.request else None
+        if lns is False or not self.supports_lns:
+            return False
+        if not self.objective_terms:
+            if lns:
+                logger.info("LNS needs an objective to improve; solving once")
+            return False
+        return bool(lns) or self.num_teams >= settings.SOLVER_LNS_MIN_TEAMS
+    
+    def _local_search_fallback(self, match_pairs: List[Tuple[int, int]]) -> Optional[List[Tuple[int, int]]]:
+        """Schedule with greedy + local search, e.g. when CP-SAT found no solution in time. Runs once per solve."""
+        if self.local_search_result is None:
+            self.local_search_result = (greedy_local_search(
+                match_pairs, self.num_teams, self.num_slots, self.num_venues, self._min_rest_slots(),
+                cell_open=self.cell_open, team_slot_open=self.team_slot_open,
+                should_stop=self.cancel_token.should_stop if self.cancel_token else None,
+                match_venue_open=self._match_venue_open(match_pairs)
+            ),)
+        return self.local_search_result[0]
+    
+    def _improve_with_lns(self, match_vars: Dict, match_pairs: List[Tuple[int, int]], status: int,
+                          params: Dict, time_budget: float) -> Tuple[int, Optional[List[Tuple[int, int]]]]:
+        """
+        Run LargeNeighbourhoodSearch from the solver's incumbent for time_budget seconds.
+        Without an incumbent, the local search schedule is completed into one first.
+        """
+        lns = LargeNeighbourhoodSearch(
+            self.model.Proto(), [(m, s, v, var.Index()) for (m, s, v), var in match_vars.items()],
+            match_pairs, self.slot_day, self.num_teams, self.num_venues,
+            num_workers=params["num_workers"] or os.cpu_count(), random_seed=params["random_seed"],
+            linearization_level=params["linearization_level"]
+        )
+        lns_started = time.perf_counter()
+        if status == cp_model.FEASIBLE:
+            solution, objective = list(self.solver.ResponseProto().solution), self.solver.ObjectiveValue()
+            best_bound = self.solver.BestObjectiveBound()
+        else:
+            logger.warning("⚠️  CP-SAT found no schedule in its share of the budget, starting LNS from local search")
+            assignments = self._local_search_fallback(match_pairs)
+            start = lns.evaluate(assignments, time_budget) if assignments is not None else None
+            if start is None:
+                return status, None
+            solution, objective, best_bound = start["solution"], start["objective"], None
+            self.solution_log.append({"solutions": len(self.solution_log) + 1, "objective": objective,
+                                      "best_bound": None, "elapsed": round(self.solver.WallTime(), 3),
+                                      "neighbourhood": "local-search"})
+        
+        offset = self.solver.WallTime()
+        
+        def on_improvement(event: Dict) -> bool:
+            event = {"solutions": len(self.solution_log) + 1, **event, "elapsed": round(offset + event["elapsed"], 3)}
+            self.solution_log.append(event)
+            return bool(self.progress_listener and self.progress_listener(event))
+        
+        result = lns.run(
+            solution, objective, time_budget - (time.perf_counter() - lns_started), best_bound=best_bound,
+            should_stop=self.cancel_token.should_stop if self.cancel_token else None, on_improvement=on_improvement
+        )
+        self.objective_value = result["objective"]
+        self.solver_stats.update({
+            "status": "OPTIMAL" if result["stats"]["proven_optimal"] else "FEASIBLE",
+            "wall_time": round(offset + time.perf_counter() - lns_started, 3),
+            "solutions_found": len(self.solution_log),
+            "lns": result["stats"],
+        })
+        return (cp_model.OPTIMAL if result["stats"]["proven_optimal"] else cp_model.FEASIBLE), result["assignments"]
+    
+    def _horizon_weeks(self) -> Optional[int]:
+        """Rolling-horizon window length in weeks, None to solve the whole season at once."""
+        weeks = self.request.horizon_weeks if self.request else None
+        if weeks and not self.supports_rolling_horizon:
+            logger.warning(f"{type(self).__name__} cannot leave fixtures unplaced; solving the whole season at once")
+            return None
+        return weeks
+    
+    def _solve_rolling(self, match_pairs: List[Tuple[int, int]]) -> Tuple[int, Optional[List[Tuple[int, int]]]]:
+        """
+        Solve the season window by window: each window gets a fresh model over its own slots and
+        the fixtures still open, places its share of them and commits the result. Teams carry
+        their committed matches forward as rest closures, so each model stays window-sized.
+        If fixtures are left over or the stitching pass finds a rest violation, the committed
+        fixtures stay and local search places the rest around them; UNKNOWN is returned and
+        generate_schedule takes the merged schedule as its local-search fallback.
+        """
+        if self.request.objective or self._optimize_for() in ("minimize_travel", "fairness"):
+            logger.warning("Rolling horizon paces fixtures through the season; the objective is ignored")
+        params = configure_solver(self.solver, self.request.solver_profile,
+                                  latency_budget=self.request.latency_budget)
+        # Windows are many short solves: skip the presolve passes that only pay off on long ones
+        self.solver.parameters.symmetry_level = 0
+        self.solver.parameters.cp_model_probing_level = 0
+        window_days = self._horizon_weeks() * 7
+        slot_window = self.slot_day // window_days
+        windows = np.unique(slot_window)
+        pairs = np.asarray(match_pairs, dtype=np.int64).reshape(-1, 2)
+        rest = self._min_rest_slots()
+        base_cell_open, base_team_slot_open = self.cell_open, self.team_slot_open
+        assignments = [None] * len(match_pairs)
+        remaining = list(range(len(match_pairs)))
+        stats = {"window_days": window_days, "windows": 0, "matches_per_window": [], "peak_variables": 0}
+        started, solver_time = time.perf_counter(), 0.0
+        self.solution_log = []
+        logger.info(f"🗓️  Rolling horizon: {len(windows)} windows of {window_days} days")
+        
+        try:
+            for i, window in enumerate(windows):
+                if not remaining or self._cancelled():
+                    break
+                windows_left = len(windows) - i
+                target = len(remaining) if windows_left == 1 else min(
+                    len(remaining), int(np.ceil(len(remaining) / windows_left * ROLLING_PACE_MARGIN))
+                )
+                backlog = np.bincount(pairs[remaining].ravel(), minlength=self.num_teams)
+                
+                # Boundary conditions: only this window's cells, minus the rest after committed matches
+                self.cell_open = base_cell_open & (slot_window == window)[:, None]
+                self.team_slot_open = base_team_slot_open & ~self._rest_closures(assignments, pairs, rest)
+                candidates = self._window_candidates(remaining, pairs, backlog, target, rest,
+                                                     self.team_slot_open[:, slot_window == window])
+                window_pairs = [match_pairs[m] for m in candidates]
+                self.horizon_window = {"weights": [1 + int(backlog[t1] + backlog[t2]) for t1, t2 in window_pairs],
+                                       "target": target}
+                self.model = cp_model.CpModel()
+                self.objective_terms = []
+                match_vars = self._build_model(window_pairs)
+                self.model.Minimize(sum(self.objective_terms))
+                stats["peak_variables"] = max(stats["peak_variables"], len(self.model.Proto().variables))
+                
+                # The time limit is solver time, as for a single solve; windows pass on what they leave
+                self.solver.parameters.max_time_in_seconds = max(
+                    0.1, (params["max_time_in_seconds"] - solver_time) / windows_left
+                )
+                if self.cancel_token:
+                    self.cancel_token.add_stop_hook(self.solver.StopSearch)
+                try:
+                    status = self.solver.Solve(self.model)
+                finally:
+                    if self.cancel_token:
+                        self.cancel_token.remove_stop_hook(self.solver.StopSearch)
+                solver_time += self.solver.WallTime()
+                
+                placed = 0
+                if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                    for m, position in zip(candidates, self._extract_assignments(match_vars, window_pairs)):
+                        if position is not None:
+                            assignments[m] = position
+                            placed += 1
+                else:
+                    logger.warning(f"Window {i + 1} found no schedule in time ({self.solver.StatusName(status)})")
+                remaining = [m for m in remaining if assignments[m] is None]
+                stats["windows"] += 1
+                stats["matches_per_window"].append(placed)
+                
+                event = {"solutions": len(self.solution_log) + 1, "objective": None, "best_bound": None,
+                         "elapsed": round(time.perf_counter() - started, 3), "window": i + 1,
+                         "windows": len(windows), "matches_placed": placed, "matches_left": len(remaining)}
+                self.solution_log.append(event)
+                if self.progress_listener:
+                    self.progress_listener(event)
+                logger.info(f"Window {i + 1}/{len(windows)}: {placed} fixtures placed, {len(remaining)} left")
+        finally:
+            self.cell_open, self.team_slot_open = base_cell_open, base_team_slot_open
+            self.horizon_window = None
+            self.solver.parameters.ClearField("symmetry_level")
+            self.solver.parameters.ClearField("cp_model_probing_level")
+        
+        self.solver_stats = {
+            "status": "UNKNOWN",
+            "num_workers": params["num_workers"] or os.cpu_count(),
+            "linearization_level": params["linearization_level"],
+            "random_seed": params["random_seed"],
+            "max_time_in_seconds": params["max_time_in_seconds"],
+            "relative_gap_limit": params["relative_gap_limit"],
+            "wall_time": round(solver_time, 3),
+            "solutions_found": len(self.solution_log),
+            "stopped_early": self._cancelled(),
+            "rolling_horizon": stats,
+        }
+        if self._cancelled():
+            return cp_model.UNKNOWN, None
+        if remaining:
+            logger.warning(f"Rolling horizon left {len(remaining)} fixtures unplaced")
+        else:
+            # STITCHING: Rest across window boundaries, which only the carried closures protect
+            violations = self._stitch_rest(assignments, pairs, rest)
+            if not violations:
+                self.solver_stats["status"] = "FEASIBLE"
+                return cp_model.FEASIBLE, assignments
+            logger.error(f"Rolling horizon windows break rest at their boundaries: {violations}")
+            for m in self._rest_breakers(assignments, pairs, rest):
+                assignments[m] = None
+        
+        # FALLBACK: Local search places only the open fixtures around the committed windows;
+        # generate_schedule picks the merged schedule up as the local-search result
+        stats["fallback_matches"] = sum(1 for position in assignments if position is None)
+        self.local_search_result = (self._complete_with_local_search(match_pairs, assignments, pairs, rest),)
+        return cp_model.UNKNOWN, None
+    
+    def _complete_with_local_search(self, match_pairs: List[Tuple[int, int]],
+                                    assignments: List[Optional[Tuple[int, int]]], pairs: np.ndarray,
+                                    rest: int) -> Optional[List[Tuple[int, int]]]:
+        """Fill the unplaced fixtures in with greedy + local search, keeping every committed one fixed."""
+        open_matches = [m for m, position in enumerate(assignments) if position is None]
+        cell_open = self.cell_open.copy()
+        for position in assignments:
+            if position is not None:
+                cell_open[position] = False
+        team_slot_open = self.team_slot_open & ~self._rest_closures(assignments, pairs, rest)
+        open_pairs = [match_pairs[m] for m in open_matches]
+        logger.info(f"🧩 Local search places {len(open_pairs)} open fixtures around the committed windows")
+        placed = greedy_local_search(
+            open_pairs, self.num_teams, self.num_slots, self.num_venues, rest,
+            cell_open=cell_open, team_slot_open=team_slot_open,
+            should_stop=self.cancel_token.should_stop if self.cancel_token else None,
+            match_venue_open=self._match_venue_open(open_pairs)
+        )
+        if placed is None:
+            return None
+        merged = list(assignments)
+        for m, position in zip(open_matches, placed):
+            merged[m] = position
+        return merged
+    
+    def _window_candidates(self, remaining: List[int], pairs: np.ndarray, backlog: np.ndarray, target: int,
+                           rest: int, window_open: np.ndarray) -> List[int]:
+        """
+        Open fixtures a window's model considers: longest combined backlogs first, at most
+        ROLLING_CANDIDATE_FACTOR times the target, and per team at most that factor times the
+        matches it can fit into its open window slots.
+        """
+        team_capacity = ROLLING_CANDIDATE_FACTOR * (window_open.sum(axis=1) // (rest + 1) + 1)
+        taken = np.zeros(self.num_teams, dtype=np.int64)
+        candidates = []
+        order = sorted(remaining, key=lambda m: -(backlog[pairs[m, 0]] + backlog[pairs[m, 1]]))
+        for m in order:
+            t1, t2 = pairs[m]
+            if taken[t1] < team_capacity[t1] and taken[t2] < team_capacity[t2]:
+                candidates.append(m)
+                taken[[t1, t2]] += 1
+                if len(candidates) >= ROLLING_CANDIDATE_FACTOR * target:
+                    break
+        return sorted(candidates)
+    
+    def _rest_closures(self, assignments: List[Optional[Tuple[int, int]]], pairs: np.ndarray, rest: int) -> np.ndarray:
+        """teams × slots: True within rest slots of a match the team already has committed."""
+        played = np.zeros((self.num_teams, self.num_slots + 2 * rest + 1), dtype=np.int64)
+        for m, position in enumerate(assignments):
+            if position is not None:
+                played[pairs[m], position[0]] += 1
+        # A match at slot s closes s - rest .. s + rest: a running window sum over the played marks
+        windowed = np.cumsum(played, axis=1)
+        windowed[:, 2 * rest + 1:] -= windowed[:, :-(2 * rest + 1)].copy()
+        return windowed[:, rest:rest + self.num_slots] > 0
+    
+    def _stitch_rest(self, assignments: List[Tuple[int, int]], pairs: np.ndarray, rest: int) -> List[str]:
+        """Teams whose consecutive matches are fewer than rest + 1 slots apart."""
+        slots = np.array([s for s, _ in assignments], dtype=np.int64)
+        violations = []
+        for t in range(self.num_teams):
+            played = np.sort(slots[(pairs == t).any(axis=1)])
+            if len(played) > 1 and np.diff(played).min() <= rest:
+                violations.append(f"{self.teams[t].name} has matches {int(np.diff(played).min())} slot(s) apart")
+        return violations
+    
+    def _rest_breakers(self, assignments: List[Tuple[int, int]], pairs: np.ndarray, rest: int) -> List[int]:
+        """Matches that come fewer than rest + 1 slots after the previous match of one of their teams."""
+        slots = np.array([s for s, _ in assignments], dtype=np.int64)
+        breakers = set()
+        for t in range(self.num_teams):
+            played = np.flatnonzero((pairs == t).any(axis=1))
+            played = played[np.argsort(slots[played], kind="stable")]
+            breakers.update(played[1:][np.diff(slots[played]) <= rest].tolist())
+        return sorted(breakers)
+    
+    def _group_stage(self) -> bool:
+        """Whether to solve a groups-format tournament one group model at a time."""
+        if self.team_group is None or self.team_group.max() < 1:
+            return False
+        if not self.supports_group_stage:
+            logger.info(f"{type(self).__name__} solves all groups in one model")
+            return False
+        if any(limit["team"] is None for limit in self.compiled_constraints.day_limits):
+            logger.info("Per-day limits count the matches of every group; solving all groups in one model")
+            return False
+        return True
+    
+    def _solve_groups(self, match_pairs: List[Tuple[int, int]]) -> Tuple[int, Optional[List[Tuple[int, int]]]]:
+        """
+        Solve every group on its own share of the open cells, in parallel processes when the
+        solver profile allows several workers, and merge the group schedules.
+        Groups share no teams and no cells, so the merged schedule has no clashes by construction;
+        generate_schedule still validates it as a whole.
+        Returns INFEASIBLE if a group cannot fit into its share, so the caller can solve all groups together.
+        """
+        params = configure_solver(
+            self.solver,
+            self.request.solver_profile if self.request else None,
+            latency_budget=self.request.latency_budget if self.request else None
+        )
+        pairs = np.asarray(match_pairs, dtype=np.int64).reshape(-1, 2)
+        match_group = self.team_group[pairs[:, 0]]
+        num_groups = int(self.team_group.max()) + 1
+        cell_group = partition_cells(self.cell_open, np.bincount(match_group, minlength=num_groups))
+        workers = max(1, min(num_groups, params["num_workers"] or os.cpu_count()))
+        # Groups queue for the workers, so each gets its share of the time limit
+        max_time = params["max_time_in_seconds"] * min(1.0, workers / num_groups)
+        warm_start = self.request.warm_start if self.request else True
+        
+        # Every group model is built here; the workers only solve protos
+        base_cell_open = self.cell_open
+        groups = []
+        try:
+            for g in range(num_groups):
+                members = np.flatnonzero(match_group == g)
+                if not len(members):
+                    continue
+                self.cell_open = base_cell_open & (cell_group == g)
+                self.model = cp_model.CpModel()
+                self.objective_terms = []
+                match_vars = self._build_model([match_pairs[m] for m in members])
+                if warm_start and self.current_assignments:
+                    self._add_warm_start(match_vars, {i: self.current_assignments[m] for i, m in enumerate(members)
+                                                      if m in self.current_assignments})
+                if self.objective_terms:
+                    self.model.Minimize(sum(self.objective_terms))
+                proto = self.model.Proto()
+                groups.append({
+                    "group": g,
+                    "model": proto,
+                    "cells": [(int(members[m]), s, v, var.Index()) for (m, s, v), var in match_vars.items()],
+                    "has_objective": bool(self.objective_terms),
+                    "task": {"ones": [], "zeros": [], "max_time_in_seconds": max_time,
+                             "hint": dict(zip(proto.solution_hint.vars, proto.solution_hint.values)),
+                             "random_seed": params["random_seed"],
+                             "linearization_level": params["linearization_level"]},
+                })
+        except ValueError as e:
+            logger.warning(f"⚠️  Group {g + 1}: {e} in its share of the cells")
+            return cp_model.INFEASIBLE, None
+        finally:
+            self.cell_open = base_cell_open
+        
+        started = time.perf_counter()
+        results = {}
+        self.solution_log = []
+        
+        def collect(group: Dict, result: Dict) -> None:
+            results[group["group"]] = result
+            event = {"solutions": len(self.solution_log) + 1, "objective": result["objective"], "best_bound": None,
+                     "elapsed": round(time.perf_counter() - started, 3), "group": group["group"] + 1,
+                     "groups": len(groups), "status": self.solver.StatusName(result["status"])}
+            self.solution_log.append(event)
+            if self.progress_listener:
+                self.progress_listener(event)
+            logger.info(f"Group {group['group'] + 1}: {event['status']} after {event['elapsed']}s")
+        
+        logger.info(f"🧩 Group stage: {len(groups)} group models on {workers} worker(s), {max_time:g}s each")
+        if workers == 1:
+            for group in groups:
+                if self._cancelled():
+                    break
+                collect(group, solve_neighbourhood(group["model"], group["task"]))
+        else:
+            # spawn: the API serves jobs from threads, which fork would copy mid-flight
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            try:
+                futures = {pool.submit(solve_neighbourhood, group["model"], group["task"]): group for group in groups}
+                pending = set(futures)
+                while pending and not self._cancelled():
+                    done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(futures[future], future.result())
+            finally:
+                # Cancelled: queued groups are dropped, running ones finish their short solve in the background
+                pool.shutdown(wait=not self._cancelled(), cancel_futures=True)
+        
+        assignments = [None] * len(match_pairs)
+        statuses = []
+        for group in groups:
+            result = results.get(group["group"])
+            statuses.append(result["status"] if result else cp_model.UNKNOWN)
+            if result and result["solution"] is not None:
+                for m, s, v, index in group["cells"]:
+                    if result["solution"][index] == 1:
+                        assignments[m] = (s, v)
+        objectives = [results[group["group"]]["objective"] if group["group"] in results else None for group in groups]
+        
+        if cp_model.INFEASIBLE in statuses:
+            status = cp_model.INFEASIBLE
+        elif cp_model.MODEL_INVALID in statuses:
+            status = cp_model.MODEL_INVALID
+        elif any(objective is None for objective in objectives):
+            status = cp_model.UNKNOWN
+        elif all(status == cp_model.OPTIMAL for status in statuses):
+            status = cp_model.OPTIMAL
+        else:
+            status = cp_model.FEASIBLE
+        
+        # Group objectives add up (last_slot: the latest group), except where they count shared days
+        self.objective_value = None
+        if status in (cp_model.OPTIMAL, cp_model.FEASIBLE) and any(group["has_objective"] for group in groups):
+            objective = self.request.objective if self.request else None
+            self.objective_value = max(objectives) if objective == "last_slot" else sum(objectives)
+        
+        self.solver_stats = {
+            "status": self.solver.StatusName(status),
+            "num_workers": workers,
+            "linearization_level": params["linearization_level"],
+            "random_seed": params["random_seed"],
+            "max_time_in_seconds": params["max_time_in_seconds"],
+            "relative_gap_limit": params["relative_gap_limit"],
+            "wall_time": round(time.perf_counter() - started, 3),
+            "solutions_found": len(self.solution_log),
+            "stopped_early": self._cancelled(),
+            "group_stage": {
+                "groups": len(groups),
+                "workers": workers,
+                "matches_per_group": np.bincount(match_group, minlength=num_groups).tolist(),
+                "cells_per_group": np.bincount(cell_group[cell_group >= 0], minlength=num_groups).tolist(),
+                "statuses": [self.solver.StatusName(status) for status in statuses],
+                "objectives": objectives,
+            },
+        }
+        logger.info(f"🧩 Group stage merged: {self.solver_stats['status']} in {self.solver_stats['wall_time']}s")
+        if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            return status, assignments
+        return status, None
+    
+    def _cache_key(self) -> str:
+        """Hash of the tournament inputs and request options this solve depends on."""
+        return schedule_cache_key(self.tournament, self.teams, self.venues, self.spec.constraints,
+                                  self._cache_options())
+    
+    def _cache_options(self) -> Dict:
+        """Request options that are part of the cache key."""
+        request = self.request or ScheduleGenerateRequest(tournament_id=self.tournament_id)
+        # Warm starting changes how fast a schedule is found, not which schedules are valid
+        options = request.model_dump(mode="json", exclude={"tournament_id", "warm_start"})
+        # The engine may come from the tournament settings rather than the request
+        options["engine"] = self.engine_name
+        return options
+    
+    def _cached_solution(self, cache: Optional[ScheduleCache], cache_key: Optional[str],
+                         num_matches: int) -> Optional[Dict]:
+        """
+        Look the solve up in the schedule cache.
+        Returns the cached entry with its solver status and (slot, venue) tuples, or None on a miss.
+        """
+        entry = cache.get(cache_key) if cache is not None else None
+        if not entry or len(entry["assignments"]) != num_matches:
+            return None
+        
+        logger.info(f"♻️  Schedule cache hit ({cache_key[:12]}), skipping the solve")
+        self.solver_stats = entry["solver_stats"]
+        self.solution_log = entry["solution_log"]
+        entry["status"] = cp_model.OPTIMAL if entry["status"] == "optimal" else cp_model.FEASIBLE
+        entry["assignments"] = [tuple(position) for position in entry["assignments"]]
+        return entry
+    
+    def _cancelled(self) -> bool:
+        """True once the solve's cancellation token has been cancelled."""
+        return self.cancel_token is not None and self.cancel_token.cancelled
+    
+    def _load_saved_matches(self, match_pairs: List[Tuple[int, int]]) -> Dict[int, Match]:
+        """
+        Map match index -> saved Match row for the same fixture.
+        Every saved row is kept in self.existing_matches; when a fixture has several rows,
+        a played one wins over an open one, and an open one over a cancelled one.
+        """
+        team_index = {team.id: t for t, team in enumerate(self.teams)}
+        status_rank = {status: 0 for status in FROZEN_MATCH_STATUSES}
+        status_rank.update({status: 1 for status in OPEN_MATCH_STATUSES})
+        
+        unmatched = {}
+        for m, pair in enumerate(match_pairs):
+            unmatched.setdefault(pair, []).append(m)
+        
+        self.existing_matches = self.db.query(Match).filter(Match.tournament_id == self.tournament_id).all()
+        saved = {}
+        for match in sorted(self.existing_matches, key=lambda row: status_rank.get(row.status, 2)):
+            t1 = team_index.get(match.team1_id)
+            t2 = team_index.get(match.team2_id)
+            if t1 is None or t2 is None:
+                continue
+            
+            # Prefer the same home/away order, but a single round robin may have either
+            candidates = unmatched.get((t1, t2)) or unmatched.get((t2, t1))
+            if candidates:
+                saved[candidates.pop(0)] = match
+        
+        return saved
+    
+    def _load_current_assignments(self) -> Dict[int, Tuple[int, int]]:
+        """
+        Map match index -> (slot, venue) of the fixture currently saved for it.
+        Saved matches whose time or venue no longer fit the calendar are skipped.
+        """
+        slot_index = {slot_time: s for s, slot_time in enumerate(self.time_slots)}
+        venue_index = {venue.id: v for v, venue in enumerate(self.venues)}
+        
+        current = {}
+        for m, match in self.saved_matches.items():
+            s = slot_index.get(match.scheduled_start)
+            v = venue_index.get(match.venue_id)
+            if s is not None and v is not None:
+                current[m] = (s, v)
+        
+        return current
+    
+    def _freeze_played_matches(self, match_pairs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Incremental mode: close the slots before request.reschedule_from (default now), and
+        the venue and team-rest cells taken by completed and in-progress matches.
+        Returns the fixtures still to schedule: saved SCHEDULED/POSTPONED ones and any never saved.
+        """
+        cutoff = self.request.reschedule_from or datetime.utcnow()
+        self.cell_open[:bisect.bisect_left(self.time_slots, cutoff)] = False
+        self.base_cell_open[:bisect.bisect_left(self.time_slots, cutoff)] = False
+        
+        team_index = {team.id: t for t, team in enumerate(self.teams)}
+        venue_index = {venue.id: v for v, venue in enumerate(self.venues)}
+        slot_starts = np.array(self.time_slots, dtype="datetime64[s]")
+        duration = np.timedelta64(self.tournament.match_duration_hours, "h")
+        rest = np.timedelta64(self.tournament.min_rest_hours, "h")
+        
+        for match in self.existing_matches:
+            if match.status not in FROZEN_MATCH_STATUSES or match.scheduled_start is None:
+                continue
+            start = np.datetime64(match.scheduled_start, "s")
+            end = np.datetime64(match.scheduled_end, "s") if match.scheduled_end else start + duration
+            
+            # The venue is taken by any slot overlapping the match...
+            v = venue_index.get(match.venue_id)
+            if v is not None:
+                self.cell_open[(slot_starts < end) & (slot_starts + duration > start), v] = False
+                self.base_cell_open[(slot_starts < end) & (slot_starts + duration > start), v] = False
+            
+            # ...and both teams need their full rest before and after it
+            resting = (slot_starts < end + rest) & (slot_starts + duration + rest > start)
+            names = []
+            for team_id in (match.team1_id, match.team2_id):
+                t = team_index.get(team_id)
+                if t is not None:
+                    self.team_slot_open[t, resting] = False
+                    self.base_team_slot_open[t, resting] = False
+                names.append(self.teams[t].name if t is not None else str(team_id))
+            
+            self.frozen_matches.append({
+                "match_number": match.match_number,
+                "team1_id": match.team1_id,
+                "team2_id": match.team2_id,
+                "team1_name": names[0],
+                "team2_name": names[1],
+                "venue_id": match.venue_id,
+                "venue_name": self.venues[v].name if v is not None else str(match.venue_id),
+                "scheduled_start": match.scheduled_start,
+                "scheduled_end": match.scheduled_end or match.scheduled_start + timedelta(hours=self.tournament.match_duration_hours),
+                "round": match.round
+            })
+        
+        keep = [m for m in range(len(match_pairs))
+                if m not in self.saved_matches or self.saved_matches[m].status in OPEN_MATCH_STATUSES]
+        self.saved_matches = {i: self.saved_matches[m] for i, m in enumerate(keep) if m in self.saved_matches}
+        self._keep_matches(keep)
+        
+        logger.info(
+            f"♻️  Incremental mode: {len(self.frozen_matches)} matches frozen, "
+            f"{len(keep)} of {len(match_pairs)} fixtures re-solved from {cutoff}"
+        )
+        return [match_pairs[m] for m in keep]
+    
+    def _keep_matches(self, match_indices: List[int]) -> None:
+        """Narrow per-match engine state to the given fixtures; engines without any ignore it."""
+        return None
+    
+    def _add_warm_start(self, match_vars: Dict, current: Dict[int, Tuple[int, int]]) -> None:
+        """Hint the current fixtures and optionally penalize every match that moves."""
+        minimize_moves = self.request.minimize_moves if self.request else False
+        kept = []
+        for m, (s, v) in current.items():
+            if self._add_assignment_hint(match_vars, m, s, v):
+                if minimize_moves:
+                    kept.append(self._assignment_literal(match_vars, m, s, v))
+        
+        logger.info(f"🔥 Warm start: {len(current)} fixtures hinted from the current schedule")
+        if kept:
+            self.objective_terms.append(len(kept) - sum(kept))
+    
+    def _add_assignment_hint(self, match_vars: Dict, m: int, s: int, v: int) -> bool:
+        """Hint match m at (s, v). Returns False if (s, v) is no longer open for match m."""
+        chosen = match_vars.get((m, s, v))
+        if chosen is None:
+            return False
+        for _, var in self.match_cells[m]:
+            self.model.AddHint(var, int(var is chosen))
+        return True
+    
+    def _assignment_literal(self, match_vars: Dict, m: int, s: int, v: int):
+        """Literal that can only be true when match m is played at (s, v)."""
+        return match_vars[(m, s, v)]
+    
+    def _extract_assignments(self, match_vars: Dict, match_pairs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Read the (slot, venue) chosen for each match from the solver."""
+        assignments = [None] * len(match_pairs)
+        
+        for (m, s, v), var in match_vars.items():
+            if self.solver.Value(var) == 1:
+                assignments[m] = (s, v)
+        
+        return assignments
+    
+    def _round_label(self, match_index: int) -> Optional[str]:
+        """Round name stored with a match; engines without round structure leave it empty."""
+        return None
+    
+    def _solution(self, assignments: List[Tuple[int, int]], match_pairs: List[Tuple[int, int]]) -> Solution:
+        """Pack the (slot, venue) chosen for each match into a Solution."""
+        return Solution.from_lists(match_pairs, assignments, [self._round_label(m) for m in range(len(match_pairs))])
     
     def _validate_solution(self, scheduled_matches: List[Dict]) -> Tuple[bool, List[str]]:
         """
@@ -450,32 +1734,95 @@ class CricketScheduler:
         return (len(conflicts) == 0, conflicts)
 
     
-    def _save_schedule_to_db(self, scheduled_matches: List[Dict]):
-        """Save the generated schedule to the database."""
-        # Delete existing matches for this tournament
-        self.db.query(Match).filter(Match.tournament_id == self.tournament_id).delete()
-        
-        # Create new matches
-        for match_data in scheduled_matches:
-            match = Match(
-                tournament_id=self.tournament_id,
-                team1_id=match_data["team1_id"],
-                team2_id=match_data["team2_id"],
-                venue_id=match_data["venue_id"],
-                scheduled_start=match_data["scheduled_start"],
-                scheduled_end=match_data["scheduled_end"],
-                match_number=match_data["match_number"],
-                status=MatchStatus.SCHEDULED
-            )
-            self.db.add(match)
+    def _save_schedule_to_db(self, solution: Solution):
+        """Replace the tournament's saved matches with the solution."""
+        save_solution(self.db, self.spec, solution)
+    
+    def _save_incremental_schedule(self, scheduled_matches: List[Dict], assignments: List[Tuple[int, int]],
+                                   match_pairs: List[Tuple[int, int]]) -> Dict[str, int]:
+        """
+        Write back only the open fixtures that changed.
+        Frozen and cancelled rows are never touched, saved rows keep their match number and
+        new fixtures are numbered after the highest saved one.
+        Returns the number of rows updated, inserted and deleted.
+        """
+        records = {(match["team1_id"], match["team2_id"], match["scheduled_start"]): match
+                   for match in scheduled_matches}
+        next_number = max((match.match_number or 0 for match in self.existing_matches), default=0) + 1
+        rows_changed = {"updated": 0, "inserted": 0, "deleted": 0}
+        
+        for m, ((t1, t2), (s, _)) in enumerate(zip(match_pairs, assignments)):
+            record = records[(self.teams[t1].id, self.teams[t2].id, self.time_slots[s])]
+            match = self.saved_matches.get(m)
+            if match is None:
+                match = Match(tournament_id=self.tournament_id, match_number=next_number)
+                next_number += 1
+                self.db.add(match)
+                rows_changed["inserted"] += 1
+            elif (match.team1_id, match.team2_id, match.venue_id, match.scheduled_start, match.round, match.status) == (
+                    record["team1_id"], record["team2_id"], record["venue_id"], record["scheduled_start"],
+                    record["round"], MatchStatus.SCHEDULED):
+                record["match_number"] = match.match_number
+                continue
+            else:
+                rows_changed["updated"] += 1
+            
+            match.team1_id = record["team1_id"]
+            match.team2_id = record["team2_id"]
+            match.venue_id = record["venue_id"]
+            match.scheduled_start = record["scheduled_start"]
+            match.scheduled_end = record["scheduled_end"]
+            match.round = record["round"]
+            match.status = MatchStatus.SCHEDULED
+            record["match_number"] = match.match_number
+        
+        # Open rows that no longer belong to any fixture
+        kept_rows = {id(match) for match in self.saved_matches.values()}
+        for match in self.existing_matches:
+            if match.status in OPEN_MATCH_STATUSES and id(match) not in kept_rows:
+                self.db.delete(match)
+                rows_changed["deleted"] += 1
         
         self.db.commit()
-        logger.info(f"Saved {len(scheduled_matches)} matches to database")
+        logger.info(
+            f"Incremental save: {rows_changed['updated']} updated, {rows_changed['inserted']} inserted, "
+            f"{rows_changed['deleted']} deleted"
+        )
+        return rows_changed
 
 
-def generate_tournament_schedule(db: Session, tournament_id: str, request: Optional[ScheduleGenerateRequest] = None) -> Dict:
+def generate_tournament_schedule(db: Session, tournament_id: str, request: Optional[ScheduleGenerateRequest] = None,
+                                 progress_listener: Optional[Callable[[Dict], bool]] = None,
+                                 cancel_token: Optional[CancellationToken] = None) -> Dict:
     """
     Main function to generate schedule for a tournament.
+    The engine comes from request.engine, else the tournament's settings.engine, else
+    SCHEDULER_DEFAULT_ENGINE (see app.services.engines); knockout tournaments always go to the
+    bracket engine. The result names the engine that ran; an engine that cannot be resolved
+    gives a success: False result.
+    progress_listener receives each improving solution and may return True to accept it early;
+    cancel_token stops the search from another thread.
     """
-    scheduler = CricketScheduler(db, tournament_id)
-    return scheduler.generate_schedule(request)
+    tournament = db.query(Tournament.format, Tournament.settings).filter(
+        Tournament.id == (UUID(tournament_id) if isinstance(tournament_id, str) else tournament_id)
+    ).first()
+    try:
+        engine = resolve_engine(request.engine if request else None, tournament.format if tournament else None,
+                                tournament.settings if tournament else None)
+    except ValueError as e:
+        # e.g. a settings.engine saved before the engine was renamed or unregistered
+        logger.warning(f"Cannot pick a scheduling engine: {str(e)}")
+        return {
+            "success": False,
+            "message": "No usable scheduling engine",
+            "matches_scheduled": 0,
+            "conflicts": [f"❌ {str(e)}"]
+        }
+    
+    scheduler = engine_class(engine)(db, tournament_id)
+    scheduler.engine_name = engine
+    scheduler.progress_listener = progress_listener
+    scheduler.cancel_token = cancel_token
+    result = scheduler.generate_schedule(request)
+    result["engine"] = engine
+    return result
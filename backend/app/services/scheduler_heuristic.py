@@ -0,0 +1,66 @@
+"""
+HEURISTIC SCHEDULER - Greedy construction + tabu repair without CP-SAT.
+Meant for very large tournaments (24+ teams, hundreds of matches) where the
+constraint models hit their time limit; typically answers in under a second.
+"""
+
+from ortools.sat.python import cp_model
+from typing import List, Tuple, Optional
+import logging
+import time
+
+from app.core.config import settings
+from app.services.scheduler import CricketScheduler, LATENCY_BUDGETS
+from app.services.local_search import greedy_local_search, DEFAULT_TIME_LIMIT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class HeuristicCricketScheduler(CricketScheduler):
+    """
+    Cricket scheduler backed by greedy_local_search instead of a solver.
+    Schedules are conflict-free but not optimized; objectives and soft constraints are ignored.
+    """
+
+    engine_name = "heuristic"
+    solver_name = "local-search"
+
+    def _solve(self, match_pairs: List[Tuple[int, int]]) -> Tuple[int, Optional[List[Tuple[int, int]]]]:
+        """Run the greedy + tabu search. Returns UNKNOWN if it runs out of time."""
+        if self.request and self.request.objective:
+            logger.warning(f"Heuristic engine ignores objective '{self.request.objective}'")
+        if self._optimize_for() in ("minimize_travel", "fairness"):
+            logger.warning(f"Heuristic engine ignores optimize_for={self._optimize_for()}")
+        if self.request and self.request.horizon_weeks:
+            logger.warning("Heuristic engine schedules the whole season at once; ignoring horizon_weeks")
+        if self.compiled_constraints.has_soft:
+            logger.warning("Heuristic engine ignores soft scheduling constraints")
+        if self.compiled_constraints.hard_day_limits:
+            raise ValueError("The heuristic engine cannot enforce hard max_matches_per_day constraints")
+
+        # Only the time limit and seed of the solver profile (or the latency budget's limit) apply here
+        profile = self.request.solver_profile if self.request else None
+        budget = LATENCY_BUDGETS.get(self.request.latency_budget, {}) if self.request else {}
+        time_limit = ((profile.max_time_in_seconds if profile else None) or budget.get("max_time_in_seconds")
+                      or DEFAULT_TIME_LIMIT_SECONDS)
+        seed = profile.random_seed if profile and profile.random_seed is not None else settings.SOLVER_RANDOM_SEED
+
+        logger.info(f"🚀 Starting greedy + local search (max {time_limit:g} seconds)...")
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        assignments = greedy_local_search(
+            match_pairs, self.num_teams, self.num_slots, self.num_venues, self._min_rest_slots(),
+            time_limit=time_limit, seed=seed, cell_open=self.cell_open, team_slot_open=self.team_slot_open,
+            should_stop=self.cancel_token.should_stop if self.cancel_token else None,
+            match_venue_open=self._match_venue_open(match_pairs)
+        )
+        status = cp_model.UNKNOWN if assignments is None else cp_model.FEASIBLE
+
+        self.solver_stats = {
+            "status": "UNKNOWN" if assignments is None else "FEASIBLE",
+            "num_workers": 1,
+            "random_seed": seed,
+            "max_time_in_seconds": time_limit,
+            "wall_time": round(time.perf_counter() - wall_start, 3),
+            "user_time": round(time.process_time() - cpu_start, 3),
+        }
+        return status, assignments
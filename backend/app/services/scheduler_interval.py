@@ -0,0 +1,185 @@
+"""
+INTERVAL SCHEDULER - CP-SAT engine built on optional interval variables.
+Each match gets a single start variable plus one optional interval per venue,
+so the model grows with matches × venues instead of matches × slots × venues.
+"""
+
+from ortools.sat.python import cp_model
+from typing import List, Dict, Tuple
+import logging
+
+import numpy as np
+
+from app.services.scheduler import CricketScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class IntervalCricketScheduler(CricketScheduler):
+    """
+    Cricket scheduler that models matches as intervals on the slot axis.
+    Venue double-booking, team clashes and rest periods are all expressed
+    with AddNoOverlap, which CP-SAT propagates far better than dense booleans.
+    """
+
+    engine_name = "interval"
+    # Matches have no per-cell literals for LNS to fix
+    supports_lns = False
+    # Every interval is mandatory, so a window cannot leave fixtures for later
+    supports_rolling_horizon = False
+    # Group models are merged through per-cell literals, which the interval model has none of
+    supports_group_stage = False
+
+    def _build_model(self, match_pairs: List[Tuple[int, int]]) -> Dict:
+        """
+        Build the interval model.
+        Returns the start and venue-presence variables for each match.
+        """
+        starts, presences = self._add_match_intervals(match_pairs)
+        self._add_team_constraints(match_pairs, starts)
+        self._add_day_limits(match_pairs, starts, presences)
+        self._add_objective(match_pairs, starts)
+
+        return {"starts": starts, "presences": presences}
+
+    def _add_match_intervals(self, match_pairs: List[Tuple[int, int]]) -> Tuple[List, Dict]:
+        """
+        Create one start per match and one optional interval per (match, open venue).
+        Starts only range over slots open to both teams; cells closed at some venues
+        of an otherwise open slot are blocked with fixed intervals.
+        """
+        starts = []
+        presences = {}
+        venue_intervals = {v: [] for v in range(self.num_venues)}
+        slot_open = self.cell_open.any(axis=1)
+        match_venue_open = self.compiled_constraints.match_venue_open(match_pairs)
+
+        logger.info("Adding interval variables: one start per match, one optional interval per venue")
+        for m, (t1, t2) in enumerate(match_pairs):
+            match_slot_open = (self.cell_open & match_venue_open[m]).any(axis=1)
+            open_slots = np.flatnonzero(match_slot_open & self.team_slot_open[t1] & self.team_slot_open[t2])
+            if not len(open_slots):
+                raise ValueError(f"No open time slot left for {self.teams[t1].name} vs {self.teams[t2].name}")
+            start = self.model.NewIntVarFromDomain(
+                cp_model.Domain.FromValues(open_slots.tolist()), f'match_{m}_start'
+            )
+            starts.append(start)
+
+            # CONSTRAINT 1: Each match is played at exactly one venue (among those open in one of its slots)
+            venue_literals = []
+            for v in np.flatnonzero(self.cell_open[open_slots].any(axis=0) & match_venue_open[m]).tolist():
+                present = self.model.NewBoolVar(f'match_{m}_venue_{v}')
+                presences[(m, v)] = present
+                venue_literals.append(present)
+                venue_intervals[v].append(
+                    self.model.NewOptionalFixedSizeIntervalVar(start, 1, present, f'match_{m}_venue_{v}_interval')
+                )
+            self.model.AddExactlyOne(venue_literals)
+
+        for s, v in np.argwhere(~self.cell_open & slot_open[:, None]):
+            venue_intervals[v].append(self.model.NewFixedSizeIntervalVar(int(s), 1, f'slot_{s}_venue_{v}_closed'))
+
+        # CONSTRAINT 2: At most one match per venue per time slot
+        logger.info("Adding constraint: No venue double-booking (NoOverlap per venue)")
+        for v in range(self.num_venues):
+            self.model.AddNoOverlap(venue_intervals[v])
+
+        return starts, presences
+
+    def _add_team_constraints(self, match_pairs: List[Tuple[int, int]], starts: List) -> None:
+        """
+        No team clash and minimum rest between a team's matches.
+        A team's interval covers the match slot plus its rest window, so two of
+        its intervals only avoid overlapping when they are min_rest_slots + 1 apart.
+        """
+        rest_span = self._min_rest_slots() + 1
+        team_intervals = {t: [] for t in range(self.num_teams)}
+
+        for m, (t1, t2) in enumerate(match_pairs):
+            rest_interval = self.model.NewFixedSizeIntervalVar(starts[m], rest_span, f'match_{m}_rest_interval')
+            team_intervals[t1].append(rest_interval)
+            team_intervals[t2].append(rest_interval)
+
+        # CONSTRAINTS 3 + 4: No team clash and minimum rest between matches
+        logger.info(f"Adding constraint: No team clash with {rest_span - 1} rest slots (NoOverlap per team)")
+        for team_idx in range(self.num_teams):
+            if len(team_intervals[team_idx]) > 1:
+                self.model.AddNoOverlap(team_intervals[team_idx])
+
+    def _add_day_limits(self, match_pairs: List[Tuple[int, int]], starts: List, presences: Dict) -> None:
+        """
+        Hard max_matches_per_day rows: each match gets a one-day interval on its day,
+        and a cumulative with the limit as capacity caps how many share a day.
+        Soft rows need per-day literals this engine does not have, so they are skipped.
+        """
+        if self.compiled_constraints.has_soft:
+            logger.warning("Interval engine ignores soft scheduling constraints")
+        limits = self.compiled_constraints.hard_day_limits
+        if not limits:
+            return
+
+        days = []
+        for m, start in enumerate(starts):
+            day = self.model.NewIntVar(0, int(self.slot_day[-1]), f'match_{m}_day')
+            self.model.AddElement(start, self.slot_day.tolist(), day)
+            days.append(day)
+
+        for i, limit in enumerate(limits):
+            intervals = []
+            for m, pair in enumerate(match_pairs):
+                if limit["team"] is not None and limit["team"] not in pair:
+                    continue
+                if limit["venue"] is None:
+                    intervals.append(self.model.NewFixedSizeIntervalVar(days[m], 1, f'limit_{i}_match_{m}_day'))
+                elif (m, limit["venue"]) in presences:
+                    intervals.append(self.model.NewOptionalFixedSizeIntervalVar(
+                        days[m], 1, presences[(m, limit["venue"])], f'limit_{i}_match_{m}_day'
+                    ))
+            if len(intervals) > limit["limit"]:
+                self.model.AddCumulative(intervals, [1] * len(intervals), limit["limit"])
+
+    def _add_objective(self, match_pairs: List[Tuple[int, int]], starts: List) -> None:
+        """Compact scheduling, only built when an objective mode is requested."""
+        if self._optimize_for() in ("minimize_travel", "fairness"):
+            logger.warning(f"Interval engine ignores optimize_for={self._optimize_for()}")
+        objective = self.request.objective if self.request else None
+        if not objective:
+            return
+        if objective not in ("last_slot", "match_days"):
+            raise ValueError(f"Unknown objective: {objective}")
+        if objective == "match_days":
+            logger.warning("Interval engine has no per-day literals; minimizing the last used slot instead")
+
+        min_last_slot, _ = self._objective_lower_bounds(match_pairs)
+        max_slot_used = self.model.NewIntVar(min_last_slot, self.num_slots - 1, 'max_slot')
+        self.model.AddMaxEquality(max_slot_used, starts)
+        self.objective_terms.append(max_slot_used)
+
+    def _add_assignment_hint(self, match_vars: Dict, m: int, s: int, v: int) -> bool:
+        """Hint match m's start and venue. Returns False if match m or that venue is not in the model."""
+        if m >= len(match_vars["starts"]) or (m, v) not in match_vars["presences"]:
+            return False
+        self.model.AddHint(match_vars["starts"][m], s)
+        for v2 in range(self.num_venues):
+            if (m, v2) in match_vars["presences"]:
+                self.model.AddHint(match_vars["presences"][(m, v2)], int(v2 == v))
+        return True
+
+    def _assignment_literal(self, match_vars: Dict, m: int, s: int, v: int):
+        """Literal that can only be true when match m starts at slot s in venue v."""
+        kept = self.model.NewBoolVar(f'match_{m}_kept')
+        self.model.Add(match_vars["starts"][m] == s).OnlyEnforceIf(kept)
+        self.model.AddImplication(kept, match_vars["presences"][(m, v)])
+        return kept
+
+    def _extract_assignments(self, match_vars: Dict, match_pairs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Read each match's start slot and the venue whose interval is present."""
+        assignments = []
+
+        for m in range(len(match_pairs)):
+            s = self.solver.Value(match_vars["starts"][m])
+            v = next(v for v in range(self.num_venues)
+                     if (m, v) in match_vars["presences"] and self.solver.Value(match_vars["presences"][(m, v)]) == 1)
+            assignments.append((s, v))
+
+        return assignments
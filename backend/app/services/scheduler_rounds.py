@@ -0,0 +1,282 @@
+"""
+ROUND-BASED SCHEDULER - Two-phase engine for round robin formats.
+Phase 1 builds the rounds deterministically with the Berger/circle method,
+phase 2 uses a small CP-SAT interval model to map rounds to slot blocks and
+matches to venues.
+"""
+
+from ortools.sat.python import cp_model
+from typing import List, Dict, Tuple, Optional
+import logging
+
+from app.schemas.schemas import ScheduleGenerateRequest
+from app.services.scheduler_interval import IntervalCricketScheduler
+
+logger = logging.getLogger(__name__)
+
+ROUND_ROBIN_FORMATS = ("round_robin", "league", "double_round_robin")
+MIRROR_SCHEMES = ("mirror", "french", "english")
+
+
+def circle_method_rounds(num_teams: int) -> List[List[Tuple[int, int]]]:
+    """
+    Build a single round robin with the circle method.
+    Team 0 stays fixed while the others rotate; with an odd number of teams a
+    dummy is added and whoever meets it has a bye. Returns a list of rounds,
+    each a list of (home, away) team indices in which no team appears twice.
+    """
+    teams: List[Optional[int]] = list(range(num_teams))
+    if num_teams % 2:
+        teams.append(None)  # Bye
+
+    size = len(teams)
+    rounds = []
+    for r in range(size - 1):
+        fixtures = []
+        for i in range(size // 2):
+            home, away = teams[i], teams[size - 1 - i]
+            if home is None or away is None:
+                continue
+            # Alternate the fixed team between home and away
+            if i == 0 and r % 2 == 1:
+                home, away = away, home
+            fixtures.append((home, away))
+        rounds.append(fixtures)
+
+        # Rotate every team except the first one place clockwise
+        teams = [teams[0], teams[-1]] + teams[1:-1]
+
+    return rounds
+
+
+def mirror_round_order(num_rounds: int, scheme: str) -> List[int]:
+    """
+    First-leg round replayed (home and away swapped) at each second-leg position.
+    mirror:  1, 2, ..., R
+    french:  2, 3, ..., R, 1
+    english: R, 1, 2, ..., R-1 (the last first-leg fixtures are replayed straight away)
+    """
+    if scheme == "mirror":
+        return list(range(num_rounds))
+    if scheme == "french":
+        return list(range(1, num_rounds)) + [0]
+    if scheme == "english":
+        return [num_rounds - 1] + list(range(num_rounds - 1))
+    raise ValueError(f"Unknown mirror scheme: {scheme}")
+
+
+class RoundRobinCricketScheduler(IntervalCricketScheduler):
+    """
+    Round robin scheduler that fixes the round structure before solving.
+    The solver no longer has to discover who plays whom when: it only orders
+    rounds on the slot axis and picks venues, which keeps 16-20 team leagues small.
+    Groups fall back to the plain interval model; knockouts are left to the
+    bracket engine (generate_match_pairs raises for them).
+
+    With request.mirror_scheme set, a double round robin is solved for the first
+    leg only and the second leg is derived from it, halving the model. The solver
+    never sees the second leg, so such results are reported as feasible, without
+    an objective value.
+    """
+
+    engine_name = "rounds"
+    # second-leg match index -> first-leg match it replays, when mirroring
+    mirror_source: Optional[List[int]] = None
+    _mirror_disabled = False
+
+    def generate_schedule(self, request: Optional[ScheduleGenerateRequest] = None) -> Dict:
+        """Generate the schedule, solving both legs together if the mirrored second leg cannot be placed."""
+        self._mirror_disabled = False
+        result = super().generate_schedule(request)
+
+        if self.mirror_source is not None:
+            if result["success"]:
+                result["mirror_scheme"] = self.request.mirror_scheme
+                # Optimality and the objective only cover the first leg
+                result["status"] = "feasible"
+                result["objective_value"] = None
+            else:
+                logger.warning(f"Mirrored schedule failed ({result['message']}); solving both legs together")
+                self._mirror_disabled = True
+                self.model = cp_model.CpModel()
+                self.solver = cp_model.CpSolver()
+                result = super().generate_schedule(request)
+
+        return result
+
+    def _cache_options(self) -> Dict:
+        """The fallback that solves both legs together yields a different fixture list."""
+        options = super()._cache_options()
+        options["mirror_disabled"] = self._mirror_disabled
+        return options
+
+    def _mirror_scheme(self) -> Optional[str]:
+        """Requested mirroring scheme, if it applies to this tournament (never in incremental mode)."""
+        scheme = self.request.mirror_scheme if self.request else None
+        if not scheme or self._mirror_disabled or self.tournament.format.value != "double_round_robin":
+            return None
+        if self.request.incremental:
+            logger.warning("Mirroring is ignored in incremental mode; the open fixtures are solved as one leg")
+            return None
+        if scheme not in MIRROR_SCHEMES:
+            raise ValueError(f"Unknown mirror scheme: {scheme}")
+        return scheme
+
+    def _generate_match_pairs(self) -> List[Tuple[int, int]]:
+        """Generate match pairs round by round, recording each match's round."""
+        self.mirror_source = None
+        if self.tournament.format.value not in ROUND_ROBIN_FORMATS:
+            self.match_rounds = None
+            return super()._generate_match_pairs()
+
+        rounds = circle_method_rounds(self.num_teams)
+        if self.tournament.format.value == "double_round_robin":
+            # Second half replays the first with home and away swapped
+            scheme = self._mirror_scheme()
+            order = mirror_round_order(len(rounds), scheme or "mirror")
+
+            if scheme:
+                first_leg_index = []
+                m = 0
+                for fixtures in rounds:
+                    first_leg_index.append(m)
+                    m += len(fixtures)
+                self.first_leg_size = m
+                self.mirror_source = [first_leg_index[r] + j for r in order for j in range(len(rounds[r]))]
+
+            rounds = rounds + [[(away, home) for home, away in rounds[r]] for r in order]
+
+        pairs = []
+        self.match_rounds = []
+        for r, fixtures in enumerate(rounds):
+            for pair in fixtures:
+                pairs.append(pair)
+                self.match_rounds.append(r)
+
+        return pairs
+
+    def _keep_matches(self, match_indices: List[int]) -> None:
+        """Keep the round of each fixture that is still to be scheduled."""
+        if self.match_rounds is not None:
+            self.match_rounds = [self.match_rounds[m] for m in match_indices]
+
+    def _add_team_constraints(self, match_pairs: List[Tuple[int, int]], starts: List) -> None:
+        """
+        Order rounds on the slot axis instead of pairwise team no-overlap.
+        Every team plays at most once per round, so rest only has to hold between
+        a team's consecutive matches in round order - a single linear precedence.
+        """
+        if self.match_rounds is None:
+            super()._add_team_constraints(match_pairs, starts)
+            return
+
+        rest_span = self._min_rest_slots() + 1
+        match_rounds = self.match_rounds[:len(match_pairs)]
+        num_rounds = max(match_rounds) + 1
+
+        # Round blocks: no match of round r + 1 starts before the last match of round r
+        logger.info(f"Adding constraint: {num_rounds} round blocks in circle-method order")
+        round_ends = [self.model.NewIntVar(0, self.num_slots - 1, f'round_{r}_end') for r in range(num_rounds)]
+        for m, r in enumerate(match_rounds):
+            self.model.Add(round_ends[r] >= starts[m])
+            if r > 0:
+                self.model.Add(starts[m] >= round_ends[r - 1])
+        # Chain the ends too, so rounds left empty by incremental mode keep the order
+        for r in range(1, num_rounds):
+            self.model.Add(round_ends[r] >= round_ends[r - 1])
+
+        # CONSTRAINTS 3 + 4: Consecutive matches of a team are a full rest window apart
+        logger.info(f"Adding constraint: {rest_span - 1} rest slots between consecutive rounds of a team")
+        last_match = {}
+        for m, (t1, t2) in enumerate(match_pairs):
+            for team_idx in (t1, t2):
+                if team_idx in last_match:
+                    self.model.Add(starts[m] >= starts[last_match[team_idx]] + rest_span)
+                last_match[team_idx] = m
+
+    def _round_label(self, match_index: int) -> Optional[str]:
+        """Circle-method round of the match, e.g. "Round 3"."""
+        if self.match_rounds is None:
+            return None
+        return f"Round {self.match_rounds[match_index] + 1}"
+
+    def _build_model(self, match_pairs: List[Tuple[int, int]]) -> Dict:
+        """Build the model, for the first leg only when mirroring."""
+        if self.mirror_source is None:
+            return super()._build_model(match_pairs)
+
+        first_leg = match_pairs[:self.first_leg_size]
+        logger.info(
+            f"Mirrored double round robin ({self.request.mirror_scheme}): "
+            f"solving {len(first_leg)} of {len(match_pairs)} matches"
+        )
+        match_vars = super()._build_model(first_leg)
+
+        # Keep the first leg in the first half so its mirror image fits behind it
+        rest_span = self._min_rest_slots() + 1
+        first_leg_horizon = (self.num_slots - 1 - rest_span) // 2
+        for start in match_vars["starts"]:
+            self.model.Add(start <= first_leg_horizon)
+
+        return match_vars
+
+    def _extract_assignments(self, match_vars: Dict, match_pairs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Read the first leg from the solver and derive the second leg from it when mirroring."""
+        if self.mirror_source is None:
+            return super()._extract_assignments(match_vars, match_pairs)
+
+        first_leg = super()._extract_assignments(match_vars, match_pairs[:self.first_leg_size])
+        second_leg = self._derive_second_leg(first_leg, match_pairs)
+        if second_leg is None:
+            raise ValueError("Mirrored second leg does not fit in the remaining time slots")
+
+        return first_leg + second_leg
+
+    def _derive_second_leg(self, first_leg: List[Tuple[int, int]],
+                           match_pairs: List[Tuple[int, int]]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Place each second-leg round as a translated copy of the first-leg round it replays.
+        Rounds keep their venues and relative slot layout and are pushed to the earliest
+        start that respects round order, free and open venues and every team's rest window.
+        Returns None if a round runs past the last slot.
+        """
+        rest_span = self._min_rest_slots() + 1
+        occupied = set(first_leg)
+        last_slot = {}
+        for (t1, t2), (s, _) in zip(match_pairs, first_leg):
+            last_slot[t1] = max(last_slot.get(t1, s), s)
+            last_slot[t2] = max(last_slot.get(t2, s), s)
+        previous_round_end = max(s for s, _ in first_leg)
+
+        second_round_matches = {}
+        for m in range(self.first_leg_size, len(match_pairs)):
+            second_round_matches.setdefault(self.match_rounds[m], []).append(m)
+
+        second_leg = []
+        for r in sorted(second_round_matches):
+            matches = second_round_matches[r]
+            sources = [first_leg[self.mirror_source[m - self.first_leg_size]] for m in matches]
+            base = min(s for s, _ in sources)
+
+            earliest = previous_round_end
+            for m, (s, _) in zip(matches, sources):
+                for team_idx in match_pairs[m]:
+                    earliest = max(earliest, last_slot[team_idx] + rest_span - (s - base))
+
+            for round_start in range(earliest, self.num_slots):
+                placed = [(round_start + s - base, v) for s, v in sources]
+                if all(s < self.num_slots and (s, v) not in occupied and self.cell_open[s, v]
+                       and self.team_slot_open[list(match_pairs[m]), s].all()
+                       for m, (s, v) in zip(matches, placed)):
+                    break
+            else:
+                return None
+
+            for m, (s, v) in zip(matches, placed):
+                occupied.add((s, v))
+                for team_idx in match_pairs[m]:
+                    last_slot[team_idx] = s
+            previous_round_end = max(s for s, _ in placed)
+            second_leg.extend(placed)
+
+        return second_leg
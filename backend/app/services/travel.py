@@ -0,0 +1,85 @@
+"""
+TRAVEL TABLES - Venue-to-venue distances for the minimize_travel objective.
+Distances are great-circle (haversine) kilometres between venue coordinates,
+rounded to whole km so they can weigh CP-SAT literals. A team's home venue is
+its base: its first trip starts there and its last one returns there.
+Tables are cached by venue set and team bases, so re-solves of an unchanged
+tournament reuse them.
+"""
+
+from functools import lru_cache
+from typing import List, Optional, Tuple
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0
+TRAVEL_CACHE_SIZE = 64
+
+
+def haversine_matrix(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Pairwise great-circle distances in km between points given in degrees."""
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class TravelTables:
+    """
+    distances[u, v]: km from venue u to venue v.
+    home[t]: index of team t's base venue, -1 if it has none (no trip to or from a base).
+    from_home[t, v]: km from team t's base to venue v (0 without a base).
+    Arrays are read-only, since they are shared through the cache.
+    """
+
+    def __init__(self, distances: np.ndarray, home: np.ndarray):
+        self.distances = distances
+        self.home = home
+        self.from_home = np.where((home >= 0)[:, None], distances[np.maximum(home, 0)], 0)
+        for array in (self.distances, self.home, self.from_home):
+            array.flags.writeable = False
+
+    def team_travel(self, assignments: List[Tuple[int, int]], match_pairs: List[Tuple[int, int]]) -> np.ndarray:
+        """km each team travels through the schedule: base -> venues in slot order -> base."""
+        num_teams = len(self.home)
+        travel = np.zeros(num_teams, dtype=np.int64)
+        if not assignments:
+            return travel
+        pairs = np.asarray(match_pairs, dtype=np.int64).reshape(-1, 2)
+        slots, venues = np.asarray(assignments, dtype=np.int64).T
+        for t in range(num_teams):
+            played = np.flatnonzero((pairs == t).any(axis=1))
+            if not len(played):
+                continue
+            route = venues[played[np.argsort(slots[played], kind="stable")]]
+            travel[t] = self.distances[route[:-1], route[1:]].sum() + self.from_home[t, route[0]] + self.from_home[t, route[-1]]
+        return travel
+
+
+@lru_cache(maxsize=TRAVEL_CACHE_SIZE)
+def _travel_tables(coordinates: Tuple[Tuple[Optional[float], Optional[float]], ...],
+                   home: Tuple[int, ...]) -> TravelTables:
+    latitudes = np.array([lat if lat is not None else np.nan for lat, _ in coordinates])
+    longitudes = np.array([lon if lon is not None else np.nan for _, lon in coordinates])
+    distances = haversine_matrix(latitudes, longitudes)
+    # Venues without coordinates cost nothing to reach
+    distances = np.rint(np.nan_to_num(distances, nan=0.0)).astype(np.int64)
+    logger.info(f"🧭 Built {len(coordinates)}×{len(coordinates)} venue distance matrix")
+    return TravelTables(distances, np.array(home, dtype=np.int64))
+
+
+def travel_tables(venues: List, teams: List) -> TravelTables:
+    """Distance tables for these venues (in solver order) and the teams' home venues, from cache if seen before."""
+    venue_index = {venue.id: v for v, venue in enumerate(venues)}
+    missing = [venue.name for venue in venues if venue.latitude is None or venue.longitude is None]
+    if missing:
+        logger.warning(f"Venues without coordinates are treated as zero travel: {', '.join(missing)}")
+    return _travel_tables(
+        tuple((venue.latitude, venue.longitude) for venue in venues),
+        tuple(venue_index.get(team.home_venue_id, -1) for team in teams)
+    )
@@ -0,0 +1,154 @@
+"""
+VENUE AVAILABILITY - Parses Venue.available_slots into per-venue slot bitmaps.
+available_slots is a list of rules; each rule matches the slots satisfying all
+of its fields (a missing field matches everything):
+  date / dates             one date or a list of dates ("2030-01-05")
+  start_date / end_date    an inclusive date range (either end may be open)
+  weekdays                 0 = Monday ... 6 = Sunday, or names ("mon", "sunday")
+  start_hour / end_hour    the whole match must fit in this window (0-24)
+  available                false turns the rule into a blackout (default true)
+A slot is open when it matches some available rule (any slot, if there are none)
+and no blackout rule. An empty or missing list means the venue is always free.
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+RULE_FIELDS = {"date", "dates", "start_date", "end_date", "weekdays", "start_hour", "end_hour", "available"}
+WEEKDAY_NAMES = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+
+def _parse_date(value: Any) -> np.datetime64:
+    if isinstance(value, (date, datetime)):
+        return np.datetime64(value.date() if isinstance(value, datetime) else value, "D")
+    if isinstance(value, str):
+        try:
+            return np.datetime64(date.fromisoformat(value[:10]), "D")
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid date in venue availability: {value!r}")
+
+
+def _parse_weekday(value: Any) -> int:
+    if isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= 6:
+        return value
+    if isinstance(value, str):
+        name = value.strip().lower()
+        for day, full_name in enumerate(WEEKDAY_NAMES):
+            if name == full_name or name == full_name[:3]:
+                return day
+    raise ValueError(f"Invalid weekday in venue availability: {value!r}")
+
+
+def _parse_hour(value: Any, field: str) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and 0 <= value <= 24:
+        return float(value)
+    raise ValueError(f"{field} must be an hour between 0 and 24, got {value!r}")
+
+
+def parse_availability_rules(rules: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Validate and normalize available_slots rules. Raises ValueError on a malformed rule."""
+    parsed = []
+    for rule in rules or []:
+        if not isinstance(rule, dict):
+            raise ValueError(f"Venue availability rules must be objects, got {rule!r}")
+        unknown = set(rule) - RULE_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown venue availability field(s): {', '.join(sorted(unknown))}")
+
+        dates = list(rule.get("dates") or [])
+        if rule.get("date") is not None:
+            dates.append(rule["date"])
+        start_hour = _parse_hour(rule["start_hour"], "start_hour") if rule.get("start_hour") is not None else None
+        end_hour = _parse_hour(rule["end_hour"], "end_hour") if rule.get("end_hour") is not None else None
+        if start_hour is not None and end_hour is not None and end_hour <= start_hour:
+            raise ValueError("end_hour must be after start_hour in venue availability")
+
+        parsed.append({
+            "dates": np.array([_parse_date(d) for d in dates], dtype="datetime64[D]") if dates else None,
+            "start_date": _parse_date(rule["start_date"]) if rule.get("start_date") is not None else None,
+            "end_date": _parse_date(rule["end_date"]) if rule.get("end_date") is not None else None,
+            "weekdays": ([_parse_weekday(d) for d in rule["weekdays"]]
+                         if rule.get("weekdays") is not None else None),
+            "start_hour": start_hour,
+            "end_hour": end_hour,
+            "available": bool(rule.get("available", True)),
+        })
+    return parsed
+
+
+def slot_calendar(time_slots: List[datetime], match_duration_hours: int) -> Dict[str, np.ndarray]:
+    """Per-slot day, weekday and start/end hour arrays that rules are matched against."""
+    starts = np.array(time_slots, dtype="datetime64[m]")
+    days = starts.astype("datetime64[D]")
+    start_hours = (starts - days).astype(np.int64) / 60.0
+    return {
+        "days": days,
+        # 1970-01-01 was a Thursday
+        "weekdays": (days.astype(np.int64) + 3) % 7,
+        "start_hours": start_hours,
+        "end_hours": start_hours + match_duration_hours,
+    }
+
+
+def venue_slot_mask(rules: Optional[List[Dict[str, Any]]], time_slots: List[datetime],
+                    match_duration_hours: int, calendar: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+    """
+    Bitmap over time_slots: True where the venue can host a match starting then.
+    calendar is slot_calendar(time_slots, match_duration_hours), passed in when masking many rule sets.
+    """
+    parsed = parse_availability_rules(rules)
+    num_slots = len(time_slots)
+    if not parsed:
+        return np.ones(num_slots, dtype=bool)
+
+    calendar = calendar or slot_calendar(time_slots, match_duration_hours)
+    days, weekdays = calendar["days"], calendar["weekdays"]
+    start_hours, end_hours = calendar["start_hours"], calendar["end_hours"]
+
+    def matches(rule: Dict[str, Any]) -> np.ndarray:
+        hit = np.ones(num_slots, dtype=bool)
+        if rule["dates"] is not None:
+            hit &= np.isin(days, rule["dates"])
+        if rule["start_date"] is not None:
+            hit &= days >= rule["start_date"]
+        if rule["end_date"] is not None:
+            hit &= days <= rule["end_date"]
+        if rule["weekdays"] is not None:
+            hit &= np.isin(weekdays, rule["weekdays"])
+        if rule["start_hour"] is not None:
+            hit &= start_hours >= rule["start_hour"]
+        if rule["end_hour"] is not None:
+            hit &= end_hours <= rule["end_hour"]
+        return hit
+
+    available = [matches(rule) for rule in parsed if rule["available"]]
+    mask = np.logical_or.reduce(available) if available else np.ones(num_slots, dtype=bool)
+    for rule in parsed:
+        if not rule["available"]:
+            mask &= ~matches(rule)
+    return mask
+
+
+def venue_availability_matrix(venues: List, time_slots: List[datetime], match_duration_hours: int) -> np.ndarray:
+    """
+    slots × venues bitmap of the cells each venue's available_slots leave open.
+    Rules that do not parse (rows saved before they were validated) are logged and
+    ignored, leaving that venue always open.
+    """
+    matrix = np.ones((len(time_slots), len(venues)), dtype=bool)
+    calendar = slot_calendar(time_slots, match_duration_hours)
+    for v, venue in enumerate(venues):
+        try:
+            matrix[:, v] = venue_slot_mask(venue.available_slots, time_slots, match_duration_hours, calendar)
+        except ValueError as e:
+            logger.warning(f"⚠️ Ignoring available_slots of venue {venue.name}: {str(e)}")
+    closed = int((~matrix).sum())
+    if closed:
+        logger.info(f"📅 Venue availability closes {closed} of {matrix.size} (slot, venue) cells")
+    return matrix
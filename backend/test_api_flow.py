@@ -1,6 +1,7 @@
 import urllib.request
 import json
 import sys
+import time
 
 BASE_URL = "http://localhost:8000/api/v1"
 
@@ -90,7 +91,17 @@ def test_flow():
         log(f"FAILED to generate schedule: {res['status']} {res['body']}")
         return
         
-    schedule = res["body"]
+    # The solve runs as a background job; poll it until it finishes
+    job = res["body"]
+    while job["status"] in ("queued", "running"):
+        time.sleep(1)
+        job = request("GET", f"/tournaments/jobs/{job['id']}")["body"]
+    
+    if job["status"] != "completed":
+        log(f"FAILED schedule job: {job['error']}")
+        return
+    
+    schedule = job["result"]
     if schedule.get("success"):
         log(f"SUCCESS! Scheduled {schedule['matches_scheduled']} matches.")
     else:
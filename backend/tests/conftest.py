@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 from app.db.session import Base
 from app.main import app
 from app.core.config import settings
+from app.services import schedule_cache
 
 # Use an in-memory SQLite database for testing, or a separate test DB
 # For this project, we'll use a test database to ensure full compatibility
@@ -38,3 +39,11 @@ def db(db_engine):
 def client():
     with TestClient(app) as c:
         yield c
+
+@pytest.fixture(autouse=True)
+def fresh_schedule_cache(monkeypatch):
+    # Every test starts with an empty in-memory schedule cache
+    cache = schedule_cache.InMemoryScheduleCache()
+    monkeypatch.setattr(schedule_cache, "_schedule_cache", cache)
+    monkeypatch.setattr(settings, "SCHEDULE_CACHE_BACKEND", "memory")
+    yield cache
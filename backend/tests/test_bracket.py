@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+import pytest
+from app.models import Match, TournamentFormat
+from app.services.bracket import build_bracket, seed_order, seeded_teams
+from app.services.scheduler import generate_tournament_schedule
+from app.services.scheduler_bracket import advance_bracket
+from app.schemas.schemas import ScheduleGenerateRequest
+from tests.test_scheduler import _create_tournament
+
+
+def test_seeded_bracket_gives_the_top_seeds_byes():
+    assert seed_order(8) == [0, 7, 3, 4, 1, 6, 2, 5]
+    assert seeded_teams(["T0", "T1", "T2"], ["T2"]) == [2, 0, 1]
+
+    bracket = build_bracket(list(range(6)))
+
+    assert [match["label"] for match in bracket] == [
+        "Quarter Final 1", "Quarter Final 2", "Semi Final 1", "Semi Final 2", "Final"
+    ]
+    assert bracket[0]["teams"] == [3, 4] and bracket[1]["teams"] == [2, 5]
+    # Seeds 1 and 2 enter in the semi finals against the quarter final winners
+    assert bracket[2]["teams"] == [0, None] and bracket[2]["sources"] == [None, 0]
+    assert bracket[3]["teams"] == [1, None] and bracket[3]["sources"] == [None, 1]
+    assert bracket[4]["sources"] == [2, 3]
+
+
+def _bracket_tournament(db):
+    tournament = _create_tournament(db, num_teams=6, num_venues=2, days=10,
+                                    tournament_format=TournamentFormat.KNOCKOUT)
+    result = generate_tournament_schedule(db, str(tournament.id), ScheduleGenerateRequest(tournament_id=tournament.id))
+    assert result["success"] is True, result
+    rows = db.query(Match).filter(Match.tournament_id == tournament.id).all()
+    return tournament, result, {row.round: row for row in rows}
+
+
+def test_knockout_tournaments_schedule_the_whole_bracket_with_placeholders(db):
+    tournament, result, rows = _bracket_tournament(db)
+
+    assert result["matches_scheduled"] == 5
+    final, semi = rows["Final"], rows["Semi Final 1"]
+    assert final.team1_id is None and final.team1_placeholder == "Winner of Semi Final 1"
+    assert final.team1_source_match_id == semi.id
+    assert semi.team1_id is not None and semi.team2_placeholder == "Winner of Quarter Final 1"
+    rest = timedelta(hours=tournament.min_rest_hours)
+    for row in rows.values():
+        for source_id in (row.team1_source_match_id, row.team2_source_match_id):
+            feeder = next((other for other in rows.values() if other.id == source_id), None)
+            assert feeder is None or row.scheduled_start >= feeder.scheduled_end + rest
+
+
+def test_advance_fills_the_winner_in_and_pushes_later_rounds_back(db):
+    tournament, _, rows = _bracket_tournament(db)
+    quarter, semi, final = rows["Quarter Final 1"], rows["Semi Final 1"], rows["Final"]
+    # The quarter final ran so late that the semi final can no longer start on time
+    quarter.actual_end = semi.scheduled_start
+    quarter.winner_id = quarter.team2_id
+
+    changed = advance_bracket(db, quarter)
+
+    assert semi in changed
+    assert semi.team2_id == quarter.team2_id
+    rest = timedelta(hours=tournament.min_rest_hours)
+    assert semi.scheduled_start >= quarter.actual_end + rest
+    assert final.scheduled_start >= semi.scheduled_end + rest
+    venue_starts = [(row.venue_id, row.scheduled_start) for row in rows.values()]
+    assert len(set(venue_starts)) == len(venue_starts)
+
+    quarter.winner_id = rows["Quarter Final 2"].team1_id
+    with pytest.raises(ValueError):
+        advance_bracket(db, quarter)
@@ -0,0 +1,172 @@
+import pytest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import numpy as np
+from app.models import SchedulingConstraint, Team, Venue
+from app.services.constraint_compiler import PRIORITY_WEIGHTS, compile_constraints
+from app.services.scheduler import generate_tournament_schedule
+from app.schemas.schemas import ScheduleGenerateRequest
+from tests.test_scheduler import _create_tournament
+
+# 2030-01-01 is a Tuesday; two slots a day at 10:00 and 18:00
+SLOTS = [datetime(2030, 1, 1) + timedelta(days=d, hours=h) for d in range(4) for h in (10, 18)]
+SLOT_DAY = np.repeat(np.arange(4), 2)
+TEAMS = [SimpleNamespace(id=f"team-{t}", name=f"Team {t}") for t in range(4)]
+VENUES = [SimpleNamespace(id=f"venue-{v}", name=f"Venue {v}") for v in range(2)]
+
+
+def _compile(*rows):
+    constraints = [SimpleNamespace(constraint_type=kind, priority=priority, parameters=parameters)
+                   for kind, priority, parameters in rows]
+    return compile_constraints(constraints, TEAMS, VENUES, SLOTS, 4)
+
+
+def test_hard_rows_fold_into_masks():
+    compiled = _compile(
+        ("blackout_date", 1, {"date": "2030-01-02", "venue_id": "venue-0"}),
+        ("team_unavailable", 1, {"team_id": "team-1", "weekdays": ["fri"]}),
+        ("venue_preference", 1, {"team_id": "team-2", "venue_id": "venue-1"}),
+    )
+
+    assert compiled.cell_open[:, 0].tolist() == [True, True, False, False, True, True, True, True]
+    assert compiled.cell_open[:, 1].all()
+    assert compiled.team_slot_open[1].tolist() == [True, True, True, True, True, True, False, False]
+    assert compiled.team_venue_open[2].tolist() == [False, True]
+    assert compiled.match_venue_open([(0, 2), (0, 1)]).tolist() == [[False, True], [True, True]]
+    assert not compiled.has_soft
+
+
+def test_soft_rows_become_weighted_penalties():
+    compiled = _compile(
+        ("time_slot", 2, {"start_hour": 9, "end_hour": 16}),
+        ("venue_preference", 6, {"team_id": "team-0", "venue_ids": ["venue-0"]}),
+    )
+
+    penalty = compiled.match_penalty(0, 1)
+
+    assert compiled.cell_open.all() and compiled.team_venue_open.all()
+    # Evening slots break the time window, venue 1 breaks team 0's preference
+    assert penalty[0].tolist() == [0, PRIORITY_WEIGHTS[6]]
+    assert penalty[1].tolist() == [PRIORITY_WEIGHTS[2], PRIORITY_WEIGHTS[2] + PRIORITY_WEIGHTS[6]]
+    assert compiled.match_penalty(2, 3)[0].tolist() == [0, 0]
+
+
+def test_violations_are_counted_per_row():
+    compiled = _compile(
+        ("time_slot", 3, {"start_hour": 9, "end_hour": 16}),
+        ("max_matches_per_day", 4, {"limit": 1}),
+    )
+
+    broken = compiled.violations([(1, 0), (0, 0), (0, 1)], [(0, 1), (2, 3), (0, 2)], SLOT_DAY)
+
+    assert broken == [
+        {"constraint": "Matches only in the allowed time window", "priority": 3, "matches": 1},
+        {"constraint": "At most 1 match(es) per day", "priority": 4, "days": 1},
+    ]
+
+
+@pytest.mark.parametrize("rows, message", [
+    ([("team_unavailable", 1, {"team_id": "team-9", "date": "2030-01-01"})], "unknown team"),
+    ([("team_unavailable", 1, {"team_id": "team-0"})], "needs team_id and dates"),
+    ([("max_matches_per_day", 1, {"limit": "two"})], "non-negative integer limit"),
+    ([("venue_preference", 5, {})], "needs venue_id or venue_ids"),
+    ([("home_advantage", 5, {})], "Unknown constraint type"),
+    ([("blackout_date", 11, {"date": "2030-01-01"})], "priority must be 1-10"),
+])
+def test_malformed_rows_are_skipped(rows, message):
+    compiled = _compile(*rows, ("blackout_date", 1, {"date": "2030-01-02"}))
+
+    assert len(compiled.skipped) == 1 and message in compiled.skipped[0]
+    assert [row["description"] for row in compiled.rows] == ["No matches on the blacked-out dates"]
+
+
+def _add_constraint(db, tournament, constraint_type, priority, **parameters):
+    db.add(SchedulingConstraint(tournament_id=tournament.id, constraint_type=constraint_type,
+                                priority=priority, parameters=parameters))
+    db.commit()
+
+
+@pytest.mark.parametrize("engine", [None, "interval", "heuristic"])
+def test_hard_constraints_are_never_broken(db, engine):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2, days=10)
+    teams = db.query(Team).filter(Team.tournament_id == tournament.id).all()
+    venues = db.query(Venue).filter(Venue.tournament_id == tournament.id).all()
+    _add_constraint(db, tournament, "team_unavailable", 1, team_id=str(teams[0].id),
+                    start_date="2030-01-01", end_date="2030-01-04")
+    _add_constraint(db, tournament, "venue_preference", 1, team_id=str(teams[1].id), venue_id=str(venues[1].id))
+    _add_constraint(db, tournament, "blackout_date", 1, date="2030-01-06")
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine=engine)
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    for match in result["schedule"]:
+        day = match["scheduled_start"].date()
+        assert day != datetime(2030, 1, 6).date()
+        if str(teams[0].id) in (str(match["team1_id"]), str(match["team2_id"])):
+            assert day > datetime(2030, 1, 4).date()
+        if str(teams[1].id) in (str(match["team1_id"]), str(match["team2_id"])):
+            assert str(match["venue_id"]) == str(venues[1].id)
+
+
+@pytest.mark.parametrize("engine", [None, "interval"])
+def test_hard_daily_limit(db, engine):
+    tournament = _create_tournament(db, num_teams=6, num_venues=3, days=10, min_rest_hours=0)
+    _add_constraint(db, tournament, "max_matches_per_day", 1, limit=2)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine=engine)
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    days = [match["scheduled_start"].date() for match in result["schedule"]]
+    assert max(days.count(day) for day in days) <= 2
+
+
+def test_soft_constraints_steer_the_boolean_model(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2, days=10)
+    venues = db.query(Venue).filter(Venue.tournament_id == tournament.id).all()
+    _add_constraint(db, tournament, "venue_preference", 3, venue_id=str(venues[0].id))
+    _add_constraint(db, tournament, "time_slot", 5, start_hour=12, end_hour=20)
+
+    result = generate_tournament_schedule(db, str(tournament.id))
+
+    assert result["success"] is True
+    assert result["soft_constraint_violations"] == []
+    assert result["objective_value"] == 0
+    for match in result["schedule"]:
+        assert str(match["venue_id"]) == str(venues[0].id)
+        assert match["scheduled_start"].hour == 14
+
+
+def test_unsatisfiable_daily_limit_is_explained(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2, days=2, min_rest_hours=0)
+    _add_constraint(db, tournament, "max_matches_per_day", 1, limit=1)
+
+    result = generate_tournament_schedule(db, str(tournament.id))
+
+    assert result["success"] is False
+    assert "At most 1 match(es) per day" in result["infeasibility_causes"]
+
+
+def test_unknown_constraint_type_does_not_fail_the_schedule(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2, days=10)
+    _add_constraint(db, tournament, "rest_days", 1, days=2)
+    _add_constraint(db, tournament, "blackout_date", 1, date="2030-01-03")
+
+    result = generate_tournament_schedule(db, str(tournament.id), ScheduleGenerateRequest(tournament_id=tournament.id))
+
+    assert result["success"] is True
+    assert result["matches_scheduled"] == 6
+    assert all(match["scheduled_start"].day != 3 for match in result["schedule"])
+
+
+def test_blackout_that_breaks_the_schedule_is_named(db):
+    # Nine slots fit the six fixtures with a slot off between matches; blacking out the last
+    # day leaves the six slots that cannot, so the blackout must be part of the explanation
+    tournament = _create_tournament(db, num_teams=4, num_venues=1, days=3, min_rest_hours=0)
+    _add_constraint(db, tournament, "blackout_date", 1, date="2030-01-03")
+
+    result = generate_tournament_schedule(db, str(tournament.id))
+
+    assert result["success"] is False
+    assert "No matches on the blacked-out dates" in result["infeasibility_causes"]
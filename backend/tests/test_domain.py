@@ -0,0 +1,45 @@
+import pickle
+
+import numpy as np
+from app.models import Match, TournamentFormat
+from app.services.domain import Solution, generate_match_pairs, load_problem, min_rest_slots, save_solution
+from tests.test_scheduler import _create_tournament
+
+
+def test_problem_spec_holds_plain_data_and_pickles(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2, days=3)
+
+    spec = load_problem(db, str(tournament.id))
+    copy = pickle.loads(pickle.dumps(spec))
+
+    assert [team.name for team in copy.teams] == [f"Team {i}" for i in range(4)]
+    assert copy.tournament.id == tournament.id
+    assert copy.time_slots.dtype == np.dtype("datetime64[s]") and len(copy.time_slots) == 9
+    assert np.array_equal(copy.time_slots, spec.time_slots)
+    assert copy.home_venue.tolist() == [-1] * 4
+    assert not hasattr(copy.teams[0], "__dict__")
+
+
+def test_save_solution_writes_rows_in_kick_off_order(db):
+    tournament = _create_tournament(db, num_teams=3, num_venues=2, days=3)
+    spec = load_problem(db, tournament.id)
+    solution = Solution.from_lists([(0, 1), (1, 2), (0, 2)], [(4, 1), (0, 0), (8, 1)], ["A", "B", "C"])
+
+    assert save_solution(db, spec, solution) == 3
+
+    rows = sorted(db.query(Match).filter(Match.tournament_id == tournament.id).all(), key=lambda row: row.match_number)
+    assert [row.round for row in rows] == ["B", "A", "C"]
+    assert [row.scheduled_start for row in rows] == [spec.time_slots[s].item() for s in (0, 4, 8)]
+    assert rows[0].team1_id == spec.teams[1].id and rows[0].venue_id == spec.venues[0].id
+
+
+def test_match_pairs_and_rest_come_from_the_spec(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=1, days=3, min_rest_hours=10,
+                                    tournament_format=TournamentFormat.DOUBLE_ROUND_ROBIN)
+    spec = load_problem(db, tournament.id)
+
+    pairs, team_group = generate_match_pairs(spec)
+
+    assert len(pairs) == 12 and len(set(pairs)) == 12 and team_group is None
+    # 10h of rest with 4h matches: two slots off
+    assert min_rest_slots(spec.tournament) == 2
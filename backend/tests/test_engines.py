@@ -0,0 +1,80 @@
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+from app.api.schedule import generate_schedule
+from app.models import TournamentFormat
+from app.services.engines import engine_class, engine_names, resolve_engine
+from app.services.scheduler import generate_tournament_schedule
+from app.services.scheduler_simplified import SimplifiedCricketScheduler
+from app.schemas.schemas import ScheduleGenerateRequest
+from tests.test_scheduler import _create_tournament
+
+
+def test_engine_comes_from_the_request_then_the_tournament_then_the_default():
+    assert {"boolean", "interval", "rounds", "heuristic", "bracket", "simplified"} <= set(engine_names())
+    assert engine_class("simplified") is SimplifiedCricketScheduler
+
+    assert resolve_engine("interval", TournamentFormat.ROUND_ROBIN, {"engine": "rounds"}) == "interval"
+    assert resolve_engine(None, TournamentFormat.ROUND_ROBIN, {"engine": "rounds"}) == "rounds"
+    assert resolve_engine(None, TournamentFormat.ROUND_ROBIN, {}) == "boolean"
+    assert resolve_engine(None, TournamentFormat.KNOCKOUT, None) == "bracket"
+    assert resolve_engine(None, TournamentFormat.KNOCKOUT, {"engine": "rounds"}) == "bracket"
+    with pytest.raises(ValueError, match="Knockout"):
+        resolve_engine("interval", TournamentFormat.KNOCKOUT, None)
+    with pytest.raises(ValueError):
+        resolve_engine(None, TournamentFormat.ROUND_ROBIN, {"engine": "quantum"})
+
+
+def test_tournament_setting_picks_the_engine(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2, days=10, settings={"engine": "simplified"})
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, objective="last_slot")
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    assert result["engine"] == "simplified"
+    assert result["matches_scheduled"] == 6
+    # The simplified engine stops at the first feasible schedule
+    assert result["objective_value"] is None
+
+
+@pytest.mark.parametrize("field, value", [
+    ("objective", "shortest"), ("mirror_scheme", "spanish"), ("latency_budget", "instant"),
+    ("optimize_for", "minimise_travel"),
+])
+def test_unknown_request_options_are_rejected(field, value):
+    with pytest.raises(ValidationError):
+        ScheduleGenerateRequest(tournament_id="00000000-0000-0000-0000-000000000001", **{field: value})
+
+
+def test_unknown_engine_is_rejected_before_enqueueing(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine="quantum")
+
+    with pytest.raises(HTTPException) as error:
+        generate_schedule(tournament.id, request, db=db, current_user=None)
+
+    assert error.value.status_code == 422
+    assert "Unknown scheduling engine" in error.value.detail
+
+
+def test_knockout_rejects_a_non_bracket_engine_before_enqueueing(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2, tournament_format=TournamentFormat.KNOCKOUT)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine="boolean")
+
+    with pytest.raises(HTTPException) as error:
+        generate_schedule(tournament.id, request, db=db, current_user=None)
+
+    assert error.value.status_code == 422
+
+
+def test_unknown_settings_engine_is_caught_before_and_during_the_solve(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2, settings={"engine": "quantum"})
+
+    with pytest.raises(HTTPException) as error:
+        generate_schedule(tournament.id, None, db=db, current_user=None)
+    result = generate_tournament_schedule(db, str(tournament.id))
+
+    assert error.value.status_code == 422
+    assert result["success"] is False
+    assert "Unknown scheduling engine: quantum" in result["conflicts"][0]
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+import numpy as np
+from app.services.fairness import slot_start_hours, team_fairness
+from app.services.scheduler import generate_tournament_schedule
+from app.schemas.schemas import ScheduleGenerateRequest
+from tests.test_travel import _located_tournament
+
+
+def test_slot_start_hours_count_from_the_first_slot():
+    slots = [datetime(2030, 1, 1, 10), datetime(2030, 1, 1, 14), datetime(2030, 1, 2, 10)]
+
+    assert slot_start_hours(slots).tolist() == [0, 4, 24]
+
+
+def test_team_fairness_counts_breaks_and_minimum_rest():
+    start_hours = np.array([0, 24, 48, 96])
+    # Team 0 (home venue 0) plays home, home, away: one break; team 1 has no home venue
+    assignments = [(0, 0), (1, 0), (3, 1)]
+    match_pairs = [(0, 1), (0, 2), (0, 1)]
+
+    breaks, min_rest = team_fairness(assignments, match_pairs, np.array([0, -1, 1]), start_hours, 3)
+
+    assert breaks.tolist() == [1, 0, 0]
+    assert min_rest.tolist() == [21, 93, -1]
+
+
+def test_fairness_mode_reports_per_team_breaks_and_rest(db):
+    tournament, teams, _ = _located_tournament(db)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, optimize_for="fairness",
+                                      latency_budget="optimal")
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    assert result["status"] == "optimal"
+    fairness = result["fairness"]
+    assert set(fairness["teams"]) == {team.name for team in teams}
+    assert fairness["max_breaks"] == max(team["breaks"] for team in fairness["teams"].values())
+    assert fairness["total_breaks"] == sum(team["breaks"] for team in fairness["teams"].values())
+    rests = [team["min_rest_hours"] for team in fairness["teams"].values()]
+    assert fairness["rest_spread_hours"] == max(rests) - min(rests)
+    assert min(rests) >= tournament.min_rest_hours
+    assert result["objective_value"] == 24 * (fairness["max_breaks"] + fairness["total_breaks"]) + fairness["rest_spread_hours"]
@@ -0,0 +1,57 @@
+import numpy as np
+from app.services.feasibility import analyze_feasibility, infeasibility_reasons
+from app.services.scheduler import generate_tournament_schedule
+from tests.test_scheduler import _create_tournament
+
+
+def test_fixture_without_a_common_free_slot_is_reported():
+    cell_open = np.ones((4, 1), dtype=bool)
+    team_slot_open = np.array([[1, 1, 0, 0], [0, 0, 1, 1]], dtype=bool)
+
+    reasons = infeasibility_reasons([(0, 1)], cell_open, team_slot_open, rest_window=1,
+                                    slot_day=np.arange(4), team_names=["Lions", "Tigers"])
+
+    assert reasons == ["Lions vs Tigers: no time slot where both teams and a venue are free"]
+
+
+def test_max_flow_catches_fixtures_competing_for_one_slot():
+    # Both of the first two fixtures can only use slot 0, which has a single venue
+    cell_open = np.ones((3, 1), dtype=bool)
+    team_slot_open = np.zeros((6, 3), dtype=bool)
+    team_slot_open[:4, 0] = True
+    team_slot_open[4:, :] = True
+
+    reasons = infeasibility_reasons([(0, 1), (2, 3), (4, 5)], cell_open, team_slot_open,
+                                    rest_window=1, slot_day=np.arange(3))
+
+    assert len(reasons) == 1
+    assert reasons[0].startswith("Only 2 of 3 matches can get a slot")
+
+
+def test_extension_report_is_the_smallest_that_passes():
+    # 4 teams, 6 matches, 2 slots a day, a team plays at most once every 3 slots
+    match_pairs = [(0, 1), (2, 3), (0, 2), (1, 3), (0, 3), (1, 2)]
+    cell_open = np.ones((4, 1), dtype=bool)
+
+    report = analyze_feasibility(match_pairs, cell_open, np.ones((4, 4), dtype=bool), rest_window=3,
+                                 slot_day=np.repeat(np.arange(2), 2), slots_per_day=2)
+
+    assert report["feasible"] is False
+    # Each team needs 3 matches 3 slots apart: slots 0, 3, 6 -> 7 slots, 2 more days
+    assert report["extra_days_needed"] == 2
+    # Venues add no slots for a team, so they cannot help
+    assert report["extra_venues_needed"] is None
+
+
+def test_rest_bound_rejects_before_building_a_model(db):
+    tournament = _create_tournament(db, num_teams=10, num_venues=1, days=10)
+
+    result = generate_tournament_schedule(db, str(tournament.id))
+
+    assert result["success"] is False
+    assert "solver_stats" not in result
+    feasibility = result["feasibility"]
+    assert feasibility["feasible"] is False
+    assert "fit into its free slots" in feasibility["reasons"][0]
+    assert feasibility["extra_days_needed"] > 0
+    assert any("Extend the tournament by at least" in issue for issue in result["conflicts"])
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from app.models import TournamentFormat
+from app.services.group_stage import group_round_robin, partition_cells, team_groups
+from app.services.scheduler import generate_tournament_schedule
+from app.schemas.schemas import ScheduleGenerateRequest, SolverProfile
+from tests.test_scheduler import _create_tournament
+
+
+def test_team_groups_snake_seed_or_follow_an_explicit_draw():
+    assert team_groups(list("ABCDEFGH"), 3).tolist() == [0, 1, 2, 2, 1, 0, 0, 1]
+    assert team_groups(["T0", "T1", "T2", "T3"], [["T3", "T0"], ["T1", "T2"]]).tolist() == [0, 1, 1, 0]
+    assert group_round_robin(np.array([0, 1, 1, 0])) == [(0, 3), (1, 2)]
+
+    with pytest.raises(ValueError):
+        team_groups(list("ABC"), 2)
+    with pytest.raises(ValueError):
+        team_groups(["T0", "T1", "T2", "T3"], [["T0", "T1"], ["T2", "T1"]])
+
+
+def test_partition_cells_deals_open_cells_in_proportion_to_fixtures():
+    cell_open = np.ones((6, 3), dtype=bool)
+    cell_open[2, 1] = False
+
+    cell_group = partition_cells(cell_open, np.array([10, 5]))
+
+    assert cell_group[2, 1] == -1
+    assert np.bincount(cell_group[cell_open]).tolist() == [11, 6]
+    # Both groups get cells at every venue
+    assert all(set(cell_group[:, v][cell_open[:, v]]) == {0, 1} for v in range(3))
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_groups_are_solved_separately_and_merged(db, num_workers):
+    tournament = _create_tournament(db, num_teams=8, num_venues=2, days=14,
+                                    tournament_format=TournamentFormat.GROUPS, settings={"groups": 2})
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, objective="last_slot",
+                                      solver_profile=SolverProfile(max_time_in_seconds=10, num_workers=num_workers))
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    group_stage = result["solver_stats"]["group_stage"]
+    assert group_stage["groups"] == 2
+    assert group_stage["workers"] == num_workers
+    assert group_stage["matches_per_group"] == [6, 6]
+    assert sorted(event["group"] for event in result["solution_log"]) == [1, 2]
+    # Snake seeding: teams 0, 3, 4, 7 and 1, 2, 5, 6 only meet within their group
+    group_a = {"Team 0", "Team 3", "Team 4", "Team 7"}
+    assert len(result["schedule"]) == 12
+    assert all((match["team1_name"] in group_a) == (match["team2_name"] in group_a) for match in result["schedule"])
+    assert result["objective_value"] == max(group_stage["objectives"])
+    assert result["objective_value"] == max(match["slot_index"] for match in result["schedule"])
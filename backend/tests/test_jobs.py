@@ -0,0 +1,148 @@
+import pytest
+import asyncio
+import json
+from datetime import datetime
+from fastapi import HTTPException
+from sqlalchemy.orm import sessionmaker
+from app.api.schedule import stream_schedule_job
+from app.core.celery_app import celery_app
+from app.models import JobStatus, Match, ScheduleJob, Tournament, User, UserRole
+from app.services import jobs
+from app.services.jobs import cancel_job, enqueue_schedule_job, iter_job_events, run_schedule_job
+from app.schemas.schemas import ScheduleGenerateRequest
+from tests.test_scheduler import _create_tournament
+
+
+@pytest.fixture
+def eager_jobs(db, monkeypatch):
+    # Run tasks in-process, on a session that shares the test transaction
+    monkeypatch.setattr(celery_app.conf, "task_always_eager", True)
+    monkeypatch.setattr(jobs, "SessionLocal",
+                        sessionmaker(bind=db.connection(), join_transaction_mode="create_savepoint"))
+
+
+def test_enqueued_job_runs_and_records_result(db, eager_jobs):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine="interval")
+
+    job = enqueue_schedule_job(db, tournament.id, request)
+
+    assert job.status == JobStatus.COMPLETED
+    assert job.progress["phase"] == "finished"
+    assert job.progress["solutions"] >= 1
+    assert job.request["engine"] == "interval"
+    assert job.result["success"] is True
+    assert job.result["matches_scheduled"] == 6
+    assert job.started_at is not None and job.finished_at >= job.started_at
+    assert db.query(Match).filter(Match.tournament_id == tournament.id).count() == 6
+
+
+def test_job_that_raises_is_marked_failed(db, eager_jobs):
+    tournament = Tournament(name="Empty Tournament", start_date=datetime(2030, 1, 1), end_date=datetime(2030, 1, 31))
+    db.add(tournament)
+    db.commit()
+
+    job = enqueue_schedule_job(db, tournament.id)
+
+    assert job.status == JobStatus.FAILED
+    assert "At least 2 teams" in job.error
+    assert job.result is None
+
+
+def test_stop_request_keeps_first_solution(db, eager_jobs):
+    tournament = _create_tournament(db, num_teams=6, num_venues=2)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine="interval", objective="last_slot")
+    job = ScheduleJob(tournament_id=tournament.id, request=request.model_dump(mode="json"), stop_requested=True)
+    db.add(job)
+    db.commit()
+
+    job = run_schedule_job(db, job.id)
+
+    assert job.status == JobStatus.COMPLETED
+    assert job.result["success"] is True
+    assert job.result["solver_stats"]["stopped_early"] is True
+    assert job.result["solver_stats"]["solutions_found"] == 1
+    assert len(job.result["solution_log"]) == 1
+
+
+def test_event_stream_ends_with_finished_job(db, eager_jobs):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2)
+    job = enqueue_schedule_job(db, tournament.id, ScheduleGenerateRequest(tournament_id=tournament.id))
+
+    async def collect():
+        return [event async for event in iter_job_events(job.id)]
+
+    events = asyncio.run(collect())
+
+    assert [event.split("\n")[0] for event in events] == ["event: progress", "event: done"]
+    done = json.loads(events[-1].split("data: ", 1)[1])
+    assert done["status"] == "completed"
+    assert done["result"]["matches_scheduled"] == 6
+
+
+def test_cancelled_queued_job_never_runs(db, eager_jobs):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2)
+    job = ScheduleJob(tournament_id=tournament.id)
+    db.add(job)
+    db.commit()
+
+    job = cancel_job(db, job)
+    assert job.status == JobStatus.CANCELLED
+    assert job.finished_at is not None
+
+    job = run_schedule_job(db, job.id)
+
+    assert job.status == JobStatus.CANCELLED
+    assert job.started_at is None
+    assert db.query(Match).filter(Match.tournament_id == tournament.id).count() == 0
+
+
+def test_cancel_during_solve_discards_result(db, eager_jobs):
+    tournament = _create_tournament(db, num_teams=6, num_venues=2)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine="interval", objective="last_slot")
+    # Recorded by the API while the job was queued; the listener picks it up at the first solution
+    job = ScheduleJob(tournament_id=tournament.id, request=request.model_dump(mode="json"), cancel_requested=True)
+    db.add(job)
+    db.commit()
+
+    job = run_schedule_job(db, job.id)
+
+    assert job.status == JobStatus.CANCELLED
+    assert job.result["success"] is False
+    assert job.result["solver_stats"]["stopped_early"] is True
+    assert db.query(Match).filter(Match.tournament_id == tournament.id).count() == 0
+
+
+def test_event_stream_disconnect_cancels_job(db, eager_jobs):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2)
+    job = ScheduleJob(tournament_id=tournament.id, progress={"phase": "queued"})
+    db.add(job)
+    db.commit()
+
+    async def read_first_event_and_leave():
+        events = iter_job_events(job.id, cancel_on_disconnect=True)
+        first = await events.__anext__()
+        await events.aclose()
+        return first
+
+    first = asyncio.run(read_first_event_and_leave())
+
+    assert first.startswith("event: progress")
+    db.refresh(job)
+    assert job.status == JobStatus.CANCELLED
+    assert job.cancel_requested is True
+
+
+def test_only_admins_may_cancel_by_disconnecting(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2)
+    job = ScheduleJob(tournament_id=tournament.id, progress={"phase": "queued"})
+    db.add(job)
+    db.commit()
+    viewer = User(email="viewer@example.com", hashed_password="x", role=UserRole.USER)
+
+    # Watching is open to every user and never cancels by default
+    stream_schedule_job(job.id, db=db, current_user=viewer)
+    with pytest.raises(HTTPException) as error:
+        stream_schedule_job(job.id, cancel_on_disconnect=True, db=db, current_user=viewer)
+
+    assert error.value.status_code == 403
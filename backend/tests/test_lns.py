@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+import app.services.scheduler as scheduler_module
+from app.services.domain import Solution, solution_records
+from app.services.lns import LargeNeighbourhoodSearch, choose_neighbourhood
+from app.services.scheduler import CricketScheduler, generate_tournament_schedule
+from app.schemas.schemas import ScheduleGenerateRequest, SolverProfile
+from tests.test_scheduler import _create_tournament
+
+
+def test_neighbourhoods_free_a_day_window_a_team_subset_or_a_venue():
+    rng = np.random.default_rng(0)
+    assignments = np.array([[0, 0], [3, 1], [6, 0], [9, 1]])
+    match_pairs = np.array([[0, 1], [2, 3], [0, 2], [1, 3]])
+    slot_day = np.repeat(np.arange(4), 3)
+
+    days = choose_neighbourhood("days", rng, assignments, match_pairs, slot_day, 4, 2, 0.5)
+    assert days.sum() == 2 and np.flatnonzero(np.diff(slot_day[assignments[days, 0]])).size <= 1
+
+    teams = choose_neighbourhood("teams", rng, assignments, match_pairs, slot_day, 4, 2, 0.5)
+    freed_teams = set(match_pairs[teams].ravel())
+    assert all(set(pair) & freed_teams for pair in match_pairs[teams])
+
+    venue = choose_neighbourhood("venue", rng, assignments, match_pairs, slot_day, 4, 2, 0.5)
+    assert len(set(assignments[venue, 1])) == 1
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_lns_improves_a_local_search_schedule(db, num_workers):
+    tournament = _create_tournament(db, num_teams=8, num_venues=2, days=21)
+    scheduler = CricketScheduler(db, str(tournament.id))
+    scheduler.request = ScheduleGenerateRequest(tournament_id=tournament.id, objective="match_days")
+    scheduler._reset_availability()
+    match_pairs = scheduler._generate_match_pairs()
+    match_vars = scheduler._build_model(match_pairs)
+    scheduler.model.Minimize(sum(scheduler.objective_terms))
+    lns = LargeNeighbourhoodSearch(
+        scheduler.model.Proto(), [(m, s, v, var.Index()) for (m, s, v), var in match_vars.items()],
+        match_pairs, scheduler.slot_day, scheduler.num_teams, scheduler.num_venues, num_workers=num_workers
+    )
+    start = lns.evaluate(scheduler._local_search_fallback(match_pairs), 10)
+
+    result = lns.run(start["solution"], start["objective"], time_budget=6)
+
+    assert result["stats"]["iterations"] >= 1
+    assert result["objective"] <= start["objective"]
+    assert result["objective"] == len({scheduler.slot_day[s] for s, _ in result["assignments"]})
+    records = solution_records(scheduler.spec, Solution.from_lists(match_pairs, result["assignments"]))
+    is_valid, conflicts = scheduler._validate_solution(records)
+    assert is_valid, conflicts
+
+
+def test_lns_takes_over_when_the_first_solve_finds_nothing(db, monkeypatch):
+    # Too short a first solve for CP-SAT: LNS starts from the local search schedule
+    monkeypatch.setattr(scheduler_module, "LNS_INITIAL_SHARE", 0.001)
+    tournament = _create_tournament(db, num_teams=8, num_venues=2, days=21)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, objective="match_days", lns=True,
+                                      solver_profile=SolverProfile(max_time_in_seconds=5, num_workers=1))
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    assert result["solved_by"] == "cp-sat"
+    assert result["solver_stats"]["lns"]["iterations"] >= 1
+    assert result["solution_log"][0]["neighbourhood"] == "local-search"
+    assert result["objective_value"] == min(event["objective"] for event in result["solution_log"])
+    assert result["objective_value"] == len({match["scheduled_start"].date() for match in result["schedule"]})
@@ -0,0 +1,42 @@
+from itertools import combinations, permutations
+
+from app.services.local_search import greedy_local_search
+
+
+def _assert_valid(match_pairs, assignments, num_venues, min_rest_slots):
+    assert len(assignments) == len(match_pairs)
+    assert len(set(assignments)) == len(assignments)  # No venue double-booking
+    assert all(0 <= v < num_venues for _, v in assignments)
+
+    team_slots = {}
+    for (t1, t2), (s, _) in zip(match_pairs, assignments):
+        team_slots.setdefault(t1, []).append(s)
+        team_slots.setdefault(t2, []).append(s)
+    for slots in team_slots.values():
+        slots.sort()
+        assert all(later - earlier > min_rest_slots for earlier, later in zip(slots, slots[1:]))
+
+
+def test_local_search_schedules_large_round_robin():
+    match_pairs = list(combinations(range(30), 2))
+
+    assignments = greedy_local_search(match_pairs, num_teams=30, num_slots=240, num_venues=4, min_rest_slots=6)
+
+    assert assignments is not None
+    _assert_valid(match_pairs, assignments, 4, 6)
+
+
+def test_local_search_schedules_double_round_robin():
+    match_pairs = list(permutations(range(10), 2))
+
+    assignments = greedy_local_search(match_pairs, num_teams=10, num_slots=80, num_venues=2, min_rest_slots=2)
+
+    assert assignments is not None
+    _assert_valid(match_pairs, assignments, 2, 2)
+
+
+def test_local_search_gives_up_on_impossible_input():
+    # 3 matches per team need at least 2 * (rest + 1) + 1 = 9 slots
+    match_pairs = list(combinations(range(4), 2))
+
+    assert greedy_local_search(match_pairs, 4, num_slots=8, num_venues=2, min_rest_slots=3, time_limit=0.2) is None
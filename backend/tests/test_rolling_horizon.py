@@ -0,0 +1,73 @@
+import numpy as np
+from ortools.sat.python import cp_model
+from app.services.scheduler import CricketScheduler, generate_tournament_schedule
+from app.schemas.schemas import ScheduleGenerateRequest
+from tests.test_scheduler import _create_tournament
+
+
+def test_rest_closures_cover_rest_slots_either_side_of_committed_matches(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=1, days=4)
+    scheduler = CricketScheduler(db, str(tournament.id))
+    scheduler._reset_availability()
+    pairs = np.array([[0, 1], [2, 3], [0, 2]])
+
+    closed = scheduler._rest_closures([(4, 0), None, (0, 0)], pairs, rest=2)
+
+    assert np.flatnonzero(closed[0]).tolist() == [0, 1, 2, 3, 4, 5, 6]
+    assert np.flatnonzero(closed[1]).tolist() == [2, 3, 4, 5, 6]
+    assert np.flatnonzero(closed[2]).tolist() == [0, 1, 2]
+    assert not closed[3].any()
+    assert scheduler._stitch_rest([(4, 0), (9, 0), (6, 0)], pairs, rest=2) == ["Team 0 has matches 2 slot(s) apart"]
+    assert scheduler._rest_breakers([(4, 0), (9, 0), (6, 0)], pairs, rest=2) == [2]
+
+
+def test_rolling_horizon_places_every_fixture_window_by_window(db):
+    tournament = _create_tournament(db, num_teams=6, num_venues=2, days=28)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, horizon_weeks=1)
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    assert result["solved_by"] == "cp-sat"
+    rolling = result["solver_stats"]["rolling_horizon"]
+    assert rolling["window_days"] == 7
+    assert rolling["windows"] > 1
+    assert sum(rolling["matches_per_window"]) == len(result["schedule"]) == 15
+    assert [event["window"] for event in result["solution_log"]] == list(range(1, rolling["windows"] + 1))
+    for team in {match["team1_id"] for match in result["schedule"]} | {match["team2_id"] for match in result["schedule"]}:
+        starts = sorted(match["scheduled_start"] for match in result["schedule"]
+                        if team in (match["team1_id"], match["team2_id"]))
+        gaps = [(b - a).total_seconds() / 3600 - tournament.match_duration_hours for a, b in zip(starts, starts[1:])]
+        assert min(gaps) >= tournament.min_rest_hours
+
+
+def test_fallback_keeps_the_committed_windows_and_places_only_the_rest(db, monkeypatch):
+    tournament = _create_tournament(db, num_teams=6, num_venues=2, days=28)
+    scheduler = CricketScheduler(db, str(tournament.id))
+    solve, extract = scheduler.solver.Solve, scheduler._extract_assignments
+    windows_solved, committed = [], []
+
+    def solve_first_two_windows(model, *args):
+        # Every later window runs out of time without a schedule
+        windows_solved.append(model)
+        return solve(model, *args) if len(windows_solved) <= 2 else cp_model.UNKNOWN
+
+    def record_commits(match_vars, window_pairs):
+        positions = extract(match_vars, window_pairs)
+        committed.extend((pair, position) for pair, position in zip(window_pairs, positions) if position is not None)
+        return positions
+
+    monkeypatch.setattr(scheduler.solver, "Solve", solve_first_two_windows)
+    monkeypatch.setattr(scheduler, "_extract_assignments", record_commits)
+
+    result = scheduler.generate_schedule(ScheduleGenerateRequest(tournament_id=tournament.id, horizon_weeks=1))
+
+    assert result["success"] is True
+    assert result["solved_by"] == "local-search"
+    rolling = result["solver_stats"]["rolling_horizon"]
+    assert rolling["matches_per_window"][2:] == [0] * (rolling["windows"] - 2)
+    assert rolling["fallback_matches"] == 15 - len(committed) > 0
+    placed = {(match["team1_id"], match["team2_id"]): (match["slot_index"], match["venue_index"])
+              for match in result["schedule"]}
+    for (t1, t2), position in committed:
+        assert placed[(scheduler.teams[t1].id, scheduler.teams[t2].id)] == tuple(position)
@@ -0,0 +1,125 @@
+import pytest
+import redis
+from app.models import SchedulingConstraint
+from app.services.schedule_cache import InMemoryScheduleCache, RedisScheduleCache
+from app.services.scheduler import generate_tournament_schedule
+from app.schemas.schemas import ScheduleGenerateRequest
+from tests.test_scheduler import _create_tournament
+
+
+class FakeRedis:
+    """The handful of Redis commands RedisScheduleCache uses, kept in dicts."""
+
+    def __init__(self):
+        self.values = {}
+        self.sorted_sets = {}
+
+    def get(self, key):
+        value = self.values.get(key)
+        return value.encode() if isinstance(value, str) else value
+
+    def set(self, key, value):
+        self.values[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.sorted_sets.pop(key, None)
+
+    def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+    def zadd(self, key, mapping):
+        self.sorted_sets.setdefault(key, {}).update(mapping)
+
+    def zcard(self, key):
+        return len(self.sorted_sets.get(key, {}))
+
+    def zpopmin(self, key, count):
+        members = sorted(self.sorted_sets.get(key, {}).items(), key=lambda item: item[1])[:count]
+        for member, _ in members:
+            del self.sorted_sets[key][member]
+        return [(member.encode(), score) for member, score in members]
+
+    def zrange(self, key, start, end):
+        members = sorted(self.sorted_sets.get(key, {}).items(), key=lambda item: item[1])
+        return [member.encode() for member, _ in members]
+
+
+class UnreachableRedis(FakeRedis):
+    def get(self, key):
+        raise redis.ConnectionError("Connection refused")
+
+    def set(self, key, value):
+        raise redis.ConnectionError("Connection refused")
+
+
+def test_unchanged_inputs_reuse_cached_schedule(db, fresh_schedule_cache):
+    tournament = _create_tournament(db, num_teams=6, num_venues=2)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine="interval", objective="last_slot")
+
+    first = generate_tournament_schedule(db, str(tournament.id), request)
+    second = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert first["cache_hit"] is False and second["cache_hit"] is True
+    assert len(fresh_schedule_cache) == 1
+    assert second["objective_value"] == first["objective_value"]
+    assert second["solver_stats"] == first["solver_stats"]
+    assert [(m["team1_id"], m["venue_id"], m["scheduled_start"]) for m in second["schedule"]] == \
+        [(m["team1_id"], m["venue_id"], m["scheduled_start"]) for m in first["schedule"]]
+
+
+@pytest.mark.parametrize("change", ["rest", "constraint", "option"])
+def test_changed_inputs_miss_the_cache(db, change):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine="interval")
+    assert generate_tournament_schedule(db, str(tournament.id), request)["cache_hit"] is False
+
+    if change == "rest":
+        tournament.min_rest_hours += 8
+        db.commit()
+    elif change == "constraint":
+        db.add(SchedulingConstraint(tournament_id=tournament.id, constraint_type="time_slot", priority=3,
+                                    parameters={"start_hour": 9, "end_hour": 22}))
+        db.commit()
+    else:
+        request = ScheduleGenerateRequest(tournament_id=tournament.id, engine="interval", objective="last_slot")
+
+    assert generate_tournament_schedule(db, str(tournament.id), request)["cache_hit"] is False
+
+
+def test_incremental_solves_bypass_the_cache(db, fresh_schedule_cache):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine="interval", incremental=True)
+
+    generate_tournament_schedule(db, str(tournament.id), request)
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    assert result["cache_hit"] is False
+    assert len(fresh_schedule_cache) == 0
+
+
+@pytest.mark.parametrize("make_cache", [
+    lambda: InMemoryScheduleCache(max_entries=2),
+    lambda: RedisScheduleCache(FakeRedis(), max_entries=2),
+])
+def test_cache_evicts_least_recently_used(make_cache):
+    cache = make_cache()
+    cache.set("a", {"assignments": [[0, 0]]})
+    cache.set("b", {"assignments": [[1, 0]]})
+    assert cache.get("a") == {"assignments": [[0, 0]]}  # "b" is now the least recently used
+
+    cache.set("c", {"assignments": [[2, 0]]})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_unreachable_redis_is_a_cache_miss():
+    cache = RedisScheduleCache(UnreachableRedis())
+
+    cache.set("a", {"assignments": []})
+
+    assert cache.get("a") is None
@@ -1,7 +1,10 @@
 import pytest
 from datetime import datetime, timedelta
-from app.models import Tournament, Team, Venue, TournamentFormat
-from app.services.scheduler import generate_tournament_schedule
+from app.core.config import settings
+from app.models import Tournament, Team, Venue, Match, MatchStatus, TournamentFormat
+from app.services.cancellation import CancellationToken
+from app.services.scheduler import CricketScheduler, generate_tournament_schedule
+from app.schemas.schemas import ScheduleGenerateRequest, SolverProfile
 
 def test_scheduler_ai_logic(db):
     # 1. Setup Data
@@ -58,3 +61,254 @@ def test_scheduler_ai_logic(db):
     # Verify strict constraints (simplified check)
     # E.g. check if any team plays twice in same slot (impossible if success is True due to OR-Tools)
     
+
+
+def _create_tournament(db, num_teams=4, num_venues=2, days=30, tournament_format=TournamentFormat.ROUND_ROBIN, **kwargs):
+    tournament = Tournament(
+        name="Test Tournament",
+        format=tournament_format,
+        start_date=datetime(2030, 1, 1),
+        end_date=datetime(2030, 1, 1) + timedelta(days=days),
+        match_duration_hours=kwargs.pop("match_duration_hours", 4),
+        min_rest_hours=kwargs.pop("min_rest_hours", 24),
+        slots_per_day=kwargs.pop("slots_per_day", 3),
+        **kwargs
+    )
+    db.add(tournament)
+    db.commit()
+    db.refresh(tournament)
+
+    for i in range(num_venues):
+        db.add(Venue(tournament_id=tournament.id, name=f"Venue {i}", city="Test City", capacity=10000))
+    for i in range(num_teams):
+        db.add(Team(tournament_id=tournament.id, name=f"Team {i}", code=f"T{i}"))
+    db.commit()
+    return tournament
+
+
+def test_interval_engine_schedules_double_round_robin(db):
+    tournament = _create_tournament(db, num_teams=6, num_venues=2, tournament_format=TournamentFormat.DOUBLE_ROUND_ROBIN)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine="interval")
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    assert result["matches_scheduled"] == 30
+    slots = {(m["slot_index"], m["venue_index"]) for m in result["schedule"]}
+    assert len(slots) == 30
+
+
+def test_last_slot_objective_reaches_rest_lower_bound(db):
+    # 3 matches per team with a 7-slot rest window: the last match can be no earlier than slot 14
+    tournament = _create_tournament(db, num_teams=4, num_venues=2)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, objective="last_slot")
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    assert result["status"] == "optimal"
+    assert result["objective_value"] == 14
+    assert max(m["slot_index"] for m in result["schedule"]) == 14
+
+
+def test_rounds_engine_labels_matches_by_round(db):
+    tournament = _create_tournament(db, num_teams=6, num_venues=2, tournament_format=TournamentFormat.LEAGUE)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine="rounds")
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    assert result["matches_scheduled"] == 15
+    rounds = {}
+    for match in result["schedule"]:
+        rounds.setdefault(match["round"], []).append(match["slot_index"])
+    assert len(rounds) == 5
+    # Rounds occupy consecutive slot blocks
+    for r in range(1, 5):
+        assert max(rounds[f"Round {r}"]) <= min(rounds[f"Round {r + 1}"])
+
+
+def test_mirrored_double_round_robin_swaps_home_and_away(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2, days=40,
+                                    tournament_format=TournamentFormat.DOUBLE_ROUND_ROBIN)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine="rounds", mirror_scheme="french")
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    assert result["mirror_scheme"] == "french"
+    # The second leg is derived outside the solver
+    assert result["status"] == "feasible" and result["objective_value"] is None
+    fixtures = {(m["team1_id"], m["team2_id"]) for m in result["schedule"]}
+    assert len(fixtures) == 12
+    assert all((away, home) in fixtures for home, away in fixtures)
+
+
+def test_heuristic_engine_schedules_without_cp_sat(db):
+    tournament = _create_tournament(db, num_teams=12, num_venues=3, days=60)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine="heuristic")
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    assert result["solved_by"] == "local-search"
+    assert result["matches_scheduled"] == 66
+
+
+def test_heuristic_engine_follows_the_configured_seed(db, monkeypatch):
+    monkeypatch.setattr(settings, "SOLVER_RANDOM_SEED", 42)
+    tournament = _create_tournament(db, num_teams=4, num_venues=2)
+
+    configured = generate_tournament_schedule(
+        db, str(tournament.id), ScheduleGenerateRequest(tournament_id=tournament.id, engine="heuristic"))
+    explicit_zero = generate_tournament_schedule(db, str(tournament.id), ScheduleGenerateRequest(
+        tournament_id=tournament.id, engine="heuristic", solver_profile=SolverProfile(random_seed=0)))
+
+    assert configured["solver_stats"]["random_seed"] == 42
+    assert explicit_zero["solver_stats"]["random_seed"] == 0
+
+
+def test_solver_profile_is_applied_and_reported(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2)
+    request = ScheduleGenerateRequest(
+        tournament_id=tournament.id,
+        solver_profile=SolverProfile(num_workers=2, linearization_level=2, random_seed=7, max_time_in_seconds=5)
+    )
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    stats = result["solver_stats"]
+    assert stats["num_workers"] == 2
+    assert stats["linearization_level"] == 2
+    assert stats["random_seed"] == 7
+    assert stats["max_time_in_seconds"] == 5
+    assert stats["wall_time"] <= 5
+
+
+def test_latency_budget_sets_time_and_gap_limits(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, objective="last_slot", latency_budget="fast")
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    assert result["solver_stats"]["max_time_in_seconds"] == 2
+    assert result["solver_stats"]["relative_gap_limit"] == 0.05
+
+
+def test_cancelled_token_discards_schedule(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2)
+    token = CancellationToken("test-solve", str(tournament.id))
+    token.cancel()
+
+    result = generate_tournament_schedule(db, str(tournament.id), cancel_token=token)
+
+    assert result["success"] is False
+    assert result["cancelled"] is True
+    assert db.query(Match).filter(Match.tournament_id == tournament.id).count() == 0
+
+
+def test_warm_start_keeps_published_fixtures(db):
+    tournament = _create_tournament(db, num_teams=6, num_venues=2)
+    first = generate_tournament_schedule(db, str(tournament.id))
+    assert first["success"] is True
+
+    db.add(Venue(tournament_id=tournament.id, name="Extra Venue", city="Test City"))
+    db.commit()
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine="interval", minimize_moves=True)
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    assert result["matches_moved"] == 0
+    assert result["objective_value"] == 0
+
+
+def test_boolean_warm_start_hints_only_each_fixtures_own_cells(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2, days=10)
+    scheduler = CricketScheduler(db, str(tournament.id))
+    match_pairs = scheduler._generate_match_pairs()
+    match_vars = scheduler._build_model(match_pairs)
+
+    scheduler._add_warm_start(match_vars, {0: (0, 0), 1: (0, 1), 2: (-1, 0)})
+
+    hint = scheduler.model.Proto().solution_hint
+    assert len(hint.vars) == len(scheduler.match_cells[0]) + len(scheduler.match_cells[1])
+    assert sorted(hint.vars[i] for i, value in enumerate(hint.values) if value) == sorted(
+        [match_vars[(0, 0, 0)].Index(), match_vars[(1, 0, 1)].Index()])
+
+
+def test_incremental_reschedule_keeps_played_matches(db):
+    tournament = _create_tournament(db, num_teams=6, num_venues=2, tournament_format=TournamentFormat.LEAGUE)
+    first = generate_tournament_schedule(db, str(tournament.id))
+    assert first["success"] is True
+
+    matches = db.query(Match).filter(Match.tournament_id == tournament.id).order_by(Match.scheduled_start).all()
+    played = matches[:4]
+    for match in played:
+        match.status = MatchStatus.COMPLETED
+        match.winner_id = match.team1_id
+    washed_out = matches[4]
+    washed_out.status = MatchStatus.POSTPONED
+    db.commit()
+    played_rows = {match.id: (match.scheduled_start, match.venue_id) for match in played}
+    reschedule_from = washed_out.scheduled_start + timedelta(hours=1)
+
+    request = ScheduleGenerateRequest(
+        tournament_id=tournament.id, engine="interval", incremental=True, reschedule_from=reschedule_from
+    )
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    assert result["matches_frozen"] == 4
+    assert result["matches_scheduled"] == 11
+    assert result["rows_changed"]["inserted"] == 0
+    assert result["rows_changed"]["deleted"] == 0
+    assert all(m["scheduled_start"] >= reschedule_from for m in result["schedule"])
+
+    saved = db.query(Match).filter(Match.tournament_id == tournament.id).all()
+    assert len(saved) == 15
+    for match in saved:
+        if match.id in played_rows:
+            assert match.status == MatchStatus.COMPLETED
+            assert match.winner_id == match.team1_id
+            assert (match.scheduled_start, match.venue_id) == played_rows[match.id]
+        else:
+            assert match.status == MatchStatus.SCHEDULED
+
+
+def test_progress_listener_can_accept_first_solution(db):
+    tournament = _create_tournament(db, num_teams=6, num_venues=2)
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine="interval", objective="last_slot")
+    events = []
+
+    def accept_first(event):
+        events.append(event)
+        return True
+
+    result = generate_tournament_schedule(db, str(tournament.id), request, progress_listener=accept_first)
+
+    assert result["success"] is True
+    assert result["objective_value"] == events[0]["objective"]
+    assert len(events) == 1
+    assert set(events[0]) == {"solutions", "objective", "best_bound", "elapsed"}
+    assert result["solver_stats"]["stopped_early"] is True
+    assert result["solution_log"] == events
+
+
+def test_infeasible_solve_reports_conflicting_constraints(db):
+    # 6 fixtures in 6 slots at one venue, but every team needs a slot off between matches:
+    # passes the pre-solve bounds, infeasible only by parity
+    tournament = _create_tournament(db, num_teams=4, num_venues=1, days=2, min_rest_hours=0)
+
+    result = generate_tournament_schedule(db, str(tournament.id))
+
+    assert result["success"] is False
+    causes = result["infeasibility_causes"]
+    assert "Every fixture has to be played exactly once" in causes
+    assert "Venue 0 hosts at most one match per slot" in causes
+    assert any("sits out 1 slot(s)" in cause for cause in causes)
+    # With a single venue teams can never clash, so that family is not part of the explanation
+    assert "A team cannot play two matches in the same slot" not in causes
+    assert result["conflicts"][:len(causes)] == [f"❌ {cause}" for cause in causes]
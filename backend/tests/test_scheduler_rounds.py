@@ -0,0 +1,37 @@
+import pytest
+from itertools import combinations
+
+from app.services.scheduler_rounds import circle_method_rounds, mirror_round_order
+
+
+@pytest.mark.parametrize("num_teams", [2, 5, 8, 17, 20])
+def test_circle_method_covers_every_pair_once(num_teams):
+    rounds = circle_method_rounds(num_teams)
+
+    assert len(rounds) == (num_teams - 1 if num_teams % 2 == 0 else num_teams)
+
+    played = [frozenset(pair) for fixtures in rounds for pair in fixtures]
+    assert len(played) == len(set(played))
+    assert set(played) == {frozenset(pair) for pair in combinations(range(num_teams), 2)}
+
+
+@pytest.mark.parametrize("num_teams", [6, 7])
+def test_circle_method_rounds_have_no_repeated_team(num_teams):
+    for fixtures in circle_method_rounds(num_teams):
+        teams = [team for pair in fixtures for team in pair]
+        assert len(teams) == len(set(teams))
+        assert len(fixtures) == num_teams // 2
+
+
+@pytest.mark.parametrize("scheme, expected", [
+    ("mirror", [0, 1, 2, 3, 4]),
+    ("french", [1, 2, 3, 4, 0]),
+    ("english", [4, 0, 1, 2, 3]),
+])
+def test_mirror_round_order(scheme, expected):
+    assert mirror_round_order(5, scheme) == expected
+
+
+def test_mirror_round_order_rejects_unknown_scheme():
+    with pytest.raises(ValueError):
+        mirror_round_order(5, "spanish")
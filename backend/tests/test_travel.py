@@ -0,0 +1,75 @@
+import numpy as np
+from app.models import Team, Venue
+from app.services.scheduler import generate_tournament_schedule
+from app.services.travel import TravelTables, haversine_matrix
+from app.schemas.schemas import ScheduleGenerateRequest
+from tests.test_scheduler import _create_tournament
+
+# Mumbai, Chennai, Kolkata
+LATITUDES = [18.9388, 13.0627, 22.5645]
+LONGITUDES = [72.8258, 80.2792, 88.3433]
+
+
+def test_haversine_distances_between_stadiums():
+    distances = haversine_matrix(LATITUDES, LONGITUDES)
+
+    assert np.allclose(distances, distances.T)
+    assert np.allclose(np.diag(distances), 0)
+    assert 1020 < distances[0, 1] < 1050
+    assert 1640 < distances[0, 2] < 1680
+
+
+def test_team_travel_follows_slot_order_from_and_to_base():
+    distances = np.array([[0, 10, 30], [10, 0, 20], [30, 20, 0]])
+    tables = TravelTables(distances, np.array([0, -1]))
+
+    # Team 0 (based at venue 0) plays at venues 2 then 1; team 1 has no base
+    travel = tables.team_travel([(5, 1), (1, 2)], [(0, 1), (0, 1)])
+
+    assert travel.tolist() == [30 + 20 + 10, 20]
+
+
+def _located_tournament(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=3, days=14)
+    venues = db.query(Venue).filter(Venue.tournament_id == tournament.id).all()
+    for venue, latitude, longitude in zip(venues, LATITUDES, LONGITUDES):
+        venue.latitude, venue.longitude = latitude, longitude
+    teams = db.query(Team).filter(Team.tournament_id == tournament.id).all()
+    for team, venue in zip(teams, [venues[0], venues[0], venues[2], venues[2]]):
+        team.home_venue_id = venue.id
+    db.commit()
+    return tournament, teams, venues
+
+
+def _schedule_travel(schedule, teams, venues):
+    """km per team name for a generated schedule: base -> venues by start time -> base."""
+    distances = np.rint(haversine_matrix(LATITUDES, LONGITUDES)).astype(int)
+    venue_index = {str(venue.id): v for v, venue in enumerate(venues)}
+    travel = {}
+    for team in teams:
+        route = [venue_index[str(team.home_venue_id)]]
+        for match in sorted(schedule, key=lambda m: m["scheduled_start"]):
+            if team.name in (match["team1_name"], match["team2_name"]):
+                route.append(venue_index[str(match["venue_id"])])
+        route.append(route[0])
+        travel[team.name] = int(sum(distances[u, v] for u, v in zip(route, route[1:])))
+    return travel
+
+
+def test_minimize_travel_beats_the_balanced_schedule(db):
+    tournament, teams, venues = _located_tournament(db)
+    balanced = generate_tournament_schedule(
+        db, str(tournament.id), ScheduleGenerateRequest(tournament_id=tournament.id)
+    )
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, optimize_for="minimize_travel",
+                                      latency_budget="optimal")
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    assert result["status"] == "optimal"
+    assert result["team_travel_km"] == _schedule_travel(result["schedule"], teams, venues)
+    assert result["travel_km"] == result["objective_value"] == sum(result["team_travel_km"].values())
+    assert result["travel_km"] <= sum(_schedule_travel(balanced["schedule"], teams, venues).values())
+    # Cross fixtures send each side to the other city at least once between them
+    assert result["travel_km"] > 0
@@ -0,0 +1,105 @@
+import pytest
+from datetime import datetime, timedelta
+from fastapi import HTTPException
+from app.api.venues import update_venue
+from app.models import Venue
+from app.services.scheduler import generate_tournament_schedule
+from app.services.venue_availability import venue_slot_mask
+from app.schemas.schemas import ScheduleGenerateRequest, Venue as VenueSchema, VenueUpdate
+from tests.test_scheduler import _create_tournament
+
+# 2030-01-01 is a Tuesday; three slots a day at 10:00, 14:00 and 18:00
+SLOTS = [datetime(2030, 1, 1) + timedelta(days=d, hours=h) for d in range(7) for h in (10, 14, 18)]
+
+
+def _open_slots(rules, duration=4):
+    mask = venue_slot_mask(rules, SLOTS, duration)
+    return [slot for slot, is_open in zip(SLOTS, mask) if is_open]
+
+
+def test_no_rules_leave_every_slot_open():
+    assert _open_slots([]) == SLOTS
+    assert _open_slots(None) == SLOTS
+
+
+def test_rule_fields_are_combined():
+    # Weekend afternoons, and all of Wednesday
+    rules = [{"weekdays": ["sat", 6], "start_hour": 12, "end_hour": 23}, {"date": "2030-01-02"}]
+
+    open_slots = _open_slots(rules)
+
+    assert [slot.strftime("%a %H") for slot in open_slots] == [
+        "Wed 10", "Wed 14", "Wed 18", "Sat 14", "Sat 18", "Sun 14", "Sun 18",
+    ]
+
+
+def test_hour_window_must_fit_the_whole_match():
+    rules = [{"start_hour": 10, "end_hour": 20}]
+
+    assert {slot.hour for slot in _open_slots(rules, duration=4)} == {10, 14}
+    assert {slot.hour for slot in _open_slots(rules, duration=6)} == {10, 14}
+    assert {slot.hour for slot in _open_slots(rules, duration=8)} == {10}
+
+
+def test_blackout_rules_close_slots():
+    rules = [{"start_date": "2030-01-03", "end_date": "2030-01-04", "available": False}]
+
+    open_slots = _open_slots(rules)
+
+    assert len(open_slots) == 15
+    assert all(slot.day not in (3, 4) for slot in open_slots)
+
+
+@pytest.mark.parametrize("rules, message", [
+    ([{"weekday": [1]}], "Unknown venue availability field"),
+    ([{"weekdays": ["funday"]}], "Invalid weekday"),
+    ([{"date": "01/05/2030"}], "Invalid date"),
+    ([{"start_hour": 18, "end_hour": 10}], "end_hour must be after start_hour"),
+    (["weekends"], "must be objects"),
+])
+def test_malformed_rules_are_rejected(rules, message):
+    with pytest.raises(ValueError, match=message):
+        venue_slot_mask(rules, SLOTS, 4)
+
+
+@pytest.mark.parametrize("engine", [None, "interval", "heuristic"])
+def test_schedule_respects_venue_availability(db, engine):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2, days=14)
+    weekend_ground, booked_ground = db.query(Venue).filter(Venue.tournament_id == tournament.id).all()
+    weekend_ground.available_slots = [{"weekdays": ["sat", "sun"]}]
+    booked_ground.available_slots = [{"start_date": "2030-01-01", "end_date": "2030-01-06", "available": False}]
+    db.commit()
+    request = ScheduleGenerateRequest(tournament_id=tournament.id, engine=engine)
+
+    result = generate_tournament_schedule(db, str(tournament.id), request)
+
+    assert result["success"] is True
+    assert result["matches_scheduled"] == 6
+    for match in result["schedule"]:
+        if str(match["venue_id"]) == str(weekend_ground.id):
+            assert match["scheduled_start"].weekday() >= 5
+        else:
+            assert match["scheduled_start"].date() > datetime(2030, 1, 6).date()
+
+
+def test_invalid_rules_are_refused_on_update(db):
+    tournament = _create_tournament(db, num_teams=2, num_venues=1)
+    venue = db.query(Venue).filter(Venue.tournament_id == tournament.id).first()
+
+    with pytest.raises(HTTPException) as error:
+        update_venue(venue.id, VenueUpdate(available_slots=[{"weekday": [1]}]), db=db, current_user=None)
+
+    assert error.value.status_code == 422
+
+
+def test_legacy_rules_are_read_back_and_ignored_by_the_scheduler(db):
+    tournament = _create_tournament(db, num_teams=4, num_venues=2, days=14)
+    legacy_ground = db.query(Venue).filter(Venue.tournament_id == tournament.id).first()
+    legacy_ground.available_slots = [{"day": "Saturday", "time": "morning"}, "weekends"]
+    db.commit()
+
+    assert VenueSchema.model_validate(legacy_ground).available_slots == legacy_ground.available_slots
+    result = generate_tournament_schedule(db, str(tournament.id), ScheduleGenerateRequest(tournament_id=tournament.id))
+
+    assert result["success"] is True
+    assert result["matches_scheduled"] == 6
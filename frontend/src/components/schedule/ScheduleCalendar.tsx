@@ -17,8 +17,8 @@ export function ScheduleCalendar({ matches }: ScheduleCalendarProps) {
   const [selectedMatch, setSelectedMatch] = useState<Match | null>(null);
 
   const events = matches.map((match) => {
-    let title = `${match.team1?.code || 'T1'} vs ${match.team2?.code || 'T2'}`;
-    if (!match.team1 && !match.team2) title = `Match #${match.match_number}`;
+    let title = `${match.team1?.code || match.team1_placeholder || 'T1'} vs ${match.team2?.code || match.team2_placeholder || 'T2'}`;
+    if (!match.team1 && !match.team2) title = match.round || `Match #${match.match_number}`;
 
     // Color coding based on venue (simple hash)
     const venueColors = ['#3b82f6', '#10b981', '#f59e0b', '#8b5cf6', '#ec4899', '#6366f1'];
@@ -82,7 +82,7 @@ export function ScheduleCalendar({ matches }: ScheduleCalendarProps) {
                 <div className="w-16 h-16 mx-auto bg-blue-100 rounded-full flex items-center justify-center text-blue-700 font-bold text-xl mb-2">
                   {selectedMatch.team1?.code}
                 </div>
-                <h3 className="font-bold text-gray-900">{selectedMatch.team1?.name}</h3>
+                <h3 className="font-bold text-gray-900">{selectedMatch.team1?.name ?? selectedMatch.team1_placeholder}</h3>
               </div>
               
               <div className="px-4 text-center">
@@ -93,7 +93,7 @@ export function ScheduleCalendar({ matches }: ScheduleCalendarProps) {
                 <div className="w-16 h-16 mx-auto bg-red-100 rounded-full flex items-center justify-center text-red-700 font-bold text-xl mb-2">
                   {selectedMatch.team2?.code}
                 </div>
-                <h3 className="font-bold text-gray-900">{selectedMatch.team2?.name}</h3>
+                <h3 className="font-bold text-gray-900">{selectedMatch.team2?.name ?? selectedMatch.team2_placeholder}</h3>
               </div>
             </div>
 
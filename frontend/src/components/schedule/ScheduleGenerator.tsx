@@ -23,7 +23,7 @@ export function ScheduleGenerator({
   hasMatches,
   tournament
 }: ScheduleGeneratorProps) {
-  const { mutate, isPending } = useScheduleGenerator(tournamentId);
+  const { mutate, isPending, progress, acceptCurrentBest, cancelGeneration } = useScheduleGenerator(tournamentId);
   const [showConfirmModal, setShowConfirmModal] = useState(false);
   const [restHours, setRestHours] = useState(tournament?.min_rest_hours || 24);
   const queryClient = useQueryClient();
@@ -275,6 +275,26 @@ export function ScheduleGenerator({
           </button>
         </div>
 
+        {/* Live solver progress: each improving schedule the solver finds */}
+        {isPending && progress?.solutions ? (
+          <div className="mt-4 flex flex-col items-center gap-2 text-sm text-gray-600">
+            <p>
+              {progress.solutions} schedule{progress.solutions === 1 ? '' : 's'} found
+              {progress.objective != null && <> · best {progress.objective} (bound {progress.best_bound})</>}
+              {' '}· {progress.elapsed?.toFixed(1)}s
+            </p>
+            <Button variant="secondary" onClick={acceptCurrentBest}>
+              Accept current best
+            </Button>
+          </div>
+        ) : null}
+
+        {isPending && (
+          <Button variant="ghost" className="mt-2" onClick={cancelGeneration}>
+            Cancel
+          </Button>
+        )}
+
         {hasMatches && (
           <p className="mt-4 text-xs text-orange-600 flex items-center bg-orange-50 px-3 py-1 rounded-full border border-orange-100">
             <AlertTriangle className="w-3 h-3 mr-1" />
@@ -99,7 +99,7 @@ export function ScheduleView({
                                     <td className="px-4 py-3 font-medium text-gray-900">{match.match_number}</td>
                                     <td className="px-4 py-3">{new Date(match.scheduled_start).toLocaleDateString()}</td>
                                     <td className="px-4 py-3">
-                                        <span className="font-semibold text-gray-900">{match.team1?.code}</span> vs <span className="font-semibold text-gray-900">{match.team2?.code}</span>
+                                        <span className="font-semibold text-gray-900">{match.team1?.code ?? match.team1_placeholder}</span> vs <span className="font-semibold text-gray-900">{match.team2?.code ?? match.team2_placeholder}</span>
                                     </td>
                                     <td className="px-4 py-3">{match.venue?.name}</td>
                                     <td className="px-4 py-3">{new Date(match.scheduled_start).toLocaleTimeString([], {hour: '2-digit', minute:'2-digit'})}</td>
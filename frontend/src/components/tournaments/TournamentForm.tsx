@@ -9,7 +9,7 @@ import { useNavigate } from 'react-router-dom';
 const tournamentSchema = z.object({
   name: z.string().min(3, 'Name must be at least 3 characters'),
   description: z.string().optional(),
-  format: z.enum(['round_robin', 'knockout', 'double_round_robin', 'league']),
+  format: z.enum(['round_robin', 'knockout', 'double_round_robin', 'league', 'groups']),
   start_date: z.string().min(1, 'Start date is required'),
   end_date: z.string().min(1, 'End date is required'),
   match_duration_hours: z.coerce.number().min(1).max(12),
@@ -100,6 +100,7 @@ export function TournamentForm({ initialData, onSubmit, isLoading, isEdit }: Tou
             <option value="knockout">Knockout</option>
             <option value="double_round_robin">Double Round Robin</option>
             <option value="league">League</option>
+            <option value="groups">Group Stage</option>
           </select>
           {errors.format && <p className="mt-1 text-xs text-danger-500">{errors.format.message}</p>}
         </div>
@@ -1,6 +1,8 @@
+import { useState } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { tournamentService } from '@/services/tournamentService';
 import { toast } from 'sonner';
+import type { ScheduleJobProgress } from '@/types';
 
 export function useMatches(tournamentId: string) {
   return useQuery({
@@ -12,12 +14,18 @@ export function useMatches(tournamentId: string) {
 
 export function useScheduleGenerator(tournamentId: string) {
   const queryClient = useQueryClient();
+  const [jobId, setJobId] = useState<string | null>(null);
+  const [progress, setProgress] = useState<ScheduleJobProgress | null>(null);
   
-  return useMutation({
+  const mutation = useMutation({
     mutationFn: async () => {
       const start = Date.now();
       console.log(`[SCHEDULE] Generating schedule for tournament ${tournamentId}...`);
-      const result = await tournamentService.generateSchedule(tournamentId);
+      setProgress(null);
+      const result = await tournamentService.generateSchedule(tournamentId, {
+        onQueued: (job) => setJobId(job.id),
+        onProgress: setProgress,
+      });
       const duration = ((Date.now() - start) / 1000).toFixed(1);
       console.log(`[SCHEDULE] Generation completed in ${duration}s:`, result);
       return { ...result, duration };
@@ -30,9 +38,32 @@ export function useScheduleGenerator(tournamentId: string) {
       // Only toast on manual success handling in component usually, but here is fine too or specific component handled
     },
     onError: (error: any) => {
-      toast.error(error.response?.data?.detail || 'Failed to generate schedule');
+      toast.error(error.response?.data?.detail || error.message || 'Failed to generate schedule');
     },
+    onSettled: () => setJobId(null),
   });
+  
+  // Stop the solver and keep the best schedule found so far
+  const acceptCurrentBest = async () => {
+    if (!jobId) return;
+    try {
+      await tournamentService.acceptScheduleJob(jobId);
+    } catch (error: any) {
+      toast.error(error.response?.data?.detail || 'Could not stop the solver');
+    }
+  };
+  
+  // Stop the solver and keep the current schedule
+  const cancelGeneration = async () => {
+    if (!jobId) return;
+    try {
+      await tournamentService.cancelScheduleJob(jobId);
+    } catch (error: any) {
+      toast.error(error.response?.data?.detail || 'Could not cancel schedule generation');
+    }
+  };
+  
+  return { ...mutation, progress, acceptCurrentBest, cancelGeneration };
 }
 
 export function useClearSchedule(tournamentId: string) {
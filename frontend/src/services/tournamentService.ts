@@ -6,6 +6,8 @@ import type {
   TeamCreate, 
   VenueCreate,
   ScheduleGenerateResponse,
+  ScheduleJob,
+  ScheduleJobProgress,
   Match
 } from '@/types';
 
@@ -59,8 +61,76 @@ export const tournamentService = {
   },
   
   // 🤖 AI SCHEDULING
-  generateSchedule: async (id: string) => {
-    const { data } = await api.post<ScheduleGenerateResponse>(`/tournaments/${id}/generate-schedule`);
+  // The solve runs as a background job: enqueue it, then follow its progress stream until it finishes
+  generateSchedule: async (
+    id: string,
+    handlers: { onQueued?: (job: ScheduleJob) => void; onProgress?: (progress: ScheduleJobProgress) => void } = {}
+  ): Promise<ScheduleGenerateResponse> => {
+    const { data: queued } = await api.post<ScheduleJob>(`/tournaments/${id}/generate-schedule`);
+    handlers.onQueued?.(queued);
+    // Generating is admin-only, so the stream may cancel the job if the page is closed mid-solve
+    const job = await tournamentService.streamScheduleJob(queued.id, handlers.onProgress, true);
+    if (job.status === 'cancelled') {
+      throw new Error('Schedule generation cancelled');
+    }
+    if (job.status === 'failed' || !job.result) {
+      throw new Error(job.error || 'Schedule generation failed');
+    }
+    return job.result;
+  },
+
+  getScheduleJob: async (jobId: string) => {
+    const { data } = await api.get<ScheduleJob>(`/tournaments/jobs/${jobId}`);
+    return data;
+  },
+
+  // Server-Sent Events over fetch, since EventSource cannot send the Authorization header.
+  // With cancelOnDisconnect (admins only), dropping the connection cancels the job.
+  streamScheduleJob: async (
+    jobId: string,
+    onProgress?: (progress: ScheduleJobProgress) => void,
+    cancelOnDisconnect = false
+  ): Promise<ScheduleJob> => {
+    const token = localStorage.getItem('token');
+    const query = cancelOnDisconnect ? '?cancel_on_disconnect=true' : '';
+    const response = await fetch(`${api.defaults.baseURL}/tournaments/jobs/${jobId}/events${query}`, {
+      headers: token ? { Authorization: `Bearer ${token}` } : {},
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`Could not follow schedule job (${response.status})`);
+    }
+
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = '';
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += value;
+
+      let boundary;
+      while ((boundary = buffer.indexOf('\n\n')) >= 0) {
+        const message = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+        const event = /^event: (.*)$/m.exec(message)?.[1];
+        const data = /^data: (.*)$/m.exec(message)?.[1];
+        if (!data) continue;
+        if (event === 'done') return JSON.parse(data) as ScheduleJob;
+        onProgress?.(JSON.parse(data) as ScheduleJobProgress);
+      }
+    }
+    // Stream dropped (e.g. a proxy timeout): fall back to the job's current state
+    return tournamentService.getScheduleJob(jobId);
+  },
+
+  // Keep the best schedule found so far and stop the solver
+  acceptScheduleJob: async (jobId: string) => {
+    const { data } = await api.post<ScheduleJob>(`/tournaments/jobs/${jobId}/accept`);
+    return data;
+  },
+
+  // Stop the solver and discard its result
+  cancelScheduleJob: async (jobId: string) => {
+    const { data } = await api.delete<ScheduleJob>(`/tournaments/jobs/${jobId}`);
     return data;
   },
   
@@ -2,7 +2,8 @@ export type TournamentFormat =
   | 'round_robin' 
   | 'knockout' 
   | 'double_round_robin' 
-  | 'league';
+  | 'league'
+  | 'groups';
 
 export type TournamentStatus = 
   | 'draft' 
@@ -84,8 +85,13 @@ export interface VenueCreate {
 export interface Match {
   id: string;
   tournament_id: string;
-  team1_id: string;
-  team2_id: string;
+  team1_id?: string;
+  team2_id?: string;
+  // Knockout bracket sides still to be decided, e.g. "Winner of Quarter Final 1"
+  team1_source_match_id?: string;
+  team2_source_match_id?: string;
+  team1_placeholder?: string;
+  team2_placeholder?: string;
   venue_id: string;
   scheduled_start: string;
   scheduled_end: string;
@@ -123,3 +129,25 @@ export interface ScheduleGenerateResponse {
     days_used?: number;
   };
 }
+
+export interface ScheduleJobProgress {
+  phase: 'queued' | 'solving' | 'finished';
+  solutions?: number;
+  objective?: number | null;
+  best_bound?: number | null;
+  elapsed?: number;
+}
+
+export interface ScheduleJob {
+  id: string;
+  tournament_id: string;
+  status: 'queued' | 'running' | 'completed' | 'failed' | 'cancelled';
+  progress: ScheduleJobProgress;
+  stop_requested: boolean;
+  cancel_requested: boolean;
+  result?: ScheduleGenerateResponse | null;
+  error?: string | null;
+  created_at: string;
+  started_at?: string | null;
+  finished_at?: string | null;
+}
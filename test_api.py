@@ -5,6 +5,7 @@ Run this after starting the backend to test the AI scheduling
 
 import requests
 import json
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
@@ -125,11 +126,21 @@ def test_tournament_scheduler():
     )
     print_response(response, "Generate AI Schedule")
     
-    if response.status_code != 200:
+    if response.status_code != 202:
         print("❌ Failed to generate schedule")
         return
     
-    schedule_result = response.json()
+    # The solve runs as a background job; poll it until it finishes
+    job = response.json()
+    while job["status"] in ("queued", "running"):
+        time.sleep(1)
+        job = requests.get(f"{BASE_URL}/tournaments/jobs/{job['id']}").json()
+    
+    if job["status"] != "completed":
+        print(f"❌ Schedule job failed: {job['error']}")
+        return
+    
+    schedule_result = job["result"]
     print(f"\n✅ Schedule Generation Result:")
     print(f"   Success: {schedule_result['success']}")
     print(f"   Matches Scheduled: {schedule_result['matches_scheduled']}")